@@ -0,0 +1,12 @@
+"""
+Performance benchmarks for easytree
+
+Benchmarks are written in the style of `asv <https://asv.readthedocs.io>`_:
+each module defines classes whose :code:`time_*` methods are timed after
+calling :code:`setup` (and before calling :code:`teardown`) with each of the
+class :code:`params`, if any.
+
+Run the suite from the root of the repository with
+
+    python -m benchmarks
+"""
@@ -0,0 +1,132 @@
+import argparse
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import platform
+import statistics
+import sys
+import timeit
+
+import benchmarks
+import easytree
+
+
+def discover(pattern=None):
+    """
+    Yield the (name, class, method, params) of each benchmark in the suite
+    """
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("_"):
+            continue
+        mod = importlib.import_module(f"benchmarks.{module.name}")
+        for clsname, cls in inspect.getmembers(mod, inspect.isclass):
+            if cls.__module__ != mod.__name__:
+                continue
+            params = getattr(cls, "params", [None])
+            if params and not isinstance(params[0], (list, tuple)):
+                params = [params]
+            for method in sorted(m for m in dir(cls) if m.startswith("time_")):
+                for combination in itertools.product(*params):
+                    name = f"{module.name}.{clsname}.{method}"
+                    if combination != (None,):
+                        name += f"({', '.join(map(repr, combination))})"
+                    if pattern is None or pattern in name:
+                        yield name, cls, method, combination
+
+
+def measure(cls, method, params, repeat):
+    """
+    Time a single benchmark, returning the time per call in seconds
+    """
+    instance = cls()
+    args = () if params == (None,) else params
+    if hasattr(instance, "setup"):
+        instance.setup(*args)
+    try:
+        func = getattr(instance, method)
+        timer = timeit.Timer(lambda: func(*args))
+        number, _ = timer.autorange()
+        timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*args)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def metadata():
+    """
+    Returns the environment in which the benchmarks are run
+    """
+    return {
+        "easytree": easytree.__version__,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the ratio of each result to its baseline, returning the regressions
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["min"] / baseline[name]["min"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "regression"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = "improvement"
+        print(f"{name:<60} {ratio:>8.2f}x {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", help="only run benchmarks matching this")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="write results to this json file")
+    parser.add_argument("-c", "--compare", help="compare to a previous json file")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, cls, method, params in discover(args.filter):
+        results[name] = measure(cls, method, params, args.repeat)
+        print(f"{name:<60} {results[name]['min'] * 1e6:>12.3f} us")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": metadata(), "results": results}, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        print()
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
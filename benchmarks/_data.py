@@ -0,0 +1,28 @@
+import collections
+
+
+def record(i):
+    """
+    Returns a small, nested record
+    """
+    return {
+        "id": i,
+        "name": f"user-{i}",
+        "active": i % 2 == 0,
+        "address": {"city": "London", "country": "United Kingdom"},
+        "tags": ["a", "b", "c"],
+    }
+
+
+def records(n=1000):
+    """
+    Returns a list of records
+    """
+    return [record(i) for i in range(n)]
+
+
+def recursivedict():
+    """
+    Returns a recursive defaultdict (see docs/contents/comparison.rst)
+    """
+    return collections.defaultdict(recursivedict)
@@ -0,0 +1,92 @@
+import collections
+import easytree
+
+
+class BuiltinAccess:
+    """
+    Read existing keys of builtin dicts, for comparison
+    """
+
+    def setup(self):
+        self.dict = {"a": {"b": {"c": 1}}}
+        self.defaultdict = collections.defaultdict(dict, self.dict)
+
+    def time_dict(self):
+        self.dict["a"]["b"]["c"]
+
+    def time_defaultdict(self):
+        self.defaultdict["a"]["b"]["c"]
+
+
+class DotAccess:
+    """
+    Read existing keys with the dot notation and with item access
+    """
+
+    params = [False, True]
+    param_names = ["fastaccess"]
+
+    def setup(self, fastaccess):
+        self.previous = easytree.fastaccess(fastaccess)
+        self.tree = easytree.dict({"a": {"b": {"c": 1}}})
+
+    def teardown(self, fastaccess):
+        easytree.fastaccess(self.previous)
+
+    def time_dot(self, fastaccess):
+        self.tree.a.b.c
+
+    def time_item(self, fastaccess):
+        self.tree["a"]["b"]["c"]
+
+    def time_method(self, fastaccess):
+        self.tree.keys
+
+
+class MissingAccess:
+    """
+    Read missing keys, which return :code:`undefined` nodes
+    """
+
+    params = [False, True]
+    param_names = ["fastaccess"]
+
+    def setup(self, fastaccess):
+        self.previous = easytree.fastaccess(fastaccess)
+        self.tree = easytree.dict({"a": 1})
+
+    def teardown(self, fastaccess):
+        easytree.fastaccess(self.previous)
+
+    def time_dot(self, fastaccess):
+        self.tree.b
+
+    def time_item(self, fastaccess):
+        self.tree["b"]
+
+
+class SealedAccess:
+    """
+    Read existing keys of sealed trees and compiled records
+    """
+
+    params = [False, True]
+    param_names = ["fastaccess"]
+
+    def setup(self, fastaccess):
+        self.previous = easytree.fastaccess(fastaccess)
+        value = {"a": {"b": {"c": 1}}}
+        self.tree = easytree.dict(value, sealed=True)
+        self.record = easytree.compile_schema(value)(value)
+
+    def teardown(self, fastaccess):
+        easytree.fastaccess(self.previous)
+
+    def time_dot(self, fastaccess):
+        self.tree.a.b.c
+
+    def time_item(self, fastaccess):
+        self.tree["a"]["b"]["c"]
+
+    def time_record(self, fastaccess):
+        self.record.a.b.c
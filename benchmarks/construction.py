@@ -0,0 +1,50 @@
+import easytree
+import easytree.types
+import json
+
+from benchmarks._data import records
+
+
+class Construction:
+    """
+    Build trees from builtin values
+    """
+
+    def setup(self):
+        self.records = records(1000)
+        self.record = self.records[0]
+        self.records_json = json.dumps(self.records)
+        self.record_json = json.dumps(self.record)
+
+    def time_dict(self):
+        easytree.dict(self.record)
+
+    def time_list(self):
+        easytree.list(self.records)
+
+    # builtin trees of the same payload, built by the json decoder (rather than
+    # copied with copy.deepcopy, which is much slower than building them)
+    def time_builtin_dict(self):
+        json.loads(self.record_json)
+
+    def time_builtin_list(self):
+        json.loads(self.records_json)
+
+
+class Cast:
+    """
+    Cast builtin and easytree values
+    """
+
+    params = [False, True]
+    param_names = ["frozen"]
+
+    def setup(self, frozen):
+        self.records = records(1000)
+        self.tree = easytree.list(self.records)
+
+    def time_cast_builtin(self, frozen):
+        easytree.types.cast(self.records, frozen=frozen)
+
+    def time_cast_easytree(self, frozen):
+        easytree.types.cast(self.tree, frozen=frozen)
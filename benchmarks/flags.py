@@ -0,0 +1,26 @@
+import easytree
+
+from benchmarks._data import records
+
+
+class Flags:
+    """
+    Freeze, seal, unfreeze and unseal trees
+    """
+
+    def setup(self):
+        self.tree = easytree.list(records(1000))
+        self.frozen = easytree.freeze(self.tree)
+        self.sealed = easytree.seal(self.tree)
+
+    def time_freeze(self):
+        easytree.freeze(self.tree)
+
+    def time_unfreeze(self):
+        easytree.unfreeze(self.frozen)
+
+    def time_seal(self):
+        easytree.seal(self.tree)
+
+    def time_unseal(self):
+        easytree.unseal(self.sealed)
@@ -0,0 +1,50 @@
+import json
+import os
+import tempfile
+
+import easytree
+
+from benchmarks._data import records
+
+
+class LoadJsonl:
+    """
+    Load a JSON Lines file (of about 5 MB), in a single process or in parallel
+    """
+
+    params = [1, 2, 4]
+    param_names = ["workers"]
+
+    def setup(self, workers):
+        descriptor, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(descriptor, "w") as file:
+            for record in records(40000):
+                file.write(json.dumps(record) + "\n")
+
+    def teardown(self, workers):
+        os.remove(self.path)
+
+    def time_load_jsonl(self, workers):
+        easytree.load_jsonl(self.path, workers=workers)
+
+
+class RebuildJsonl:
+    """
+    Costs of the steps of a parallel load of a JSON Lines file: parsing and
+    casting the lines (in the workers), and rebuilding the records from their
+    binary serialization (in the parent process)
+    """
+
+    def setup(self):
+        self.lines = [json.dumps(record) for record in records(40000)]
+        self.records = [json.loads(line) for line in self.lines]
+        self.binary = easytree.dumpb(easytree.list(self.records))
+
+    def time_parse(self):
+        [json.loads(line) for line in self.lines]
+
+    def time_cast(self):
+        easytree.list(self.records)
+
+    def time_rebuild(self):
+        easytree.loadb(self.binary)
@@ -0,0 +1,42 @@
+import json
+import pickle
+import easytree
+
+from benchmarks._data import records
+
+
+class Serialization:
+    """
+    Serialize and deserialize trees
+    """
+
+    params = ["builtin", "easytree"]
+    param_names = ["type"]
+
+    def setup(self, type):
+        self.tree = records(1000)
+        if type == "easytree":
+            self.tree = easytree.list(self.tree)
+        self.json = json.dumps(self.tree)
+        self.pickle = pickle.dumps(self.tree)
+        self.binary = easytree.dumpb(self.tree)
+
+    def time_json_dumps(self, type):
+        json.dumps(self.tree)
+
+    def time_json_loads(self, type):
+        tree = json.loads(self.json)
+        if type == "easytree":
+            easytree.list(tree)
+
+    def time_pickle_dumps(self, type):
+        pickle.dumps(self.tree)
+
+    def time_pickle_loads(self, type):
+        pickle.loads(self.pickle)
+
+    def time_dumpb(self, type):
+        easytree.dumpb(self.tree)
+
+    def time_loadb(self, type):
+        easytree.loadb(self.binary)
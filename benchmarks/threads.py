@@ -0,0 +1,31 @@
+import concurrent.futures
+import easytree
+
+
+class Writes:
+    """
+    Write to a shared tree from several threads, through undefined nodes
+
+    On free-threaded builds of CPython, easytree.dict nodes may lose writes
+    (see easytree.threadsafe), but are timed for comparison.
+    """
+
+    params = [[1, 2, 4, 8, 16], ["easytree", "threadsafe"]]
+    param_names = ["threads", "type"]
+
+    def setup(self, threads, type):
+        self.executor = concurrent.futures.ThreadPoolExecutor(threads)
+        self.type = easytree.dict if type == "easytree" else easytree.threadsafe.dict
+
+    def teardown(self, threads, type):
+        self.executor.shutdown()
+
+    def write(self, tree, thread):
+        for i in range(1000):
+            tree[f"node{i % 100}"][f"thread{thread}"] = i
+
+    def time_writes(self, threads, type):
+        tree = self.type()
+        futures = [self.executor.submit(self.write, tree, i) for i in range(threads)]
+        for future in futures:
+            future.result()
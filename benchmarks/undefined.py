@@ -0,0 +1,44 @@
+import easytree
+
+from benchmarks._data import recursivedict
+
+
+class Vivification:
+    """
+    Write deeply nested values through undefined nodes
+    """
+
+    def time_easytree_dot(self):
+        tree = easytree.dict()
+        tree.a.b.c.d = 1
+
+    def time_easytree_item(self):
+        tree = easytree.dict()
+        tree["a"]["b"]["c"]["d"] = 1
+
+    def time_easytree_append(self):
+        tree = easytree.dict()
+        tree.a.b.c.append(1)
+
+    def time_defaultdict(self):
+        tree = recursivedict()
+        tree["a"]["b"]["c"]["d"] = 1
+
+
+class Probing:
+    """
+    Read deeply nested missing values, without writing
+    """
+
+    def setup(self):
+        self.tree = easytree.dict()
+        self.defaultdict = recursivedict()
+
+    def time_easytree(self):
+        self.tree.a.b.c.d
+
+    def time_easytree_get(self):
+        self.tree.get(["a", "b", "c", "d"])
+
+    def time_defaultdict(self):
+        self.defaultdict["a"]["b"]["c"]["d"]
@@ -7,18 +7,63 @@ from easytree.utils import (
     seal,
     unseal,
     sealed,
+    stats,
+    to_builtin,
 )
 
-from easytree.types import dict, list, undefined
+from easytree.types import dict, list, undefined, fastaccess
+from easytree.computing import computed
+from easytree.records import compile_schema
+from easytree.versioned import Versioned
+from easytree.shared import share
+from easytree.packed import mmap_dump, mmap_open
+from easytree.codec import dumpb, loadb
+from easytree.interning import Interner
+from easytree.jsonl import load_jsonl, iter_jsonl
+from easytree.aio import acast, aload
+from easytree.views import view, overlay
+from easytree.schemas import Schema, SchemaError
+from easytree.converters import Converters
+from easytree.objects import to_object, from_object
+from easytree.templates import Template, placeholder, template
+from easytree import instrumentation, threadsafe
 
 __all__ = [
+    "Converters",
+    "Interner",
+    "Schema",
+    "SchemaError",
+    "Template",
+    "Versioned",
+    "acast",
+    "aload",
+    "compile_schema",
+    "computed",
     "dict",
+    "dumpb",
+    "fastaccess",
     "freeze",
+    "from_object",
+    "instrumentation",
+    "iter_jsonl",
     "frozen",
     "list",
+    "load_jsonl",
+    "loadb",
+    "mmap_dump",
+    "mmap_open",
+    "overlay",
+    "placeholder",
     "seal",
     "sealed",
+    "share",
+    "stats",
+    "template",
+    "threadsafe",
+    "to_builtin",
+    "to_object",
     "undefined",
     "unfreeze",
     "unseal",
+    "view",
 ]
@@ -0,0 +1,179 @@
+"""
+Cooperative construction and loading of trees, for asyncio event loops
+
+Casting a large payload blocks the event loop for as long as it takes. The
+coroutines of this module build trees incrementally instead, and yield control
+to the event loop every few items, such that other tasks keep being served.
+The value must not be mutated by other tasks while it is being cast.
+"""
+
+import asyncio
+import builtins
+import itertools
+import json
+
+from .interning import interner as _interner
+from .types import cast, dict, list
+
+
+async def acast(
+    value,
+    *,
+    sealed: bool = False,
+    frozen: bool = False,
+    intern=None,
+    every: int = 1000,
+):
+    """
+    Convert a value to an easytree object, like :code:`easytree.types.cast`,
+    yielding control to the event loop every few items
+
+    Parameters
+    ----------
+    value : any
+        the value to cast to an easytree type
+    sealed : bool
+        True if cast object is sealed, False otherwise
+    frozen : bool
+        True if cast object is frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None
+    every : int
+        the number of items (keys and values) to cast between yields to
+        the event loop
+
+    Returns
+    -------
+    cast : any
+        the cast value, or value itself, as the case may be
+
+    Example
+    -------
+    >>> tree = await easytree.acast(payload, frozen=True)
+    """
+    if isinstance(every, bool) or not isinstance(every, int) or every < 1:
+        raise ValueError(f"every must be a positive integer, received {every!r}")
+    if not _walkable(value, sealed, frozen):
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+
+    intern = _interner(intern)
+    state = {"_sealed": sealed, "_frozen": frozen}
+
+    def node(value):
+        cls = dict if isinstance(value, builtins.dict) else list
+        node = cls.__new__(cls)
+        vars(node).update(state)
+        items = iter(value.items() if cls is dict else value)
+        stack.append((items, node))
+        return node
+
+    def child(value):
+        if _walkable(value, sealed, frozen):
+            return node(value)
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+
+    stack = []
+    root = node(value)
+    budget = every
+    while stack:
+        items, target = stack.pop()
+        # at most budget items are cast before yielding, even within a large node
+        chunk = builtins.list(itertools.islice(items, budget))
+        if len(chunk) == budget:
+            stack.append((items, target))  # resumed later, after its children
+        if type(target) is dict:
+            if intern is None:
+                chunk = [(key, child(value)) for key, value in chunk]
+            else:
+                chunk = [(intern.key(k), child(v)) for k, v in chunk]
+            builtins.dict.update(target, chunk)
+        else:
+            builtins.list.extend(target, [child(value) for value in chunk])
+        budget -= len(chunk) or 1
+        if budget <= 0:
+            budget = every
+            await asyncio.sleep(0)
+    return root
+
+
+async def aload(
+    stream,
+    *,
+    sealed: bool = False,
+    frozen: bool = False,
+    intern=None,
+    executor=None,
+    every: int = 1000,
+):
+    """
+    Load a JSON document from an asynchronous stream into a tree, yielding
+    control to the event loop while reading, parsing and casting
+
+    Parameters
+    ----------
+    stream : async iterable, asyncio.StreamReader
+        an asynchronous iterable of bytes (or str) chunks, or an object
+        with a :code:`read` coroutine
+    sealed : bool
+        True if cast object is sealed, False otherwise
+    frozen : bool
+        True if cast object is frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None
+    executor : concurrent.futures.Executor, None, False
+        the executor in which to parse the document, None for the default
+        executor of the event loop, or False to parse it in the event loop
+    every : int
+        the number of items (keys and values) to cast between yields to
+        the event loop
+
+    Returns
+    -------
+    tree : any
+        the tree
+
+    Raises
+    ------
+    ValueError
+        if the stream is not a valid JSON document
+
+    Note
+    ----
+    The JSON parser holds the GIL while parsing, such that parsing in a
+    thread only frees the event loop between reads. Parse very large
+    documents in a :code:`concurrent.futures.ProcessPoolExecutor` to
+    keep the event loop fully responsive.
+
+    Example
+    -------
+    >>> async with session.get(url) as response:
+    ...     tree = await easytree.aload(response.content, frozen=True)
+    """
+    if hasattr(stream, "__aiter__"):
+        chunks = [chunk async for chunk in stream]
+        data = ("" if chunks and isinstance(chunks[0], str) else b"").join(chunks)
+    else:
+        data = await stream.read()
+
+    if executor is False:
+        value = json.loads(data)
+    else:
+        value = await asyncio.get_running_loop().run_in_executor(
+            executor, json.loads, data
+        )
+    return await acast(value, sealed=sealed, frozen=frozen, intern=intern, every=every)
+
+
+def _walkable(value, sealed, frozen):
+    """
+    Returns True if value is a node which acast builds itself, or False
+    if it is a leaf, or a node which is cast as a whole
+    """
+    cls = type(value)
+    if cls is builtins.dict or cls is builtins.list:
+        return True
+    if cls is dict or cls is list:
+        return vars(value).get("_sealed") is not sealed or (
+            vars(value).get("_frozen") is not frozen
+        )
+    return False
@@ -0,0 +1,395 @@
+"""
+Compact binary serialization of trees
+
+Format
+------
+A document starts with the magic bytes :code:`b"ETB1"`, followed by a single
+value. Each value starts with a one-byte tag:
+
+- :code:`0x00`, :code:`0x01`, :code:`0x02`: None, False and True
+- :code:`0x03`: integer, as an i64 (little-endian)
+- :code:`0x04`: large integer, as its length (varint) and its signed bytes (little-endian)
+- :code:`0x05`: float, as an f64 (little-endian)
+- :code:`0x06`: string, as its length (varint) and its utf-8 bytes
+- :code:`0x07`: bytes, as its length (varint) and its bytes
+- :code:`0x08`: dict, as its flags (u8), its number of items (varint) and its items, each as a key and a value
+- :code:`0x09`: list, as its flags (u8), its number of items (varint) and its items
+- :code:`0x0A`, :code:`0x0B`: tuple and set, as their number of items (varint) and their items
+- :code:`0x0C`: reference to a previous key, as its index (varint) in the key table
+
+The flags of dicts and lists are 1 if sealed, plus 2 if frozen.
+
+Keys are encoded as values the first time they are written, and appended to
+the key table of the document; subsequent occurrences of the same key are
+encoded as references to the key table.
+
+Decoding never constructs objects other than builtin scalars, tuples, sets,
+and :code:`easytree.dict` and :code:`easytree.list` nodes, such that, unlike
+pickle, documents from untrusted sources can be decoded safely.
+"""
+
+import builtins
+import struct
+
+from .interning import interner as _interner
+from .types import cast, dict, list
+from .computing import computed as _computed
+
+MAGIC = b"ETB1"
+
+_i64 = struct.Struct("<q")
+_f64 = struct.Struct("<d")
+
+# instance attributes of nodes, by flags
+_states = [
+    {"_sealed": bool(flags & 1), "_frozen": bool(flags & 2)} for flags in range(4)
+]
+
+
+def dumpb(tree) -> bytes:
+    """
+    Serialize a tree to bytes
+
+    Unlike JSON, the binary format preserves the sealed and frozen flags
+    of each node, non-string keys, bytes, tuples and sets.
+
+    Parameters
+    ----------
+    tree : any
+        the tree (or value) to serialize
+
+    Returns
+    -------
+    data : bytes
+        the serialized tree
+
+    Raises
+    ------
+    TypeError
+        if the tree contains a value which cannot be serialized
+    ValueError
+        if the tree is too deeply nested (or contains itself)
+
+    Note
+    ----
+    The encoder is written in Python, and is about twice as slow as
+    :code:`json.dumps`, which is implemented in C. The format trades encoding
+    time for decoding time and size: :code:`easytree.loadb` builds the nodes
+    directly, faster than :code:`json.loads` followed by a cast, and documents
+    of records are typically a third smaller than their JSON counterparts, as
+    repeated keys are written once.
+
+    Example
+    -------
+    >>> data = easytree.dumpb(easytree.dict({"name": "David"}, frozen=True))
+    >>> tree = easytree.loadb(data)
+    >>> tree.name
+    "David"
+    >>> easytree.frozen(tree)
+    True
+    """
+    out = bytearray(MAGIC)
+    append, extend = out.append, out.extend
+    pack_i64, pack_f64 = _i64.pack, _f64.pack
+    # encoded references to the keys, by key (or by type and key, for non-string keys)
+    keys = {}
+    # encoded strings, which are often repeated across records
+    strings = {}
+
+    def length(n):
+        while n >= 0x80:
+            append((n & 0x7F) | 0x80)
+            n >>= 7
+        append(n)
+
+    def encode(value):
+        data = value.encode("utf-8")
+        if len(data) >= 0x80:
+            append(0x06)
+            length(len(data))
+            extend(data)
+            return
+        encoded = strings[value] = bytes((0x06, len(data))) + data
+        extend(encoded)
+
+    def reference(index):
+        data = bytearray((0x0C,))
+        while index >= 0x80:
+            data.append((index & 0x7F) | 0x80)
+            index >>= 7
+        data.append(index)
+        return bytes(data)
+
+    def write(value):
+        cls = type(value)
+        if cls is str:
+            encoded = strings.get(value)
+            if encoded is None:
+                encode(value)
+            else:
+                extend(encoded)
+        elif value is None:
+            append(0x00)
+        elif cls is bool:
+            append(0x02 if value else 0x01)
+        elif cls is int:
+            if -(2**63) <= value < 2**63:
+                append(0x03)
+                extend(pack_i64(value))
+            else:
+                data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+                append(0x04)
+                length(len(data))
+                extend(data)
+        elif cls is float:
+            append(0x05)
+            extend(pack_f64(value))
+        elif isinstance(value, builtins.dict):
+            append(0x08)
+            append(_flags(value))
+            length(len(value))
+            for key, child in value.items():
+                # a string never equals a (type, key) tuple
+                index = key if type(key) is str else (type(key), key)
+                encoded = keys.get(index)
+                if encoded is None:
+                    keys[index] = reference(len(keys))
+                    write(key)
+                else:
+                    extend(encoded)
+                # the most common values are written without a call to write
+                cls = type(child)
+                if cls is str:
+                    encoded = strings.get(child)
+                    if encoded is None:
+                        encode(child)
+                    else:
+                        extend(encoded)
+                elif cls is int and -(2**63) <= child < 2**63:
+                    append(0x03)
+                    extend(pack_i64(child))
+                elif cls is float:
+                    append(0x05)
+                    extend(pack_f64(child))
+                elif cls is _computed:
+                    write(value[key])  # the current result of the computed value
+                else:
+                    write(child)
+        elif isinstance(value, builtins.list):
+            append(0x09)
+            append(_flags(value))
+            length(len(value))
+            for child in value:
+                cls = type(child)
+                if cls is str:
+                    encoded = strings.get(child)
+                    if encoded is None:
+                        encode(child)
+                    else:
+                        extend(encoded)
+                elif cls is float:
+                    append(0x05)
+                    extend(pack_f64(child))
+                else:
+                    write(child)
+        elif isinstance(value, (bytes, bytearray)):
+            append(0x07)
+            length(len(value))
+            extend(value)
+        elif isinstance(value, tuple):
+            append(0x0A)
+            length(len(value))
+            for child in value:
+                write(child)
+        elif isinstance(value, (set, frozenset)):
+            append(0x0B)
+            length(len(value))
+            for child in value:
+                write(child)
+        elif isinstance(value, str):
+            write(str.__str__(value))  # e.g. str enums
+        elif isinstance(value, int):
+            write(int(value))  # e.g. int enums
+        elif isinstance(value, float):
+            write(float(value))
+        else:
+            raise TypeError(f"Cannot serialize value of type {cls.__name__}")
+
+    try:
+        write(tree)
+    except RecursionError:
+        raise ValueError("Cannot serialize tree: too deeply nested") from None
+    return bytes(out)
+
+
+def loadb(data, *, intern=None, convert=None):
+    """
+    Deserialize a tree from bytes (see :code:`easytree.dumpb`)
+
+    Parameters
+    ----------
+    data : bytes-like
+        the serialized tree
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None.
+        Keys are always shared within a document; interning also shares them
+        across documents.
+    convert : easytree.Converters, None
+        the converters to apply to the leaves of the tree, by path
+
+    Returns
+    -------
+    tree : any
+        the tree, whose dict and list nodes are :code:`easytree.dict` and
+        :code:`easytree.list` nodes, with their original sealed and frozen flags
+
+    Raises
+    ------
+    ValueError
+        if the data is not a valid serialized tree
+    """
+    buffer = bytes(data)
+    if buffer[:4] != MAGIC:
+        raise ValueError("Data is not a serialized easytree")
+    size = len(buffer)
+    keys = []
+    position = 4
+    intern = _interner(intern)
+    if intern is None:
+        text = bytes.decode
+    else:
+
+        def text(data, encoding):
+            return intern.value(data.decode(encoding))
+
+    def length():
+        nonlocal position
+        byte = buffer[position]
+        position += 1
+        if byte < 0x80:
+            return byte
+        n, shift = byte & 0x7F, 7
+        while True:
+            byte = buffer[position]
+            position += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return n
+            shift += 7
+
+    def count():
+        n = length()
+        if n > size - position:
+            raise ValueError("Invalid serialized easytree: truncated data")
+        return n
+
+    def read(state=None):
+        nonlocal position
+        tag = buffer[position]
+        position += 1
+        if tag == 0x06:
+            n = count()
+            position += n
+            return text(buffer[position - n : position], "utf-8")
+        if tag == 0x03:
+            position += 8
+            return _i64.unpack_from(buffer, position - 8)[0]
+        if tag == 0x08:
+            flags = buffer[position]
+            position += 1
+            items = []
+            for _ in range(count()):
+                if buffer[position] == 0x0C:
+                    position += 1
+                    key = keys[length()]
+                else:
+                    key = read()
+                    if intern is not None:
+                        key = intern.key(key)
+                    keys.append(key)
+                if state is None:
+                    items.append((key, read()))
+                else:
+                    items.append((key, converted(state.key(key), flags)))
+            node = dict.__new__(dict)
+            builtins.dict.update(node, items)
+            vars(node).update(_states[flags & 3])
+            return node
+        if tag == 0x09:
+            flags = buffer[position]
+            position += 1
+            node = list.__new__(list)
+            if state is None:
+                builtins.list.extend(node, [read() for _ in range(count())])
+            else:
+                state = state.item()
+                values = [converted(state, flags) for _ in range(count())]
+                builtins.list.extend(node, values)
+            vars(node).update(_states[flags & 3])
+            return node
+        if tag == 0x05:
+            position += 8
+            return _f64.unpack_from(buffer, position - 8)[0]
+        if tag == 0x00:
+            return None
+        if tag == 0x01:
+            return False
+        if tag == 0x02:
+            return True
+        if tag == 0x07:
+            n = count()
+            position += n
+            return buffer[position - n : position]
+        if tag == 0x04:
+            n = count()
+            position += n
+            return int.from_bytes(buffer[position - n : position], "little", signed=True)
+        if tag == 0x0A:
+            return tuple([read() for _ in range(count())])
+        if tag == 0x0B:
+            return {read() for _ in range(count())}
+        raise ValueError(f"Invalid serialized easytree: unknown tag {tag}")
+
+    def converted(state, flags):
+        if state is None or state.converter is None:
+            return read(state)
+        # as when casting, no pattern is matched below a converted value
+        value = read()
+        try:
+            value = state.converter(value)
+        except Exception as error:
+            raise _ConverterError(error) from None
+        sealed, frozen = bool(flags & 1), bool(flags & 2)
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+
+    try:
+        tree = read(None if convert is None else convert._start)
+    except _ConverterError as error:
+        raise error.error
+    except (IndexError, struct.error, UnicodeDecodeError, TypeError) as error:
+        raise ValueError(f"Invalid serialized easytree: {error}") from None
+    except RecursionError:
+        raise ValueError("Invalid serialized easytree: too deeply nested") from None
+    if position != size:
+        raise ValueError("Invalid serialized easytree: trailing data")
+    return tree
+
+
+class _ConverterError(Exception):
+    """
+    Wraps the exceptions raised by converters, such that they are not
+    mistaken for decoding errors
+    """
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
+
+
+def _flags(node):
+    """
+    Returns the flags of a node
+    """
+    return (1 if getattr(node, "_sealed", False) else 0) | (
+        2 if getattr(node, "_frozen", False) else 0
+    )
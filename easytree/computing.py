@@ -0,0 +1,281 @@
+"""
+Computed values, evaluated lazily and invalidated when their dependencies change
+
+A computed value is stored at a key of a dict node. It is evaluated on first
+read, with a read-only proxy of the node, which records the keys (and nodes)
+read by the function. The value is cached until one of them is mutated through
+the methods of :code:`easytree.dict` and :code:`easytree.list`, e.g. setting
+a key, or appending to a list.
+
+Reads are tracked by the proxies only, such that reading a tree does not cost
+anything more than a type check, and mutations only check that some computed
+value is cached before looking up the nodes they depend on.
+"""
+
+import builtins
+import collections.abc
+import weakref
+
+from . import types
+
+_missing = object()
+
+# key of the dependencies on a whole node (e.g. iterating over it)
+_all = object()
+
+# computed values with a cached value, by id of the nodes (and keys) they depend on
+_watchers = {}
+# weak references to the watched nodes, which clear their watchers once collected
+_references = {}
+
+
+class computed:
+    """
+    Computed value, evaluated on first read and cached until a value
+    it depends on is mutated
+
+    The function is called with a read-only proxy of the dict node which
+    holds the computed value, and its result is cast as per the node. Only
+    the reads made through the proxy (by key, by attribute or by iteration)
+    are dependencies: values captured from outside of the node are not.
+
+    Parameters
+    ----------
+    function : callable
+        the function, which takes the node as its single argument
+
+    Note
+    ----
+    Computed values are resolved when read at a key of a dict (e.g. with the dot
+    notation, or :code:`get`). Iterating over the values of the dict returns the
+    :code:`computed` objects themselves, which the :code:`json` module cannot
+    serialize: use :code:`json.dumps(easytree.to_builtin(tree))` to serialize
+    a tree with computed values. :code:`easytree.dumpb` and
+    :code:`easytree.packed.encode` serialize their current result.
+
+    Example
+    -------
+    >>> cart = easytree.dict({"lines": [{"price": 2}, {"price": 3}]})
+    >>> cart.total = easytree.computed(lambda t: sum(i.price for i in t.lines))
+    >>> cart.total
+    5
+    >>> cart.lines.append({"price": 5})
+    >>> cart.total  # re-evaluated
+    10
+    """
+
+    __slots__ = ("_function", "_value", "_node", "_key", "_dependencies")
+
+    def __init__(self, function):
+        if not callable(function):
+            raise TypeError(
+                f"Expected a callable, received {type(function).__name__}"
+            )
+        self._function = function
+        self._value = _missing
+        self._node = None
+        self._key = None
+        self._dependencies = None
+
+    @property
+    def cached(self) -> bool:
+        """
+        True if the value is cached, False otherwise
+        """
+        return self._value is not _missing
+
+    def _get(self, node, key):
+        """
+        Returns the value, evaluated with the node which holds it, unless cached
+        """
+        if self._value is not _missing and self._key == key and self._node() is node:
+            return self._value
+        if self._dependencies is _missing:
+            raise RecursionError(f"computed value '{key}' depends on itself")
+        self.invalidate()
+        self._dependencies = _missing  # evaluating
+        dependencies = {}
+        try:
+            value = self._function(_tracked(node, dependencies))
+        except BaseException:
+            self._dependencies = None
+            raise
+        self._value = types.cast(value, sealed=node._sealed, frozen=node._frozen)
+        self._node = weakref.ref(node)
+        self._key = key
+        self._dependencies = builtins.list(dependencies)
+        for (identity, dependency), target in dependencies.items():
+            watching = _watchers.get(identity)
+            if watching is None:
+                watching = _watchers[identity] = {}
+                _references[identity] = weakref.ref(
+                    target, lambda _, identity=identity: _forget(identity)
+                )
+            watching.setdefault(dependency, set()).add(self)
+        return self._value
+
+    def invalidate(self):
+        """
+        Clear the cached value, and the values which depend on it
+        """
+        if self._value is _missing:
+            return
+        self._value = _missing
+        for identity, dependency in self._dependencies:
+            watching = _watchers.get(identity)
+            if watching is None:
+                continue
+            watchers = watching.get(dependency)
+            if watchers is not None:
+                watchers.discard(self)
+                if not watchers:
+                    del watching[dependency]
+            if not watching:
+                _forget(identity)
+        self._dependencies = None
+        node = self._node()
+        if node is not None:
+            _mutated(node, self._key)
+
+    def __copy__(self):
+        return computed(self._function)
+
+    def __deepcopy__(self, memo):
+        return computed(self._function)
+
+    def __repr__(self):
+        if self._value is _missing:
+            return "<computed>"
+        return f"<computed {self._value!r}>"
+
+
+def _forget(identity):
+    """
+    Remove the watchers of a node
+    """
+    _watchers.pop(identity, None)
+    _references.pop(identity, None)
+
+
+def _mutated(node, key=_all):
+    """
+    Invalidate the computed values which depend on a key of a node (or on
+    the whole node, if key is not given)
+    """
+    watching = _watchers.get(id(node))
+    if watching is None:
+        return
+    if key is _all:
+        invalidated = [c for watchers in watching.values() for c in watchers]
+    else:
+        invalidated = builtins.list(watching.get(key, ()))
+        invalidated.extend(watching.get(_all, ()))
+    for value in invalidated:
+        value.invalidate()
+
+
+def _tracked(value, dependencies):
+    """
+    Returns the value, wrapped in a tracking proxy if it is a node
+    """
+    if isinstance(value, types.dict):
+        return _trackeddict(value, dependencies)
+    if isinstance(value, types.list):
+        return _trackedlist(value, dependencies)
+    return value
+
+
+class _tracker:
+    """
+    Read-only proxy of a node, which records the keys read from it
+    """
+
+    __slots__ = ("_target", "_dependencies")
+
+    def __init__(self, target, dependencies):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_dependencies", dependencies)
+
+    def _depend(self, key=_all):
+        self._dependencies[(id(self._target), key)] = self._target
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"cannot set attribute '{key}' while computing a value")
+
+    def __len__(self):
+        self._depend()
+        return len(self._target)
+
+    def __eq__(self, other):
+        self._depend()
+        if isinstance(other, _tracker):
+            other = other._target
+        return self._target == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._target)
+
+
+class _trackeddict(_tracker, collections.abc.Mapping):
+    """
+    Read-only proxy of a dict node, which records the keys read from it
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        self._depend(key)
+        return _tracked(self._target[key], self._dependencies)
+
+    def __getattr__(self, key):
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)
+        self._depend(key)
+        return _tracked(types.dict.__getattr__(self._target, key), self._dependencies)
+
+    def __contains__(self, key):
+        self._depend(key)
+        return key in self._target
+
+    def __iter__(self):
+        self._depend()
+        return iter(self._target)
+
+    def get(self, key, default=None):
+        if isinstance(key, builtins.list):
+            from .utils import _lookup  # utils imports this module, through types
+
+            return _lookup(self, key, default)
+        self._depend(key)
+        value = self._target.get(key, _missing)
+        return default if value is _missing else _tracked(value, self._dependencies)
+
+
+class _trackedlist(_tracker, collections.abc.Sequence):
+    """
+    Read-only proxy of a list node, which depends on the whole list
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        self._depend()
+        if isinstance(index, slice):
+            return [_tracked(v, self._dependencies) for v in self._target[index]]
+        return _tracked(self._target[index], self._dependencies)
+
+    def __iter__(self):
+        self._depend()
+        dependencies = self._dependencies
+        return (_tracked(value, dependencies) for value in self._target)
+
+    def __contains__(self, value):
+        self._depend()
+        if isinstance(value, _tracker):
+            value = value._target
+        return value in self._target
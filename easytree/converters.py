@@ -0,0 +1,230 @@
+"""
+Leaf converters, keyed by path patterns, which are applied while trees are cast
+
+Patterns are paths of dot-separated keys, with the following wildcards:
+
+- :code:`*` matches any key of a dict
+- :code:`[*]` matches any item of a list
+- :code:`**` matches any number (including zero) of keys and items
+
+For instance, :code:`*.created_at` matches the :code:`created_at` key of the
+dicts at the first level of a tree, :code:`prices[*]` matches the items of
+the :code:`prices` list, and :code:`**.id` matches the :code:`id` keys at
+any depth.
+
+Patterns are compiled into a non-deterministic automaton, whose sets of states
+are determinized lazily and cached, such that matching a key costs a single
+dict lookup once the tree has a known shape, and such that subtrees which no
+pattern can match are cast without any matching at all.
+"""
+
+import builtins
+
+from .types import cast, _rebuild
+
+# wildcard tokens
+_any = object()
+_item = object()
+_deep = object()
+
+_missing = object()
+
+# maximum number of cached transitions from a state
+_max_keys = 4096
+
+
+class Converters:
+    """
+    Compiled leaf converters, keyed by path patterns (see the :code:`convert`
+    argument of :code:`easytree.dict`, :code:`easytree.list` and :code:`easytree.loadb`)
+
+    When several patterns match a value, the first one is used. The value is
+    converted before it is cast, and no pattern is matched below a converted value.
+
+    Parameters
+    ----------
+    patterns : dict
+        the converters (callables), by path pattern
+
+    Raises
+    ------
+    ValueError
+        if a pattern is invalid
+
+    Example
+    -------
+    >>> converters = easytree.Converters(
+    ...     {"*.created_at": datetime.fromisoformat, "prices[*]": decimal.Decimal}
+    ... )
+    >>> tree = easytree.dict(payload, convert=converters)
+    >>> tree.order.created_at
+    datetime.datetime(2024, 1, 1, 0, 0)
+    """
+
+    __slots__ = ("_patterns", "_functions", "_states", "_start")
+
+    def __init__(self, patterns):
+        self._patterns = [_parse(pattern) for pattern in patterns]
+        self._functions = builtins.list(patterns.values())
+        self._states = {}
+        self._start = self._state(
+            frozenset((p, 0) for p in range(len(self._patterns)))
+        )
+
+    def _state(self, positions):
+        """
+        Returns the (cached) state for a set of positions in the patterns
+        """
+        positions = self._closure(positions)
+        if not positions:
+            return None
+        state = self._states.get(positions)
+        if state is None:
+            accepted = [p for p, i in positions if i == len(self._patterns[p])]
+            converter = self._functions[min(accepted)] if accepted else None
+            state = self._states[positions] = _state(self, positions, converter)
+        return state
+
+    def _closure(self, positions):
+        """
+        Returns the positions, and the positions following a :code:`**`
+        wildcard, which may match no step
+        """
+        stack = builtins.list(positions)
+        positions = set(positions)
+        while stack:
+            p, i = stack.pop()
+            tokens = self._patterns[p]
+            if i < len(tokens) and tokens[i] is _deep and (p, i + 1) not in positions:
+                positions.add((p, i + 1))
+                stack.append((p, i + 1))
+        return frozenset(positions)
+
+    def _next(self, positions, key, item):
+        """
+        Returns the state reached from a set of positions, after a step
+        to a key of a dict (or an item of a list, if item is True)
+        """
+        following = set()
+        for p, i in positions:
+            tokens = self._patterns[p]
+            if i == len(tokens):
+                continue
+            token = tokens[i]
+            if token is _deep:
+                following.add((p, i))
+            elif token is _item:
+                if item:
+                    following.add((p, i + 1))
+            elif not item and (token is _any or token == key):
+                following.add((p, i + 1))
+        return self._state(following)
+
+    def _items_of(self, items, sealed, frozen, intern):
+        return self._start._items_of(items, sealed, frozen, intern)
+
+    def _values_of(self, values, sealed, frozen, intern):
+        return self._start._values_of(values, sealed, frozen, intern)
+
+    def __repr__(self):
+        return f"<Converters patterns={len(self._patterns)} states={len(self._states)}>"
+
+
+class _state:
+    """
+    State of the automaton, i.e. the set of positions in the patterns
+    which match the path to a node, with its cached transitions
+    """
+
+    __slots__ = ("_converters", "_positions", "converter", "_keys", "_items")
+
+    def __init__(self, converters, positions, converter):
+        self._converters = converters
+        self._positions = positions
+        self.converter = converter
+        self._keys = {}
+        self._items = _missing
+
+    def key(self, key):
+        """
+        Returns the state of the value at a key of a dict, or None
+        """
+        try:
+            return self._keys[key]
+        except KeyError:
+            state = self._converters._next(self._positions, key, False)
+            if len(self._keys) < _max_keys:  # e.g. identifiers matched by *
+                self._keys[key] = state
+            return state
+        except TypeError:  # unhashable keys
+            return self._converters._next(self._positions, key, False)
+
+    def item(self):
+        """
+        Returns the state of the items of a list, or None
+        """
+        if self._items is _missing:
+            self._items = self._converters._next(self._positions, None, True)
+        return self._items
+
+    def _items_of(self, items, sealed, frozen, intern):
+        """
+        Returns the cast (and converted) items of a dict node
+        """
+        result = {}
+        for key, value in items.items():
+            state = self.key(key)
+            if intern is not None:
+                key = intern.key(key)
+            result[key] = _convert(state, value, sealed, frozen, intern)
+        return result
+
+    def _values_of(self, values, sealed, frozen, intern):
+        """
+        Returns the cast (and converted) values of a list node
+        """
+        state = self.item()
+        return [_convert(state, value, sealed, frozen, intern) for value in values]
+
+
+def _convert(state, value, sealed, frozen, intern):
+    """
+    Returns the value converted, if its path matches a pattern, and cast
+    """
+    if state is None:
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+    if state.converter is not None:
+        value = state.converter(value)
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+    if isinstance(value, builtins.dict):
+        children = state._items_of(value, sealed, frozen, intern)
+        return _rebuild(value, children, sealed, frozen)
+    if isinstance(value, builtins.list):
+        children = state._values_of(value, sealed, frozen, intern)
+        return _rebuild(value, children, sealed, frozen)
+    return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+
+
+def _parse(pattern):
+    """
+    Parse a pattern into a list of tokens
+    """
+    tokens = []
+    for part in pattern.split("."):
+        key, _, rest = part.partition("[")
+        if key == "**":
+            tokens.append(_deep)
+        elif key == "*":
+            tokens.append(_any)
+        elif key:
+            tokens.append(key)
+        elif not rest:
+            raise ValueError(f"Invalid pattern '{pattern}': empty key")
+        if rest:
+            for index in ("[" + rest).split("[")[1:]:
+                if index != "*]":
+                    raise ValueError(
+                        f"Invalid pattern '{pattern}': only [*] is supported for lists"
+                    )
+                tokens.append(_item)
+    return tokens
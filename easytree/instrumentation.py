@@ -0,0 +1,265 @@
+"""
+Opt-in counters for the hot paths of easytree
+
+While enabled, easytree counts the following events, attributed to the call
+site (the first frame outside of easytree) which triggered them, and when
+relevant, to the path of keys involved:
+
+- :code:`cast`: calls to the internal :code:`cast` function
+- :code:`node`: construction of :code:`easytree.dict` and :code:`easytree.list` nodes
+- :code:`undefined`: construction of :code:`undefined` nodes (e.g. reading a missing key)
+- :code:`materialize`: casting of an :code:`undefined` node to a dict or list node
+- :code:`rejection`: operations rejected by a sealed or frozen node
+
+Instrumentation works by swapping counting wrappers into the easytree classes
+and functions when enabled, and restoring the originals when disabled, such that
+it costs nothing when disabled.
+
+Example
+-------
+>>> with easytree.instrumentation.recording() as report:
+...     tree = easytree.dict()
+...     if tree.address.city:
+...         pass
+>>> report()["undefined"]["paths"]
+{"address": 2, "address.city": 1}
+"""
+
+import builtins
+import collections
+import functools
+import sys
+
+from . import types
+
+_events = ["cast", "node", "undefined", "materialize", "rejection"]
+_sites = collections.Counter()
+_paths = collections.Counter()
+_originals = {}
+
+# methods whose first argument is a key of the node
+_keyed = {
+    "__getitem__",
+    "__setitem__",
+    "__getattr__",
+    "__setattr__",
+    "__delitem__",
+    "__delattr__",
+    "setdefault",
+}
+
+_mutators = {
+    types.dict: [
+        "__getitem__",
+        "__setitem__",
+        "__getattr__",
+        "__setattr__",
+        "__delitem__",
+        "__delattr__",
+        "setdefault",
+        "update",
+        "clear",
+        "popitem",
+        "pop",
+    ],
+    types.list: [
+        "__setitem__",
+        "__delitem__",
+        "append",
+        "extend",
+        "ingest",
+        "insert",
+        "remove",
+        "pop",
+        "clear",
+        "sort",
+        "reverse",
+    ],
+}
+
+
+def enabled() -> bool:
+    """
+    Returns :code:`True` if instrumentation is enabled
+    """
+    return bool(_originals)
+
+
+def enable():
+    """
+    Enable instrumentation
+
+    Counters are not reset, see :code:`reset`.
+    """
+    if enabled():
+        return
+
+    cast = types.cast
+    _originals[(types, "cast")] = cast
+    for name, module in builtins.list(sys.modules.items()):
+        if name.startswith("easytree.") and getattr(module, "cast", None) is cast:
+            _originals[(module, "cast")] = cast
+
+    for cls in (types.dict, types.list):
+        _originals[(cls, "__new__")] = cls.__dict__.get("__new__")
+        for method in _mutators[cls]:
+            _originals[(cls, method)] = cls.__dict__[method]
+    _originals[(types.undefined, "__init__")] = types.undefined.__init__
+    _originals[(types.undefined, "_cast")] = types.undefined._cast
+
+    for (owner, name), original in _originals.items():
+        if name == "cast":
+            setattr(owner, name, _count_cast(original))
+        elif name == "__new__":
+            setattr(owner, name, staticmethod(_count_node(owner.__base__)))
+        elif name == "__init__":
+            setattr(owner, name, _count_undefined(original))
+        elif name == "_cast":
+            setattr(owner, name, _count_materialize(original))
+        else:
+            setattr(owner, name, _count_rejection(original))
+
+
+def disable():
+    """
+    Disable instrumentation, restoring the original functions and methods
+
+    Counters are not reset, see :code:`reset`.
+    """
+    for (owner, name), original in _originals.items():
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+    _originals.clear()
+
+
+def reset():
+    """
+    Reset the counters
+    """
+    _sites.clear()
+    _paths.clear()
+
+
+def report():
+    """
+    Returns the counters
+
+    Returns
+    -------
+    report : easytree.dict
+        for each event, the total count, the count by call site
+        (as :code:`filename:lineno`) and the count by path of keys,
+        each sorted in decreasing order
+    """
+    result = {
+        event: {"total": 0, "sites": {}, "paths": {}} for event in _events
+    }
+    for (event, site), count in _sites.most_common():
+        result[event]["total"] += count
+        result[event]["sites"][site] = count
+    for (event, path), count in _paths.most_common():
+        result[event]["paths"][path] = count
+    return types.dict(result)
+
+
+class recording:
+    """
+    Context manager which resets the counters and enables instrumentation
+    on enter, and restores the previous state on exit
+
+    Returns
+    -------
+    report : callable
+        the :code:`report` function
+    """
+
+    def __enter__(self):
+        self._enabled = enabled()
+        reset()
+        enable()
+        return report
+
+    def __exit__(self, *args, **kwargs):
+        if not self._enabled:
+            disable()
+
+
+def _site():
+    """
+    Returns the first call site outside of easytree
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != "easytree" and not module.startswith("easytree."):
+            return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+def _path(node, key):
+    """
+    Returns the path of keys to a key of a (possibly undefined) node
+    """
+    keys = [key]
+    while isinstance(node, types.undefined):
+        keys.append(node._key)
+        node = node._parent
+    return ".".join(k if isinstance(k, str) else f"[{k!r}]" for k in reversed(keys))
+
+
+def _count(event, path=None):
+    _sites[(event, _site())] += 1
+    if path is not None:
+        _paths[(event, path)] += 1
+
+
+def _count_cast(cast):
+    @functools.wraps(cast)
+    def wrapper(value, **kwargs):
+        _count("cast")
+        return cast(value, **kwargs)
+
+    return wrapper
+
+
+def _count_node(base):
+    def wrapper(cls, *args, **kwargs):
+        _count("node")
+        return base.__new__(cls)
+
+    return wrapper
+
+
+def _count_undefined(init):
+    @functools.wraps(init)
+    def wrapper(self, parent, key):
+        _count("undefined", _path(parent, key))
+        return init(self, parent, key)
+
+    return wrapper
+
+
+def _count_materialize(cast):
+    @functools.wraps(cast)
+    def wrapper(self, type):
+        _count("materialize", _path(self._parent, self._key))
+        return cast(self, type)
+
+    return wrapper
+
+
+def _count_rejection(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except (KeyError, AttributeError, TypeError):
+            if self._frozen or self._sealed:
+                keyed = args and method.__name__ in _keyed
+                _count("rejection", _path(self, args[0]) if keyed else None)
+            raise
+
+    return wrapper
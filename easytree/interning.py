@@ -0,0 +1,141 @@
+import sys
+
+
+class Interner:
+    """
+    Interning table, which deduplicates the keys (and optionally, the short
+    string values) of trees during their construction
+
+    Pass an interner (or :code:`True`, for the shared :code:`default` interner)
+    as the :code:`intern` argument of :code:`easytree.dict`, :code:`easytree.list`
+    and loaders such as :code:`easytree.loadb`.
+
+    Parameters
+    ----------
+    values : bool
+        True to also intern string values, False to only intern keys
+    max_length : int
+        the maximum length of the string values to intern
+    max_size : int, None
+        the maximum number of strings in the table, or None for no limit.
+        Once the table is full, strings which are not in it yet are returned
+        as is, rather than added to it.
+
+    Note
+    ----
+    Nodes which are already cast with the requested flags are returned as is
+    by :code:`easytree.types.cast`, without interning their keys: intern the
+    keys of a tree when it is first cast, e.g. when it is loaded.
+
+    Example
+    -------
+    >>> interner = easytree.Interner(values=True)
+    >>> records = [easytree.dict(record, intern=interner) for record in payload]
+    >>> interner.report()
+    {"strings": 42, "hits": 1999958, "bytes_saved": 117997522}
+    """
+
+    def __init__(
+        self, *, values: bool = False, max_length: int = 64, max_size: int = None
+    ):
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"max_size must not be negative, received {max_size}")
+        self._table = {}
+        self._values = values
+        self._max_length = max_length
+        self._max_size = sys.maxsize if max_size is None else max_size
+        self._hits = 0
+        self._saved = 0
+
+    def key(self, key):
+        """
+        Returns the interned key, if the key is a string, or the key itself
+        """
+        if type(key) is not str:
+            return key
+        return self._intern(key)
+
+    def value(self, value):
+        """
+        Returns the interned value, if the interner interns values and the
+        value is a short enough string, or the value itself
+        """
+        if not self._values or type(value) is not str or len(value) > self._max_length:
+            return value
+        return self._intern(value)
+
+    def _intern(self, string):
+        """
+        Returns the interned string, which is added to the table unless it is full
+        """
+        canonical = self._table.get(string)
+        if canonical is None:
+            if len(self._table) < self._max_size:
+                self._table[string] = string
+            return string
+        if canonical is not string:
+            self._hits += 1
+            self._saved += sys.getsizeof(string)
+        return canonical
+
+    def report(self):
+        """
+        Returns the number of distinct strings in the table, the number of
+        strings which were replaced by their interned copy, and the estimated
+        number of bytes saved (i.e. the size of the replaced strings)
+
+        Returns
+        -------
+        report : easytree.dict
+        """
+        from .types import dict
+
+        return dict(
+            {
+                "strings": len(self._table),
+                "hits": self._hits,
+                "bytes_saved": self._saved,
+            }
+        )
+
+    def clear(self):
+        """
+        Clear the table and the counters
+        """
+        self._table.clear()
+        self._hits = 0
+        self._saved = 0
+
+    def __len__(self):
+        return len(self._table)
+
+
+#: the interner used when :code:`intern=True`, which only interns keys. It is
+#: shared by the whole process, and only shrinks when cleared: its table holds
+#: at most 65536 strings, such that high-cardinality keys (e.g. identifiers
+#: used as keys) cannot grow it without limit.
+default = Interner(max_size=65536)
+
+
+def interner(intern):
+    """
+    Returns the interner for an :code:`intern` argument
+
+    Parameters
+    ----------
+    intern : bool, Interner, None
+        True for the default interner, an interner, or None (or False) for no interning
+
+    Returns
+    -------
+    interner : Interner, None
+    """
+    if intern is None or intern is False:
+        return None
+    if intern is True:
+        return default
+    if isinstance(intern, Interner):
+        return intern
+    raise TypeError(
+        f"Expected intern to be a bool or an easytree.Interner, received {type(intern).__name__}"
+    )
@@ -0,0 +1,201 @@
+"""
+Loading of JSON Lines files, i.e. files with one JSON document per line
+"""
+
+import builtins
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .codec import dumpb, loadb
+from .types import cast, list
+
+# smallest chunk of a file parsed by a worker, in bytes
+_min_chunk_size = 1 << 20
+
+
+def load_jsonl(
+    path,
+    *,
+    workers: int = None,
+    sealed: bool = False,
+    frozen: bool = False,
+    intern=None,
+):
+    """
+    Load a JSON Lines file into an :code:`easytree.list`, parsing it in parallel
+
+    The file is split into byte-range chunks, at line boundaries, which are
+    parsed and cast by a pool of worker processes, and reassembled in order.
+    With a single worker, the lines are read and cast one by one instead, as
+    by :code:`easytree.iter_jsonl`.
+
+    Parameters
+    ----------
+    path : str, os.PathLike
+        the path of the file
+    workers : int, None
+        the number of worker processes (defaults to the number of CPUs),
+        or 1 to load the file in the current process
+    sealed : bool
+        True if the records are sealed, False otherwise
+    frozen : bool
+        True if the records are frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None
+
+    Returns
+    -------
+    records : easytree.list
+        the records, in the order of the lines of the file
+
+    Raises
+    ------
+    ValueError
+        if a line is not a valid JSON document
+
+    Note
+    ----
+    The records cast by the workers are rebuilt in this process, from their
+    :code:`easytree.dumpb` serialization, which costs about three quarters of
+    loading the file in a single process (see :code:`benchmarks/jsonl.py`).
+    The workers therefore only save the parsing of the lines, such that loading
+    in parallel is at best about 1.3 times faster, with 4 workers or more,
+    and only for files of several megabytes: use :code:`workers=1` for smaller
+    files, or when fewer CPUs are available.
+
+    Example
+    -------
+    >>> events = easytree.load_jsonl("events.jsonl", workers=8, frozen=True)
+    >>> events[0].type
+    "click"
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(path, workers * 4) if workers > 1 else None
+    if chunks is None or len(chunks) == 1:
+        with open(path, "rb") as file:
+            records = iter_jsonl(file, sealed=sealed, frozen=frozen, intern=intern)
+            # records are already cast, such that they are not copied
+            return list(records, sealed=sealed, frozen=frozen)
+
+    records = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        arguments = [(path, start, end, sealed, frozen) for start, end in chunks]
+        for data in pool.map(_load_chunk, *zip(*arguments)):
+            records.extend(loadb(data, intern=intern))
+    # records are already cast, such that they are not copied
+    return list(records, sealed=sealed, frozen=frozen)
+
+
+def iter_jsonl(
+    fp,
+    *,
+    batch_size: int = None,
+    sealed: bool = False,
+    frozen: bool = True,
+    intern=None,
+    convert=None,
+):
+    """
+    Iterate lazily over the records of a JSON Lines file object
+
+    Only one line (or one batch of records) is held in memory at a time,
+    and all lines are parsed by the same decoder.
+
+    Parameters
+    ----------
+    fp : file object
+        the file object, opened in text or binary mode
+    batch_size : int, None
+        the number of records per batch, or None to yield records one by one
+    sealed : bool
+        True if the records are sealed, False otherwise
+    frozen : bool
+        True if the records are frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None.
+        Interning shares the keys of all the records yielded.
+    convert : easytree.Converters, None
+        the converters to apply to the leaves of each record, by path
+
+    Yields
+    ------
+    record : easytree.dict, easytree.list
+        each record, if batch_size is None, or else each batch of records,
+        as an :code:`easytree.list` (the last batch may be smaller)
+
+    Raises
+    ------
+    ValueError
+        if a line is not a valid JSON document, or if batch_size is not positive
+
+    Example
+    -------
+    >>> with open("events.jsonl") as file:
+    ...     for batch in easytree.iter_jsonl(file, batch_size=1000, intern=True):
+    ...         process(batch)
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"Expected a positive batch size, received {batch_size}")
+    decode = json.JSONDecoder().decode
+    records = (
+        cast(
+            decode(line if isinstance(line, str) else line.decode("utf-8")),
+            sealed=sealed,
+            frozen=frozen,
+            intern=intern,
+            convert=convert,
+        )
+        for line in fp
+        if line.strip()
+    )
+    if batch_size is None:
+        yield from records
+        return
+    while True:
+        batch = builtins.list(itertools.islice(records, batch_size))
+        if not batch:
+            return
+        yield list(batch, sealed=sealed, frozen=frozen)
+
+
+def _chunks(path, n):
+    """
+    Split a file into (at most) n byte ranges, which start and end at line boundaries
+    """
+    size = os.path.getsize(path)
+    n = max(1, min(n, size // _min_chunk_size))
+    offsets = [0]
+    with open(path, "rb") as file:
+        for i in range(1, n):
+            offset = size * i // n
+            if offset <= offsets[-1]:
+                continue
+            # the chunk starts after the first newline at or after offset - 1
+            file.seek(offset - 1)
+            file.readline()
+            offset = file.tell()
+            if offset > offsets[-1] and offset < size:
+                offsets.append(offset)
+    offsets.append(size)
+    return builtins.list(zip(offsets, offsets[1:]))
+
+
+def _parse(path, start, end):
+    """
+    Parse the lines of a byte range of a file
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(-1 if end is None else end - start).splitlines()
+    decode = json.JSONDecoder().decode
+    return [decode(line.decode("utf-8")) for line in lines if line.strip()]
+
+
+def _load_chunk(path, start, end, sealed, frozen):
+    """
+    Parse and cast the lines of a byte range of a file, and returns them
+    serialized with :code:`easytree.dumpb`, which is faster to load than a pickle
+    """
+    return dumpb(list(_parse(path, start, end), sealed=sealed, frozen=frozen))
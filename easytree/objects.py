@@ -0,0 +1,248 @@
+"""
+Conversion between trees and typed objects (dataclasses and named tuples)
+
+The conversion plan of each class (i.e. its fields, their defaults, and the
+converters of their values, derived from their type hints) is built once,
+on first use, and cached, such that converting an object does not involve
+any introspection.
+"""
+
+import builtins
+import collections.abc as _abc
+import dataclasses
+import functools
+import types
+import typing
+
+from .types import dict, list
+
+_missing = object()
+
+# conversion plans, by class
+_plans = {}
+# field names, by class (empty for classes which are not dataclasses or named tuples)
+_names = {}
+
+
+def to_object(tree, cls):
+    """
+    Convert a tree into an instance of a dataclass (or named tuple)
+
+    Nested dataclasses, lists, tuples, dicts and optional values are converted
+    based on the type hints of the fields. Keys which are not fields are ignored.
+
+    Parameters
+    ----------
+    tree : dict
+        the tree
+    cls : type
+        the dataclass (or named tuple)
+
+    Returns
+    -------
+    obj : cls
+        the object
+
+    Raises
+    ------
+    TypeError
+        if cls is not a dataclass or a named tuple, or if the tree has no
+        value for a field without a default
+
+    Example
+    -------
+    >>> @dataclasses.dataclass
+    ... class Database:
+    ...     host: str
+    ...     port: int = 5432
+
+    >>> @dataclasses.dataclass
+    ... class Config:
+    ...     databases: typing.List[Database]
+
+    >>> config = easytree.to_object(tree, Config)
+    >>> config.databases[0].port
+    5432
+    """
+    return _instantiate(cls, tree)
+
+
+def from_object(obj, *, sealed: bool = False, frozen: bool = False):
+    """
+    Convert a dataclass (or named tuple) instance into a tree
+
+    Unlike :code:`dataclasses.asdict` followed by a cast, the nodes of
+    the tree are built directly, without intermediate copies.
+
+    Parameters
+    ----------
+    obj : any
+        the object, or a list, tuple or dict of objects
+    sealed : bool
+        True if the tree is sealed, False otherwise
+    frozen : bool
+        True if the tree is frozen, False otherwise
+
+    Returns
+    -------
+    tree : easytree.dict, easytree.list, any
+        the tree
+
+    Example
+    -------
+    >>> tree = easytree.from_object(config, frozen=True)
+    >>> tree.databases[0].port
+    5432
+    """
+    return _from(obj, {"_sealed": sealed, "_frozen": frozen})
+
+
+def _instantiate(cls, value):
+    """
+    Returns an instance of cls, built from the values of a tree
+    """
+    fields, constructor = _plans.get(cls) or _plan(cls)
+    if isinstance(value, cls):
+        return value
+    get = value.get if not isinstance(value, builtins.dict) else None
+    kwargs = {}
+    for name, converter, required in fields:
+        if get is None:
+            item = builtins.dict.get(value, name, _missing)
+        else:
+            item = get(name, _missing)
+        if item is _missing:
+            if required:
+                raise TypeError(
+                    f"missing value for field '{name}' of {cls.__name__}"
+                )
+            continue
+        kwargs[name] = item if converter is None else converter(item)
+    return constructor(**kwargs)
+
+
+def _plan(cls):
+    """
+    Build (and cache) the conversion plan of a class
+    """
+    if dataclasses.is_dataclass(cls) and isinstance(cls, type):
+        hints = typing.get_type_hints(cls)
+        fields = [
+            (
+                field.name,
+                field.type if field.name not in hints else hints[field.name],
+                field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING,
+            )
+            for field in dataclasses.fields(cls)
+            if field.init
+        ]
+    elif isinstance(cls, type) and _namedtuple(cls):
+        hints = typing.get_type_hints(cls)
+        fields = [
+            (name, hints.get(name, typing.Any), name not in cls._field_defaults)
+            for name in cls._fields
+        ]
+    else:
+        raise TypeError(
+            "Expected a dataclass or a named tuple, "
+            f"received {getattr(cls, '__name__', cls)!r}"
+        )
+    # the plan is cached before the converters are built, for recursive classes
+    plan = _plans[cls] = ([], cls)
+    plan[0].extend(
+        (name, _converter(hint), required) for name, hint, required in fields
+    )
+    return plan
+
+
+def _converter(hint):
+    """
+    Returns the function which converts a value to a type hint, or None
+    if values are used as is
+    """
+    if isinstance(hint, type) and (dataclasses.is_dataclass(hint) or _namedtuple(hint)):
+        return functools.partial(_instantiate, hint)
+
+    origin, args = typing.get_origin(hint), typing.get_args(hint)
+    if origin is typing.Union or origin is getattr(types, "UnionType", None):
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) != 1:
+            return None
+        converter = _converter(options[0])
+        if converter is None:
+            return None
+        return lambda value: None if value is None else converter(value)
+
+    if origin in (builtins.list, _abc.Sequence, _abc.MutableSequence):
+        converter = _converter(args[0]) if args else None
+        if converter is None:
+            return None
+        return lambda value: [converter(item) for item in value]
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            converter = _converter(args[0])
+            if converter is None:
+                return tuple
+            return lambda value: tuple(converter(item) for item in value)
+        converters = [_converter(arg) for arg in args]
+        if not any(converters):
+            return tuple
+        return lambda value: tuple(
+            item if converter is None else converter(item)
+            for converter, item in zip(converters, value)
+        )
+
+    if origin in (builtins.dict, _abc.Mapping, _abc.MutableMapping):
+        converter = _converter(args[1]) if len(args) == 2 else None
+        if converter is None:
+            return None
+        return lambda value: {key: converter(item) for key, item in value.items()}
+
+    return None
+
+
+def _namedtuple(cls):
+    """
+    Returns True if cls is a named tuple class
+    """
+    return issubclass(cls, tuple) and hasattr(cls, "_fields")
+
+
+def _from(value, state):
+    """
+    Returns the tree of a value, whose nodes have the given state (flags)
+    """
+    cls = type(value)
+    names = _names.get(cls)
+    if names is None:
+        if dataclasses.is_dataclass(cls):
+            names = tuple(field.name for field in dataclasses.fields(cls))
+        elif _namedtuple(cls):
+            names = cls._fields
+        else:
+            names = ()
+        _names[cls] = names
+    if names:
+        node = dict.__new__(dict)
+        builtins.dict.update(
+            node, [(name, _from(getattr(value, name), state)) for name in names]
+        )
+        vars(node).update(state)
+        return node
+    if isinstance(value, builtins.dict):
+        node = dict.__new__(dict)
+        builtins.dict.update(
+            node, [(key, _from(item, state)) for key, item in value.items()]
+        )
+        vars(node).update(state)
+        return node
+    if isinstance(value, builtins.list):
+        node = list.__new__(list)
+        builtins.list.extend(node, [_from(item, state) for item in value])
+        vars(node).update(state)
+        return node
+    if cls is tuple:
+        return tuple(_from(item, state) for item in value)
+    return value
@@ -0,0 +1,521 @@
+"""
+Packed, read-only trees
+
+A packed tree is a compact binary encoding of a tree, which can be read in
+place (e.g. from shared memory or a memory-mapped file), decoding only the
+nodes which are accessed.
+
+Format
+------
+All integers are little-endian. The buffer starts with a header::
+
+    magic (4 bytes, b"ETPK"), version (u8), padding (3 bytes),
+    offset of the string table (u64), number of strings (u64),
+    offset of the root node (u64)
+
+followed by the nodes, and by the string table, in which every key and string
+value of the tree is stored once::
+
+    offsets (u64 * (number of strings + 1)), utf-8 encoded strings
+
+Each node starts with a one-byte tag:
+
+- :code:`N`, :code:`T`, :code:`F`: None, True and False
+- :code:`i`: integer, as an i64
+- :code:`I`: large integer, as its length (u32) and its signed bytes
+- :code:`d`: float, as an f64
+- :code:`s`: string, as its index (u32) in the string table
+- :code:`b`: bytes, as its length (u64) and its bytes
+- :code:`l`, :code:`t`, :code:`e`: list, tuple and set, as the number of items
+  (u32) and the offsets (u64) of the items
+- :code:`m`: dict, as the number of items (u32), the index (u32) of the key and
+  the offset (u64) of the value of each item, in insertion order, and the
+  positions (u32) of the items sorted by key, for binary search
+"""
+
+import builtins
+import collections.abc
+import io
+import mmap
+import struct
+
+from .types import cast
+from .computing import computed as _computed
+from .utils import _lookup
+
+MAGIC = b"ETPK"
+VERSION = 1
+
+_header = struct.Struct("<4sB3xQQQ")
+_u32 = struct.Struct("<I")
+_u64 = struct.Struct("<Q")
+_i64 = struct.Struct("<q")
+_f64 = struct.Struct("<d")
+_item = struct.Struct("<IQ")
+
+
+def encode(tree) -> bytes:
+    """
+    Encode a tree in the packed format
+
+    Parameters
+    ----------
+    tree : dict, list
+        the tree, whose keys must be strings
+
+    Returns
+    -------
+    encoded : bytes
+        the packed tree
+
+    Raises
+    ------
+    TypeError
+        if a key is not a string, or a value cannot be encoded
+    """
+    file = io.BytesIO()
+    _encode(tree, file)
+    return file.getvalue()
+
+
+def _encode(tree, file):
+    """
+    Write a tree in the packed format to a seekable binary file, node by node
+    """
+    start = file.tell()
+    position = _header.size
+    strings = {}
+    file.write(bytes(_header.size))
+
+    def emit(data):
+        nonlocal position
+        offset = position
+        file.write(data)
+        position += len(data)
+        return offset
+
+    def string(value):
+        try:
+            return strings[value]
+        except KeyError:
+            strings[value] = len(strings)
+            return strings[value]
+
+    def write(value):
+        if isinstance(value, builtins.dict):
+            # computed values are encoded as their current result
+            items = [
+                (string(_key(key)), write(value[key] if type(c) is _computed else c))
+                for key, c in value.items()
+            ]
+            keys = builtins.list(value)
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            return emit(
+                b"".join(
+                    [b"m", _u32.pack(len(items))]
+                    + [_item.pack(*item) for item in items]
+                    + [struct.pack(f"<{len(order)}I", *order)]
+                )
+            )
+        if isinstance(value, (builtins.list, tuple, set, frozenset)):
+            offsets = [write(child) for child in value]
+            tag = (
+                b"l"
+                if isinstance(value, builtins.list)
+                else b"t" if isinstance(value, tuple) else b"e"
+            )
+            return emit(
+                tag
+                + _u32.pack(len(offsets))
+                + struct.pack(f"<{len(offsets)}Q", *offsets)
+            )
+        if value is None:
+            return emit(b"N")
+        if value is True:
+            return emit(b"T")
+        if value is False:
+            return emit(b"F")
+        if isinstance(value, int):
+            if -(2**63) <= value < 2**63:
+                return emit(b"i" + _i64.pack(value))
+            data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+            return emit(b"I" + _u32.pack(len(data)) + data)
+        if isinstance(value, float):
+            return emit(b"d" + _f64.pack(value))
+        if isinstance(value, str):
+            return emit(b"s" + _u32.pack(string(value)))
+        if isinstance(value, (bytes, bytearray)):
+            return emit(b"b" + _u64.pack(len(value)) + bytes(value))
+        raise TypeError(
+            f"Cannot encode value of type {type(value).__name__} in packed tree"
+        )
+
+    root = write(tree)
+
+    table = position
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    emit(struct.pack(f"<{len(offsets)}Q", *offsets))
+    for data in encoded:
+        emit(data)
+
+    file.seek(start)
+    file.write(_header.pack(MAGIC, VERSION, table, len(strings), root))
+    file.seek(start + position)
+
+
+def mmap_dump(tree, path):
+    """
+    Write a tree to a file in the packed format, to be opened with
+    :code:`easytree.mmap_open`
+
+    Parameters
+    ----------
+    tree : dict, list
+        the tree, whose keys must be strings
+    path : str, os.PathLike
+        the path of the file
+
+    Raises
+    ------
+    TypeError
+        if a key is not a string, or a value cannot be encoded
+    """
+    with open(path, "wb") as file:
+        _encode(tree, file)
+
+
+def mmap_open(path):
+    """
+    Open a packed tree file (see :code:`easytree.mmap_dump`) as a read-only tree
+
+    The file is memory-mapped, and only the nodes which are accessed are
+    decoded, such that opening a file is instantaneous and uses little memory,
+    regardless of its size.
+
+    Parameters
+    ----------
+    path : str, os.PathLike
+        the path of the file
+
+    Returns
+    -------
+    tree : PackedDict, PackedList
+        the root of the tree
+
+    Raises
+    ------
+    ValueError
+        if the file is not a packed tree
+
+    Example
+    -------
+    >>> easytree.mmap_dump({"countries": {"FR": {"name": "France"}}}, "reference.etpk")
+    >>> reference = easytree.mmap_open("reference.etpk")
+    >>> reference.countries.FR.name
+    "France"
+    >>> reference.get(["countries", "XX", "name"])
+    None
+    """
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"File '{path}' is not a packed easytree") from None
+    return _reader(mapped, owner=mapped).root()
+
+
+def load(buffer):
+    """
+    Returns a read-only view of the root node of a packed tree
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        the packed tree (e.g. bytes, a memory-mapped file, shared memory)
+
+    Returns
+    -------
+    root : PackedDict, PackedList
+        the root of the tree
+
+    Raises
+    ------
+    ValueError
+        if the buffer is not a packed tree
+    """
+    return _reader(buffer).root()
+
+
+def _key(key):
+    """
+    Check the key is a string
+    """
+    if not isinstance(key, str):
+        raise TypeError(
+            f"Packed trees only support string keys, received {type(key).__name__}"
+        )
+    return key
+
+
+class _reader:
+    """
+    Reads nodes from a packed buffer, caching decoded strings
+    """
+
+    # the buffer is released before its owner when the reader is deallocated
+    __slots__ = ("buffer", "owner", "table", "count", "strings", "offset")
+
+    def __init__(self, buffer, owner=None):
+        self.buffer = memoryview(buffer).cast("B")
+        self.owner = owner
+        if len(self.buffer) < _header.size:
+            raise ValueError("Buffer is not a packed easytree")
+        magic, version, table, count, root = _header.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Buffer is not a packed easytree")
+        if version != VERSION:
+            raise ValueError(f"Unsupported packed easytree version {version}")
+        self.table = table
+        self.count = count
+        self.strings = [None] * count
+        self.offset = root
+
+    def root(self):
+        return self.read(self.offset)
+
+    def close(self):
+        """
+        Release the buffer, then close its owner (if any)
+        """
+        self.buffer.release()
+        if self.owner is not None:
+            self.owner.close()
+
+    def string(self, index):
+        value = self.strings[index]
+        if value is None:
+            start, end = struct.unpack_from("<QQ", self.buffer, self.table + 8 * index)
+            base = self.table + 8 * (self.count + 1)
+            value = self.strings[index] = str(
+                self.buffer[base + start : base + end], "utf-8"
+            )
+        return value
+
+    def read(self, offset):
+        buffer = self.buffer
+        tag = buffer[offset]
+        if tag == 0x6D:  # m
+            return PackedDict(self, offset)
+        if tag == 0x6C:  # l
+            return PackedList(self, offset)
+        if tag == 0x73:  # s
+            return self.string(_u32.unpack_from(buffer, offset + 1)[0])
+        if tag == 0x69:  # i
+            return _i64.unpack_from(buffer, offset + 1)[0]
+        if tag == 0x64:  # d
+            return _f64.unpack_from(buffer, offset + 1)[0]
+        if tag == 0x4E:  # N
+            return None
+        if tag == 0x54:  # T
+            return True
+        if tag == 0x46:  # F
+            return False
+        if tag == 0x49:  # I
+            (length,) = _u32.unpack_from(buffer, offset + 1)
+            return int.from_bytes(
+                buffer[offset + 5 : offset + 5 + length], "little", signed=True
+            )
+        if tag == 0x62:  # b
+            (length,) = _u64.unpack_from(buffer, offset + 1)
+            return bytes(buffer[offset + 9 : offset + 9 + length])
+        if tag == 0x74:  # t
+            return tuple(PackedList(self, offset))
+        if tag == 0x65:  # e
+            return set(PackedList(self, offset))
+        raise ValueError(f"Invalid packed node at offset {offset}")
+
+
+class PackedDict(collections.abc.Mapping):
+    """
+    Read-only view of a dict node of a packed tree
+
+    Values are decoded when accessed. Keys can be read with the dot notation,
+    or with the item notation, as with a frozen :code:`easytree.dict`.
+
+    Example
+    -------
+    >>> data = easytree.packed.encode({"address": {"city": "London"}})
+    >>> tree = easytree.packed.load(data)
+    >>> tree.address.city
+    "London"
+    >>> tree.get(["address", "country"], "N/A")
+    "N/A"
+    """
+
+    __slots__ = ("_reader", "_offset", "_count")
+
+    def __init__(self, reader, offset):
+        self._reader = reader
+        self._offset = offset
+        (self._count,) = _u32.unpack_from(reader.buffer, offset + 1)
+
+    def _key(self, position):
+        (index,) = _u32.unpack_from(
+            self._reader.buffer, self._offset + 5 + _item.size * position
+        )
+        return self._reader.string(index)
+
+    def _value(self, position):
+        (offset,) = _u64.unpack_from(
+            self._reader.buffer, self._offset + 9 + _item.size * position
+        )
+        return self._reader.read(offset)
+
+    def _find(self, key):
+        """
+        Returns the position of the key, or -1, by binary search
+        """
+        if not isinstance(key, str):
+            return -1
+        buffer = self._reader.buffer
+        order = self._offset + 5 + _item.size * self._count
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (position,) = _u32.unpack_from(buffer, order + 4 * middle)
+            candidate = self._key(position)
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return position
+        return -1
+
+    def __getitem__(self, key):
+        position = self._find(key)
+        if position < 0:
+            raise KeyError(f"packed easytree.dict has no value for '{key}'")
+        return self._value(position)
+
+    def __getattr__(self, key):
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)  # e.g. copy and pickle protocols
+        position = self._find(key)
+        if position < 0:
+            raise AttributeError(f"packed easytree.dict has no attribute '{key}'")
+        return self._value(position)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (self._key(position) for position in range(self._count))
+
+    def keys(self):
+        return builtins.list(self)
+
+    def values(self):
+        return [self._value(position) for position in range(self._count)]
+
+    def items(self):
+        return [
+            (self._key(position), self._value(position))
+            for position in range(self._count)
+        ]
+
+    def get(self, key, default=None):
+        """
+        Get item by key, if it is exists; otherwise, return default
+
+        If key is list, recursively traverses the tree
+
+        Parameters
+        ----------
+        key : hashable, list[hashable]
+            the key (or path of keys)
+
+        Returns
+        -------
+        value : any
+        """
+        if isinstance(key, builtins.list):
+            return _lookup(self, key, default)
+        position = self._find(key)
+        return default if position < 0 else self._value(position)
+
+    def materialize(self):
+        """
+        Returns the node decoded into a frozen :code:`easytree.dict`
+        """
+        return cast(_decode(self), frozen=True)
+
+    def __repr__(self):
+        return repr(_decode(self))
+
+
+class PackedList(collections.abc.Sequence):
+    """
+    Read-only view of a list node of a packed tree
+
+    Items are decoded when accessed.
+    """
+
+    __slots__ = ("_reader", "_offset", "_count")
+
+    def __init__(self, reader, offset):
+        self._reader = reader
+        self._offset = offset
+        (self._count,) = _u32.unpack_from(reader.buffer, offset + 1)
+
+    def _value(self, position):
+        (offset,) = _u64.unpack_from(
+            self._reader.buffer, self._offset + 5 + 8 * position
+        )
+        return self._reader.read(offset)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._value(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("packed easytree.list index out of range")
+        return self._value(index)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (self._value(position) for position in range(self._count))
+
+    def __eq__(self, other):
+        if isinstance(other, (builtins.list, PackedList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def materialize(self):
+        """
+        Returns the node decoded into a frozen :code:`easytree.list`
+        """
+        return cast(_decode(self), frozen=True)
+
+    def __repr__(self):
+        return repr(_decode(self))
+
+
+def _decode(node):
+    """
+    Decode a packed node into builtin values
+    """
+    if isinstance(node, PackedDict):
+        return {key: _decode(value) for key, value in node.items()}
+    if isinstance(node, PackedList):
+        return [_decode(value) for value in node]
+    return node
@@ -0,0 +1,168 @@
+import builtins
+
+from .types import dict, cast
+from .computing import computed as _computed
+
+_getitem = builtins.dict.__getitem__
+
+
+def compile_schema(template, *, frozen: bool = False, name: str = "record"):
+    """
+    Compile a template into a specialized, sealed :code:`easytree.dict` class
+
+    The keys of the template define the (fixed) key set of the records, and
+    its values are used as defaults for keys missing from the constructor
+    arguments. Nested dicts are compiled recursively into their own record
+    classes; other values (including lists) are cast as usual.
+
+    Parameters
+    ----------
+    template : dict
+        the template of the records
+    frozen : bool
+        True if records are frozen, False otherwise
+    name : str
+        the name of the compiled class
+
+    Returns
+    -------
+    record : type
+        a sealed subclass of :code:`easytree.dict`
+
+    Note
+    ----
+    Compiled records hold their :code:`_sealed` and :code:`_frozen` flags on
+    the class rather than on each instance, such that records do not allocate
+    a per-instance :code:`__dict__`, and expose their string keys as
+    precomputed class-level accessors, which bypass the fallback to
+    :code:`__getattr__` on dot access.
+
+    Records are pickled as sealed :code:`easytree.dict` instances. Unsealed
+    records accept keys outside of the template, and keep them when they are
+    frozen or sealed.
+
+    Example
+    -------
+    >>> Person = easytree.compile_schema({"name": None, "address": {"city": None}})
+    >>> person = Person({"name": "David", "address": {"city": "London"}})
+    >>> person.address.city
+    "London"
+    >>> person.age = 31
+    AttributeError: cannot define attribute 'age' on sealed easytree.dict
+    """
+    if not isinstance(template, builtins.dict):
+        raise TypeError(
+            f"Expected template to be instance of dict, received {type(template).__name__}"
+        )
+
+    defaults = {}
+    nested = {}
+    for key, value in template.items():
+        if isinstance(value, builtins.dict):
+            nested[key] = compile_schema(value, frozen=frozen, name=f"{name}.{key}")
+        else:
+            defaults[key] = value
+
+    fields = tuple(template.keys())
+    keyset = frozenset(fields)
+    default_frozen = frozen
+
+    def __init__(
+        self,
+        *args,
+        sealed: bool = True,
+        frozen: bool = default_frozen,
+        intern=None,
+        **kwargs,
+    ):
+        values = builtins.dict(*args, **kwargs)
+        extra = None
+        if len(values) > len(fields) or not keyset.issuperset(values):
+            extra = [key for key in values if key not in keyset]
+            # records which are re-cast (e.g. frozen or sealed) keep their keys
+            if sealed and not (args and isinstance(args[0], type(self))):
+                raise KeyError(f"sealed easytree.dict has no value for '{extra[0]}'")
+
+        builtins.dict.__init__(
+            self,
+            {
+                key: _build(
+                    nested.get(key),
+                    values[key] if key in values else defaults.get(key),
+                    sealed,
+                    frozen,
+                    intern,
+                )
+                for key in fields
+            },
+        )
+        if extra is not None:
+            builtins.dict.update(
+                self,
+                {
+                    key: cast(values[key], sealed=sealed, frozen=frozen, intern=intern)
+                    for key in extra
+                },
+            )
+        # flags are only stored on the instance if they differ from the class
+        if sealed is not True:
+            self._sealed = sealed
+        if frozen is not default_frozen:
+            self._frozen = frozen
+
+    def __reduce__(self):
+        """
+        Pickling
+        """
+        state = {"_sealed": self._sealed, "_frozen": self._frozen}
+        return dict, (), state, None, iter(self.items())
+
+    namespace = {
+        "__slots__": (),
+        "__init__": __init__,
+        "__reduce__": __reduce__,
+        # fields are class-level accessors, see easytree.fastaccess
+        "__getattribute__": object.__getattribute__,
+        "_sealed": True,
+        "_frozen": frozen,
+        "_fields": fields,
+    }
+    for key in fields:
+        if isinstance(key, str) and key.isidentifier() and not hasattr(dict, key):
+            namespace[key] = _accessor(key)
+
+    return type(name, (dict,), namespace)
+
+
+def _build(record, value, sealed, frozen, intern=None):
+    """
+    Cast a value to its compiled record class, if any
+
+    The keys of records are the keys of the compiled template, and are
+    therefore shared by all records without interning.
+    """
+    if record is None:
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+    if value is None:
+        value = {}
+    if type(value) is record and value._sealed is sealed and value._frozen is frozen:
+        return value
+    return record(value, sealed=sealed, frozen=frozen, intern=intern)
+
+
+def _accessor(key):
+    """
+    Returns a read-only property to a field of a record
+    """
+
+    def getter(self):
+        try:
+            value = _getitem(self, key)
+        except KeyError:
+            # the record was unsealed and the key was removed
+            return self.__getattr__(key)
+        if type(value) is _computed:
+            return value._get(self, key)
+        return value
+
+    return property(getter, doc=f"value at '{key}'")
@@ -0,0 +1,193 @@
+import builtins
+
+from .types import cast, _rebuild
+
+
+class SchemaError(ValueError):
+    """
+    Raised when a value does not match a schema
+
+    Attributes
+    ----------
+    reason : str
+        the reason of the failure
+    path : tuple
+        the path of keys (and indices) to the failing value
+    """
+
+    def __init__(self, reason: str, path: tuple = ()):
+        super().__init__(reason, path)
+        self.reason = reason
+        self.path = path
+
+    def __str__(self):
+        if not self.path:
+            return self.reason
+        return f"{self.reason} at '{_format(self.path)}'"
+
+
+class Schema:
+    """
+    Compiled schema of a dict (or list) node, to validate payloads while
+    they are cast (see the :code:`schema` argument of :code:`easytree.dict`
+    and :code:`easytree.list`)
+
+    The specification maps keys to the expected types of their values:
+
+    - a type, or a tuple of types (None stands for :code:`type(None)`)
+    - a dict, for a nested dict node
+    - a list of one specification, for a list node whose items match it
+    - a :code:`Schema`, for a nested node with its own options
+
+    Parameters
+    ----------
+    spec : dict, list
+        the specification
+    optional : iterable
+        the keys which may be missing
+    extra : bool
+        True if keys which are not in the specification are allowed, False otherwise
+
+    Example
+    -------
+    >>> person = easytree.Schema(
+    ...     {"name": str, "age": int, "friends": [{"name": str}], "nickname": (str, None)},
+    ...     optional=["nickname"],
+    ... )
+    >>> easytree.dict({"name": "David", "age": "31", "friends": []}, schema=person)
+    Traceback (most recent call last):
+    easytree.SchemaError: expected int, received str at 'age'
+    """
+
+    __slots__ = ("_fields", "_required", "_extra", "_items")
+
+    def __init__(self, spec, *, optional=(), extra: bool = False):
+        if isinstance(spec, builtins.dict):
+            self._fields = {key: _compile(value) for key, value in spec.items()}
+            self._required = frozenset(self._fields).difference(optional)
+            self._extra = extra
+            self._items = None
+        elif isinstance(spec, builtins.list) and len(spec) == 1:
+            self._fields = None
+            self._required = frozenset()
+            self._extra = extra
+            self._items = _compile(spec[0])
+        else:
+            raise TypeError(
+                "Expected the specification to be a dict, or a list of one item"
+            )
+
+    def _cast(self, value, sealed, frozen, intern):
+        """
+        Returns the value cast into a node, validated against the schema
+        """
+        if self._fields is not None:
+            if not isinstance(value, builtins.dict):
+                raise SchemaError(f"expected dict, received {type(value).__name__}")
+            children = self._items_of(value, sealed, frozen, intern)
+        elif not isinstance(value, builtins.list):
+            raise SchemaError(f"expected list, received {type(value).__name__}")
+        else:
+            children = self._values_of(value, sealed, frozen, intern)
+        # nodes keep their type (e.g. thread-safe nodes, or compiled records)
+        return _rebuild(value, children, sealed, frozen)
+
+    def _items_of(self, items, sealed, frozen, intern):
+        """
+        Returns the cast items of a dict node, validated against the schema
+        """
+        if self._fields is None:
+            raise SchemaError("expected list, received dict")
+        fields = self._fields
+        extra = self._extra
+        result = {}
+        for key, value in items.items():
+            spec = fields.get(key)
+            try:
+                if spec is None:
+                    if not extra:
+                        raise SchemaError("unexpected key")
+                    value = cast(value, sealed=sealed, frozen=frozen, intern=intern)
+                else:
+                    value = _validate(spec, value, sealed, frozen, intern)
+            except SchemaError as error:
+                raise SchemaError(error.reason, (key,) + error.path) from None
+            result[key if intern is None else intern.key(key)] = value
+        if len(result) < len(self._required) or not self._required.issubset(result):
+            for key in fields:
+                if key in self._required and key not in result:
+                    raise SchemaError("missing key", (key,))
+        return result
+
+    def _values_of(self, values, sealed, frozen, intern):
+        """
+        Returns the cast values of a list node, validated against the schema
+        """
+        if self._items is None:
+            raise SchemaError("expected dict, received list")
+        spec = self._items
+        result = []
+        for index, value in enumerate(values):
+            try:
+                result.append(_validate(spec, value, sealed, frozen, intern))
+            except SchemaError as error:
+                raise SchemaError(error.reason, (index,) + error.path) from None
+        return result
+
+    def __repr__(self):
+        if self._fields is None:
+            return f"Schema([{_repr(self._items)}])"
+        fields = ", ".join(f"{k!r}: {_repr(v)}" for k, v in self._fields.items())
+        return f"Schema({{{fields}}})"
+
+
+def _compile(spec):
+    """
+    Compile the specification of a value into a Schema, or a tuple of types
+    """
+    if isinstance(spec, Schema):
+        return spec
+    if isinstance(spec, (builtins.dict, builtins.list)):
+        return Schema(spec)
+    if spec is None:
+        return (type(None),)
+    if isinstance(spec, type):
+        return (spec,)
+    if isinstance(spec, tuple) and all(t is None or isinstance(t, type) for t in spec):
+        return tuple(type(None) if t is None else t for t in spec)
+    raise TypeError(f"Invalid specification: {spec!r}")
+
+
+def _validate(spec, value, sealed, frozen, intern):
+    """
+    Returns the value cast, after validating it against its compiled specification
+    """
+    if type(spec) is tuple:
+        if not isinstance(value, spec):
+            raise SchemaError(
+                f"expected {' or '.join(t.__name__ for t in spec)}, "
+                f"received {type(value).__name__}"
+            )
+        return cast(value, sealed=sealed, frozen=frozen, intern=intern)
+    return spec._cast(value, sealed, frozen, intern)
+
+
+def _repr(spec):
+    if type(spec) is tuple:
+        if len(spec) == 1:
+            return spec[0].__name__
+        return f"({', '.join(t.__name__ for t in spec)})"
+    return repr(spec)
+
+
+def _format(path):
+    """
+    Format a path of keys and indices, e.g. friends[0].name
+    """
+    text = ""
+    for key in path:
+        if isinstance(key, int):
+            text += f"[{key}]"
+        else:
+            text += f".{key}" if text else str(key)
+    return text
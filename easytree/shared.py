@@ -0,0 +1,139 @@
+import atexit
+from multiprocessing import shared_memory
+
+from . import packed
+
+# readers of the shared memory blocks attached in this process, by name
+_attached = {}
+
+
+def share(tree):
+    """
+    Encode a tree once into shared memory, to be read by other processes
+    without copying
+
+    The returned handle is cheap to pickle (only the name of the shared memory
+    block is pickled), and can be passed to the workers of a
+    :code:`multiprocessing` or :code:`concurrent.futures.ProcessPoolExecutor`
+    pool, in which its :code:`tree` property returns a read-only view of the tree,
+    which decodes nodes when they are accessed.
+
+    Parameters
+    ----------
+    tree : dict, list
+        the tree, whose keys must be strings
+
+    Returns
+    -------
+    shared : SharedTree
+        a handle to the shared tree
+
+    Example
+    -------
+    >>> def work(shared, key):
+    ...     return shared.tree.prices[key]
+
+    >>> with easytree.share(prices) as shared:
+    ...     with concurrent.futures.ProcessPoolExecutor() as pool:
+    ...         results = list(pool.map(work, itertools.repeat(shared), keys))
+    """
+    data = packed.encode(tree)
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    block.buf[: len(data)] = data
+    return SharedTree(block.name, block=block)
+
+
+class SharedTree:
+    """
+    Handle to a tree encoded in shared memory (see :code:`easytree.share`)
+
+    The process which created the tree owns the shared memory, and must
+    release it by calling :code:`unlink` (or exiting the context manager)
+    once all processes are done reading the tree.
+
+    Other processes detach the block when they exit, or when they call
+    :code:`close`, after which the views of the tree cannot be read.
+    """
+
+    def __init__(self, name: str, *, block=None):
+        self._name = name
+        self._block = block
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the shared memory block
+        """
+        return self._name
+
+    @property
+    def tree(self):
+        """
+        Returns the read-only view of the tree, attaching to the
+        shared memory block on first access in this process
+
+        Returns
+        -------
+        tree : easytree.packed.PackedDict, easytree.packed.PackedList
+        """
+        reader = _attached.get(self._name)
+        if reader is None:
+            block = shared_memory.SharedMemory(name=self._name)
+            reader = _attached[self._name] = packed._reader(block.buf, owner=block)
+        return reader.root()
+
+    def unlink(self):
+        """
+        Release the shared memory block
+
+        Processes which attached the block can keep reading the views they
+        hold, but no process can attach it anymore.
+
+        Raises
+        ------
+        RuntimeError
+            if the handle was not created by :code:`easytree.share` in this process
+        """
+        if self._block is None:
+            raise RuntimeError("Only the process sharing the tree can unlink it")
+        self.close()
+        self._block.unlink()
+        self._block.close()
+        self._block = None
+
+    def close(self):
+        """
+        Detach the shared memory block from this process, if it is attached
+
+        The views of the tree read in this process cannot be read anymore.
+        """
+        reader = _attached.pop(self._name, None)
+        if reader is not None:
+            reader.close()
+
+    def __reduce__(self):
+        """
+        Pickling, by name
+        """
+        return SharedTree, (self._name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        if self._block is not None:
+            self.unlink()
+
+    def __repr__(self):
+        return f"<SharedTree '{self._name}'>"
+
+
+@atexit.register
+def _detach():
+    """
+    Detach the shared memory blocks attached in this process, such that their
+    buffers are released before the interpreter closes the blocks
+    """
+    while _attached:
+        _, reader = _attached.popitem()
+        reader.close()
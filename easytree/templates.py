@@ -0,0 +1,237 @@
+"""
+Precompiled tree templates, rendered into new trees at a small cost
+
+A template is compiled once from a tree whose values may be placeholders.
+Compiling casts every subtree without placeholders into a frozen node, once,
+such that rendering only allocates the nodes on the paths to placeholders,
+and shares the constant subtrees between all the rendered trees.
+"""
+
+import builtins
+
+from .types import cast, dict, list, _deepcopy
+
+_missing = object()
+
+# flags of the constant (shared) nodes
+_constant = {"_sealed": False, "_frozen": True}
+
+
+class placeholder:
+    """
+    Placeholder of a value in a template (see :code:`easytree.template`)
+
+    Parameters
+    ----------
+    name : str
+        the name of the value, passed as a keyword argument to :code:`render`
+    default : any, optional
+        the value used when the name is not passed to :code:`render`
+
+    Example
+    -------
+    >>> easytree.placeholder("title", default="untitled")
+    placeholder('title', default='untitled')
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default=_missing):
+        if not isinstance(name, str) or not name.isidentifier():
+            raise ValueError(f"Invalid placeholder name: {name!r}")
+        self.name = name
+        self.default = default
+
+    def __repr__(self):
+        if self.default is _missing:
+            return f"placeholder({self.name!r})"
+        return f"placeholder({self.name!r}, default={self.default!r})"
+
+
+def template(tree, *, sealed: bool = False, frozen: bool = False):
+    """
+    Compile a tree, whose values may be placeholders, into a template
+
+    Parameters
+    ----------
+    tree : dict, list
+        the tree, with :code:`easytree.placeholder` values
+    sealed : bool
+        True if the rendered nodes are sealed, False otherwise
+    frozen : bool
+        True if the rendered nodes are frozen, False otherwise
+
+    Returns
+    -------
+    template : easytree.templates.Template
+        the compiled template
+
+    Example
+    -------
+    >>> chart = easytree.template(
+    ...     {
+    ...         "axes": [{"title": {"text": easytree.placeholder("x")}}],
+    ...         "legend": {"position": "bottom", "visible": True},
+    ...     }
+    ... )
+    >>> tree = chart.render(x="time")
+    >>> tree.axes[0].title.text
+    'time'
+    >>> tree.legend is chart.render(x="date").legend  # shared, frozen
+    True
+    """
+    return Template(tree, sealed=sealed, frozen=frozen)
+
+
+class Template:
+    """
+    Compiled template (see :code:`easytree.template`)
+
+    The root, and the nodes which contain placeholders, are allocated by each
+    call to :code:`render`, with the flags of the template, and the values of
+    the placeholders are cast at each of their occurrences. The subtrees without
+    placeholders are frozen nodes, shared by all the rendered trees: they
+    must be copied to be modified, e.g. with :code:`easytree.unfreeze`,
+    which also copies them when it unfreezes a rendered tree in place.
+    """
+
+    __slots__ = ("_root", "_names", "_required", "_state")
+
+    def __init__(self, tree, *, sealed: bool = False, frozen: bool = False):
+        names = {}
+        root = _compile(tree, names)
+        if isinstance(root, dict):
+            # the root is allocated by each render, with the flags of the template
+            root = _node(type(root), builtins.list(root), builtins.list(root.values()))
+        elif isinstance(root, list):
+            root = _node(type(root), None, builtins.list(root))
+        self._root = root
+        self._names = names
+        self._required = frozenset(
+            name for name, default in names.items() if default is _missing
+        )
+        self._state = {"_sealed": sealed, "_frozen": frozen}
+
+    @property
+    def placeholders(self):
+        """
+        The names of the placeholders of the template
+        """
+        return frozenset(self._names)
+
+    def render(self, **values):
+        """
+        Build a new tree from the template, with the values of its placeholders
+
+        Parameters
+        ----------
+        **values : any
+            the values of the placeholders, by name
+
+        Returns
+        -------
+        tree : easytree.dict, easytree.list, any
+            the rendered tree
+
+        Raises
+        ------
+        TypeError
+            if a placeholder without default has no value, or if a value
+            is passed for an unknown placeholder
+        """
+        names = self._names
+        for name in values:
+            if name not in names:
+                raise TypeError(f"unknown placeholder '{name}'")
+        if len(values) < len(self._required) or not self._required.issubset(values):
+            missing = sorted(self._required.difference(values))
+            raise TypeError(f"missing value for placeholder '{missing[0]}'")
+        values = {name: values.get(name, default) for name, default in names.items()}
+        return _render(self._root, values, self._state, set())
+
+    def __call__(self, **values):
+        return self.render(**values)
+
+    def __repr__(self):
+        return f"<Template placeholders={sorted(self._names)}>"
+
+
+class _node:
+    """
+    Compiled node of a template, which contains at least one placeholder
+    """
+
+    __slots__ = ("cls", "keys", "items")
+
+    def __init__(self, cls, keys, items):
+        self.cls = cls
+        self.keys = keys
+        self.items = items
+
+
+def _compile(value, names):
+    """
+    Returns the compiled value: a placeholder, a node (if it contains
+    placeholders), or the value cast into a frozen node
+    """
+    if isinstance(value, placeholder):
+        default = names.setdefault(value.name, value.default)
+        if default is not value.default and default != value.default:
+            raise ValueError(
+                f"placeholder '{value.name}' is defined with different defaults"
+            )
+        return value
+    if isinstance(value, builtins.dict):
+        cls = type(value) if isinstance(value, dict) else dict
+        keys = builtins.list(value)
+        items = [_compile(item, names) for item in value.values()]
+    elif isinstance(value, builtins.list):
+        cls = type(value) if isinstance(value, list) else list
+        keys = None
+        items = [_compile(item, names) for item in value]
+    else:
+        return cast(value, sealed=False, frozen=True)
+    compiled = _node(cls, keys, items)
+    if any(type(item) is placeholder or type(item) is _node for item in items):
+        return compiled
+    # the children are constant already, and are shared by the frozen node
+    return _render(compiled, None, _constant, None)
+
+
+def _render(compiled, values, state, seen):
+    """
+    Returns the tree of a compiled value
+    """
+    cls = type(compiled)
+    if cls is placeholder:
+        return _value(compiled.name, values, state, seen)
+    if cls is not _node:
+        return compiled
+    items = []
+    for item in compiled.items:
+        kind = type(item)
+        if kind is placeholder:
+            item = _value(item.name, values, state, seen)
+        elif kind is _node:
+            item = _render(item, values, state, seen)
+        items.append(item)
+    node = compiled.cls.__new__(compiled.cls)
+    if compiled.keys is None:
+        builtins.list.extend(node, items)
+    else:
+        builtins.dict.update(node, zip(compiled.keys, items))
+    vars(node).update(state)
+    return node
+
+
+def _value(name, values, state, seen):
+    """
+    Returns the value of a placeholder, cast for each of its occurrences
+    """
+    value = values[name]
+    cast_value = cast(value, sealed=state["_sealed"], frozen=state["_frozen"])
+    if name in seen and cast_value is value and isinstance(value, (dict, list)):
+        # a node inserted as is, which is copied at its other occurrences
+        return _deepcopy(value)
+    seen.add(name)
+    return cast_value
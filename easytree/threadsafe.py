@@ -0,0 +1,340 @@
+"""
+Thread-safe easytree nodes
+
+The :code:`easytree.threadsafe.dict` and :code:`easytree.threadsafe.list` types
+behave like their :code:`easytree` counterparts, but serialize their mutations,
+and the casting of their :code:`undefined` nodes, such that concurrent writes
+to a tree are never lost.
+
+Example
+-------
+>>> tree = easytree.threadsafe.dict()
+>>> # in thread 1
+>>> tree.a.b = 1
+>>> # in thread 2
+>>> tree.a.c = 2
+>>> tree
+{"a": {"b": 1, "c": 2}}
+
+Note
+----
+Locks are striped: each node is assigned one of a fixed pool of re-entrant
+locks based on its identity, rather than a lock of its own (which would cost
+memory for each node) or a single global lock (which would serialize writes
+to unrelated nodes). At most one lock is held at any time, such that writes
+cannot deadlock.
+
+Individual reads are atomic, but iterating over a node while another thread
+mutates it is not safe. Use :code:`easytree.threadsafe.lock` to make a sequence
+of operations on a node atomic.
+"""
+
+import builtins
+import itertools
+import threading
+
+from . import types
+from .interning import interner as _interner
+
+_stripes = 64
+_locks = [threading.RLock() for _ in range(_stripes)]
+
+
+def lock(node):
+    """
+    Returns the (re-entrant) lock of a node
+
+    Parameters
+    ----------
+    node : dict, list
+        the node
+
+    Returns
+    -------
+    lock : threading.RLock
+        the lock of the node
+
+    Example
+    -------
+    >>> with easytree.threadsafe.lock(tree.counters):
+    ...     tree.counters.hits = tree.counters.get("hits", 0) + 1
+    """
+    return _locks[(id(node) >> 4) % _stripes]
+
+
+def cast(value, *, sealed: bool = False, frozen: bool = False, intern=None):
+    """
+    Convert a value to a thread-safe easytree object, when possible, based on its type.
+
+    Parameters
+    ----------
+    value : any
+        the value to cast to an easytree type
+    sealed : bool
+        True if cast object is sealed, False otherwise
+    frozen : bool
+        True if cast object is frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None
+
+    Returns
+    -------
+    cast : any
+        the cast value, or value itself, as the case may be
+    """
+    if intern is not None:
+        intern = _interner(intern)
+    if isinstance(value, (list, dict)):
+        if value._sealed is sealed and value._frozen is frozen:
+            return value
+        if intern is None:
+            return type(value)(value, sealed=sealed, frozen=frozen)
+        return type(value)(value, sealed=sealed, frozen=frozen, intern=intern)
+    if isinstance(value, builtins.dict):
+        return dict(value, sealed=sealed, frozen=frozen, intern=intern)
+    if isinstance(value, builtins.list):
+        return list(value, sealed=sealed, frozen=frozen, intern=intern)
+    if isinstance(value, tuple):
+        return tuple(
+            cast(x, sealed=sealed, frozen=frozen, intern=intern) for x in value
+        )
+    if isinstance(value, set):
+        return {cast(x, sealed=sealed, frozen=frozen, intern=intern) for x in value}
+    if intern is not None:
+        return intern.value(value)
+    return value
+
+
+class list(types.list):
+    """
+    Thread-safe :code:`easytree.list`
+    """
+
+    def __init__(
+        self,
+        args=None,
+        *,
+        sealed: bool = False,
+        frozen: bool = False,
+        intern=None,
+        schema=None,
+        convert=None,
+    ):
+        if schema is not None and convert is not None:
+            raise TypeError("schema and convert cannot be used together")
+        if schema is not None:
+            args = schema._values_of(args or [], sealed, frozen, _interner(intern))
+        elif convert is not None:
+            args = convert._values_of(args or [], sealed, frozen, _interner(intern))
+        super().__init__(
+            [
+                cast(arg, sealed=sealed, frozen=frozen, intern=intern)
+                for arg in (args or [])
+            ],
+            sealed=sealed,
+            frozen=frozen,
+        )
+
+    def __setitem__(self, key, value):
+        value = cast(value, sealed=self._sealed, frozen=self._frozen)
+        with lock(self):
+            return super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with lock(self):
+            return super().__delitem__(key)
+
+    def append(self, *args, **kwargs):
+        if kwargs and not args:
+            args, kwargs = (kwargs,), {}
+        args = [cast(arg, sealed=self._sealed, frozen=self._frozen) for arg in args]
+        with lock(self):
+            return super().append(*args, **kwargs)
+
+    def extend(self, other):
+        other = [cast(v, sealed=self._sealed, frozen=self._frozen) for v in other]
+        with lock(self):
+            return super().extend(other)
+
+    def ingest(self, iterable, *, chunk_size: int = 1000, intern=None) -> int:
+        if self._frozen:
+            raise TypeError("cannot ingest into frozen easytree.list")
+        if self._sealed:
+            raise TypeError("cannot ingest into sealed easytree.list")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, received {chunk_size}")
+        if iterable is self:
+            iterable = builtins.list(iterable)
+        intern = _interner(intern)
+        iterator = iter(iterable)
+        count = 0
+        while True:
+            chunk = [
+                cast(value, sealed=self._sealed, frozen=self._frozen, intern=intern)
+                for value in itertools.islice(iterator, chunk_size)
+            ]
+            if not chunk:
+                return count
+            # the chunk is appended atomically, but not the whole iterable
+            with lock(self):
+                if types._watchers:
+                    types._mutated(self)
+                builtins.list.extend(self, chunk)
+            count += len(chunk)
+            if len(chunk) < chunk_size:
+                return count
+
+    def insert(self, index: int, value):
+        value = cast(value, sealed=self._sealed, frozen=self._frozen)
+        with lock(self):
+            return super().insert(index, value)
+
+    def remove(self, x):
+        with lock(self):
+            return super().remove(x)
+
+    def pop(self, *args):
+        with lock(self):
+            return super().pop(*args)
+
+    def clear(self):
+        with lock(self):
+            return super().clear()
+
+    def sort(self, *, key=None, reverse: bool = False):
+        with lock(self):
+            return super().sort(key=key, reverse=reverse)
+
+    def reverse(self):
+        with lock(self):
+            return super().reverse()
+
+    def copy(self, deep: bool = False):
+        with lock(self):
+            return super().copy(deep=deep)
+
+
+class dict(types.dict):
+    """
+    Thread-safe :code:`easytree.dict`
+    """
+
+    def __init__(
+        self,
+        *args,
+        sealed: bool = False,
+        frozen: bool = False,
+        intern=None,
+        schema=None,
+        convert=None,
+        **kwargs,
+    ):
+        if schema is not None and convert is not None:
+            raise TypeError("schema and convert cannot be used together")
+        items = builtins.dict(*args, **kwargs)
+        if schema is not None:
+            items = schema._items_of(items, sealed, frozen, _interner(intern))
+        elif convert is not None:
+            items = convert._items_of(items, sealed, frozen, _interner(intern))
+        super().__init__(
+            {
+                k: cast(v, sealed=sealed, frozen=frozen, intern=intern)
+                for k, v in items.items()
+            },
+            sealed=sealed,
+            frozen=frozen,
+            intern=intern,
+        )
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if type(value) is types.undefined:
+            return undefined(parent=self, key=key)
+        return value
+
+    def __getattr__(self, key):
+        value = super().__getattr__(key)
+        if type(value) is types.undefined:
+            return undefined(parent=self, key=key)
+        return value
+
+    def __setitem__(self, key, value):
+        with lock(self):
+            return super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with lock(self):
+            return super().__delitem__(key)
+
+    def __setattr__(self, key, value):
+        if key in ["_sealed", "_frozen"]:
+            return super().__setattr__(key, value)
+        value = cast(value, sealed=self._sealed, frozen=self._frozen)
+        with lock(self):
+            return super().__setattr__(key, value)
+
+    def __delattr__(self, key):
+        with lock(self):
+            return super().__delattr__(key)
+
+    def setdefault(self, key, default):
+        default = cast(default, sealed=self._sealed, frozen=self._frozen)
+        with lock(self):
+            return super().setdefault(key, default)
+
+    @classmethod
+    def fromkeys(cls, keys, value):
+        return super().fromkeys(keys, cast(value))
+
+    def update(self, other):
+        other = {
+            k: cast(v, sealed=self._sealed, frozen=self._frozen)
+            for k, v in other.items()
+        }
+        with lock(self):
+            return super().update(other)
+
+    def clear(self):
+        with lock(self):
+            return super().clear()
+
+    def popitem(self):
+        with lock(self):
+            return super().popitem()
+
+    def pop(self, *args):
+        with lock(self):
+            return super().pop(*args)
+
+
+class undefined(types.undefined):
+    """
+    Thread-safe :code:`easytree.undefined` node, which is atomically
+    cast to a dict or list node
+    """
+
+    def _cast(self, type):
+        """
+        Casts to the desired type (dict or list), unless it has already been cast.
+        """
+        type = dict if issubclass(type, builtins.dict) else list
+
+        if isinstance(self._parent, types.undefined):
+            self._parent = self._parent._cast(dict)
+
+        with lock(self._parent):
+            if self._key not in self._parent:
+                self._parent[self._key] = type(sealed=self._sealed, frozen=self._frozen)
+            value = self._parent[self._key]
+
+        if not isinstance(value, type):
+            raise TypeError(
+                f"undefined node '{self._key}' already cast as a '{'dict' if type is list else 'list'}' node"
+            )
+        return value
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if type(value) is types.undefined:
+            return undefined(parent=self, key=key)
+        return value
@@ -1,8 +1,20 @@
 import builtins
+import copy
 import easytree
+import itertools
 
+from .computing import computed as _computed, _mutated, _watchers
+from .interning import interner as _interner
 
-def cast(value, *, sealed: bool = False, frozen: bool = False):
+_getitem = builtins.dict.__getitem__
+_getattribute = object.__getattribute__
+_flags = frozenset(["_frozen", "_sealed"])
+_attributes = {}
+
+
+def cast(
+    value, *, sealed: bool = False, frozen: bool = False, intern=None, convert=None
+):
     """
     Convert a value to an easytree object, when possible, based on its type.
 
@@ -18,25 +30,45 @@ def cast(value, *, sealed: bool = False, frozen: bool = False):
         True if cast object is sealed, False otherwise
     frozen : bool
         True if cast object is frozen, False otherwise
+    intern : bool, easytree.Interner, None
+        True to intern keys with the default interner, an interner, or None.
+        Nodes which already have the requested flags are returned as is,
+        without interning their keys.
+    convert : easytree.Converters, None
+        the converters to apply to the leaves of the value, by path
 
     Returns
     -------
     cast : any
         the cast value, or value itself, as the case may be
     """
+    if intern is not None:
+        intern = _interner(intern)
+    if convert is not None and isinstance(value, builtins.dict):
+        children = convert._items_of(value, sealed, frozen, intern)
+        return _rebuild(value, children, sealed, frozen)
+    if convert is not None and isinstance(value, builtins.list):
+        children = convert._values_of(value, sealed, frozen, intern)
+        return _rebuild(value, children, sealed, frozen)
     if isinstance(value, (list, dict)):
         if (easytree.sealed(value) is sealed) and (easytree.frozen(value) is frozen):
             return value
         # version 0.2.1 - allow for subclassing of easytree.dict and easytree.list
-        return type(value)(value, sealed=sealed, frozen=frozen)
+        if intern is None:
+            return type(value)(value, sealed=sealed, frozen=frozen)
+        return type(value)(value, sealed=sealed, frozen=frozen, intern=intern)
     if isinstance(value, builtins.dict):
-        return dict(value, sealed=sealed, frozen=frozen)
+        return dict(value, sealed=sealed, frozen=frozen, intern=intern)
     if isinstance(value, builtins.list):
-        return list(value, sealed=sealed, frozen=frozen)
+        return list(value, sealed=sealed, frozen=frozen, intern=intern)
     if isinstance(value, tuple):
-        return tuple(cast(x, sealed=sealed, frozen=frozen) for x in value)
+        return tuple(
+            cast(x, sealed=sealed, frozen=frozen, intern=intern) for x in value
+        )
     if isinstance(value, set):
-        return {cast(x, sealed=sealed, frozen=frozen) for x in value}
+        return {cast(x, sealed=sealed, frozen=frozen, intern=intern) for x in value}
+    if intern is not None:
+        return intern.value(value)
     return value
 
 
@@ -55,16 +87,56 @@ class list(builtins.list):
     frozen : bool
         True if list is frozen, False otherwise
 
+    intern : bool, easytree.Interner, None
+        True to intern the keys of nested dicts with the default interner,
+        an interner, or None for no interning (see :code:`easytree.Interner`)
+
+    schema : easytree.Schema, None
+        the schema against which the values are validated while they are cast
+
+    convert : easytree.Converters, None
+        the converters to apply to the leaves of the list, by path
+
+    Raises
+    ------
+    easytree.SchemaError
+        if the values do not match the schema
+
     Note
     ----
     Lists and dicts included or appended in the list
     are recursively sealed and frozen as per its containing parent.
     """
 
-    def __init__(self, args=None, *, sealed: bool = False, frozen: bool = False):
-        super().__init__(
-            [cast(arg, sealed=sealed, frozen=frozen) for arg in (args or [])]
-        )
+    def __init__(
+        self,
+        args=None,
+        *,
+        sealed: bool = False,
+        frozen: bool = False,
+        intern=None,
+        schema=None,
+        convert=None,
+    ):
+        if schema is not None and convert is not None:
+            raise TypeError("schema and convert cannot be used together")
+        if intern is not None:
+            intern = _interner(intern)
+        if schema is not None:
+            super().__init__(schema._values_of(args or [], sealed, frozen, intern))
+        elif convert is not None:
+            super().__init__(convert._values_of(args or [], sealed, frozen, intern))
+        elif intern is None:
+            super().__init__(
+                [cast(arg, sealed=sealed, frozen=frozen) for arg in (args or [])]
+            )
+        else:
+            super().__init__(
+                [
+                    cast(arg, sealed=sealed, frozen=frozen, intern=intern)
+                    for arg in (args or [])
+                ]
+            )
         self._sealed = sealed
         self._frozen = frozen
 
@@ -95,6 +167,8 @@ class list(builtins.list):
             raise TypeError("cannot set item on frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot set item on sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().__setitem__(
             key, cast(value, frozen=self._frozen, sealed=self._sealed)
         )
@@ -121,6 +195,8 @@ class list(builtins.list):
             raise TypeError("cannot delete item from frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot delete item from sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().__delitem__(key)
 
     def __enter__(self):
@@ -237,10 +313,13 @@ class list(builtins.list):
                 "append must take either one positional argument or one-to-many named arguments"
             )
 
-        super().append(
-            cast(args[0] if args else kwargs, sealed=self._sealed, frozen=self._frozen)
+        if _watchers:
+            _mutated(self)
+        value = cast(
+            args[0] if args else kwargs, sealed=self._sealed, frozen=self._frozen
         )
-        return self[len(self) - 1]
+        super().append(value)
+        return value
 
     def extend(self, other):
         """
@@ -267,9 +346,55 @@ class list(builtins.list):
             raise TypeError("cannot extend frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot extend sealed easytree.list")
-        return super().extend(
-            [cast(v, sealed=self._sealed, frozen=self._frozen) for v in other]
-        )
+        _ingest(self, other)
+
+    def __iadd__(self, other):
+        """
+        Extend the list in place, like :code:`extend` (i.e. :code:`tree += other`)
+        """
+        self.extend(other)
+        return self
+
+    def ingest(self, iterable, *, chunk_size: int = 1000, intern=None) -> int:
+        """
+        Append all the items of an iterable, which are cast (and appended)
+        in chunks, such that generators are consumed without being materialized
+
+        Parameters
+        ----------
+        iterable : iterable
+            the items (e.g. records from a stream)
+        chunk_size : int
+            the number of items cast and appended at once
+        intern : bool, easytree.Interner, None
+            True to intern the keys of the items with the default interner,
+            an interner, or None
+
+        Returns
+        -------
+        count : int
+            the number of items appended
+
+        Raises
+        ------
+        TypeError
+            if the list is sealed or frozen
+        ValueError
+            if chunk_size is not positive
+
+        Example
+        -------
+        >>> records = easytree.list()
+        >>> records.ingest((json.loads(line) for line in stream), intern=True)
+        250000
+        """
+        if self._frozen:
+            raise TypeError("cannot ingest into frozen easytree.list")
+        if self._sealed:
+            raise TypeError("cannot ingest into sealed easytree.list")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, received {chunk_size}")
+        return _ingest(self, iterable, chunk_size, intern)
 
     def insert(self, index: int, value):
         """
@@ -298,6 +423,8 @@ class list(builtins.list):
             raise TypeError("cannot insert into frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot insert into sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().insert(
             index, cast(value, sealed=self._sealed, frozen=self._frozen)
         )
@@ -326,6 +453,8 @@ class list(builtins.list):
             raise TypeError("cannot remove from frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot remove from sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().remove(x)
 
     def pop(self, *args):
@@ -347,6 +476,8 @@ class list(builtins.list):
             raise TypeError("cannot pop from frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot pop from sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().pop(*args)
 
     def clear(self):
@@ -366,6 +497,8 @@ class list(builtins.list):
             raise TypeError("cannot clear frozen easytree.list")
         if self._sealed:
             raise TypeError("cannot clear sealed easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().clear()
 
     def sort(self, *, key=None, reverse: bool = False):
@@ -383,6 +516,8 @@ class list(builtins.list):
         """
         if self._frozen:
             raise TypeError("cannot sort frozen easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().sort(key=key, reverse=reverse)
 
     def reverse(self):
@@ -400,18 +535,40 @@ class list(builtins.list):
         """
         if self._frozen:
             raise TypeError("cannot reverse frozen easytree.list")
+        if _watchers:
+            _mutated(self)
         return super().reverse()
 
-    def copy(self):
+    def copy(self, deep: bool = False):
         """
-        Return a shallow copy of the list
+        Return a copy of the list, of the same type and with the same flags
+
+        Parameters
+        ----------
+        deep : bool
+            True for a deep copy, which shares the frozen nodes of the list,
+            False for a shallow copy
 
         Returns
         -------
         copy : list
             the new list
         """
-        return list(self, frozen=self._frozen, sealed=self._sealed)
+        if deep:
+            return _deepcopy(self)
+        return _clone(self, self)
+
+    def __copy__(self):
+        """
+        Shallow copy (see :code:`copy.copy`)
+        """
+        return _clone(self, self)
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copy (see :code:`copy.deepcopy`)
+        """
+        return _deepcopy(self, memo)
 
 
 class dict(builtins.dict):
@@ -419,13 +576,40 @@ class dict(builtins.dict):
     recursive dot-styled defaultdict
     """
 
-    def __init__(self, *args, sealed: bool = False, frozen: bool = False, **kwargs):
-        super().__init__(
-            {
-                k: cast(v, sealed=sealed, frozen=frozen)
-                for k, v in builtins.dict(*args, **kwargs).items()
-            }
-        )
+    def __init__(
+        self,
+        *args,
+        sealed: bool = False,
+        frozen: bool = False,
+        intern=None,
+        schema=None,
+        convert=None,
+        **kwargs,
+    ):
+        if schema is not None and convert is not None:
+            raise TypeError("schema and convert cannot be used together")
+        if intern is not None:
+            intern = _interner(intern)
+        if schema is not None:
+            items = builtins.dict(*args, **kwargs)
+            super().__init__(schema._items_of(items, sealed, frozen, intern))
+        elif convert is not None:
+            items = builtins.dict(*args, **kwargs)
+            super().__init__(convert._items_of(items, sealed, frozen, intern))
+        elif intern is None:
+            super().__init__(
+                {
+                    k: cast(v, sealed=sealed, frozen=frozen)
+                    for k, v in builtins.dict(*args, **kwargs).items()
+                }
+            )
+        else:
+            super().__init__(
+                {
+                    intern.key(k): cast(v, sealed=sealed, frozen=frozen, intern=intern)
+                    for k, v in builtins.dict(*args, **kwargs).items()
+                }
+            )
         self._sealed: bool = sealed
         self._frozen: bool = frozen
 
@@ -441,7 +625,7 @@ class dict(builtins.dict):
             exist in the dict
         """
         try:
-            return super().__getitem__(key)
+            value = super().__getitem__(key)
         except KeyError:
             if self._frozen:
                 raise KeyError(
@@ -451,7 +635,10 @@ class dict(builtins.dict):
                 raise KeyError(
                     f"sealed easytree.dict has no value for '{key}'"
                 ) from None
-        return undefined(parent=self, key=key)
+            return undefined(parent=self, key=key)
+        if type(value) is _computed:
+            return value._get(self, key)
+        return value
 
     def __setitem__(self, key, value):
         """
@@ -470,6 +657,8 @@ class dict(builtins.dict):
             raise KeyError(f"cannot define value for '{key}' on frozen easytree.dict")
         if self._sealed and key not in self:
             raise KeyError(f"sealed define value for '{key}' on sealed easytree.dict")
+        if _watchers:
+            _mutated(self, key)
         super().__setitem__(key, value)
 
     def __getattr__(self, key):
@@ -491,19 +680,15 @@ class dict(builtins.dict):
             if the dict is sealed and the key does not exist in the dict
         """
         try:
-            return super().__getitem__(key)
+            value = _getitem(self, key)
         except KeyError:
-            if key in ["_frozen", "_sealed"]:
-                return False  # if subclass overrides the init (see note)
-            if self._frozen:
-                raise AttributeError(
-                    f"frozen easytree.dict has no attribute '{key}'"
-                ) from None
-            if self._sealed:
-                raise AttributeError(
-                    f"sealed easytree.dict has no attribute '{key}'"
-                ) from None
-        return undefined(parent=self, key=key)
+            pass
+        else:
+            if type(value) is _computed:
+                return value._get(self, key)
+            return value
+        # raised outside of the handler, such that the KeyError is not chained
+        return _missing_attribute(self, key)
 
     def __setattr__(self, key, value):
         """
@@ -546,6 +731,23 @@ class dict(builtins.dict):
             )
         del self[key]
 
+    def __delitem__(self, key):
+        """
+        Remove a key
+
+        Raises
+        ------
+        KeyError
+            if the dict is frozen or sealed, or if the key does not exist
+        """
+        if self._frozen:
+            raise KeyError(f"cannot delete '{key}' from frozen easytree.dict")
+        if self._sealed:
+            raise KeyError(f"cannot delete '{key}' from sealed easytree.dict")
+        super().__delitem__(key)
+        if _watchers:
+            _mutated(self, key)
+
     def __reduce__(self):
         """
         Pickling
@@ -581,6 +783,8 @@ class dict(builtins.dict):
                 raise AttributeError(f"Cannot set '{key}' on frozen easytree.dict")
             if self._sealed and key not in self:
                 raise AttributeError(f"Cannot set '{key}' on sealed easytree.dict")
+            if _watchers:
+                _mutated(self, key)
             return super().setdefault(
                 key, cast(default, sealed=self._sealed, frozen=self._frozen)
             )
@@ -629,7 +833,10 @@ class dict(builtins.dict):
                     return default
             return current
 
-        return super().get(key, default)
+        value = super().get(key, default)
+        if type(value) is _computed:
+            return value._get(self, key)
+        return value
 
     @classmethod
     def fromkeys(cls, keys, value):
@@ -658,6 +865,8 @@ class dict(builtins.dict):
         if self._sealed:
             if any(key not in self for key in other):
                 raise AttributeError("Cannot update sealed easytree.dict with new keys")
+        if _watchers:
+            _mutated(self)
         return super().update(
             {
                 k: cast(v, sealed=self._sealed, frozen=self._frozen)
@@ -665,6 +874,30 @@ class dict(builtins.dict):
             }
         )
 
+    def __ior__(self, other):
+        """
+        Update the dict in place, like :code:`update` (i.e. :code:`tree |= other`)
+        """
+        self.update(builtins.dict(other))
+        return self
+
+    def clear(self):
+        """
+        Remove all items from the dict
+
+        Raises
+        ------
+        AttributeError
+            if the dict is frozen, or if the dict is sealed
+        """
+        if self._frozen:
+            raise AttributeError("Cannot clear frozen easytree.dict")
+        if self._sealed:
+            raise AttributeError("Cannot clear sealed easytree.dict")
+        if _watchers:
+            _mutated(self)
+        return super().clear()
+
     def popitem(self):
         """
         Remove and return the last item (key, value pair)
@@ -683,6 +916,8 @@ class dict(builtins.dict):
             raise AttributeError("Cannot popitem from frozen easytree.dict")
         if self._sealed:
             raise AttributeError("Cannot popitem from sealed easytree.dict")
+        if _watchers:
+            _mutated(self)
         return super().popitem()
 
     def pop(self, *args):
@@ -709,6 +944,8 @@ class dict(builtins.dict):
             raise AttributeError("Cannot pop from frozen easytree.dict")
         if self._sealed:
             raise AttributeError("Cannot pop from sealed easytree.dict")
+        if _watchers:
+            _mutated(self, args[0])
         return super().pop(*args)
 
     def __enter__(self):
@@ -728,6 +965,251 @@ class dict(builtins.dict):
         """
         pass
 
+    def copy(self, deep: bool = False):
+        """
+        Return a copy of the dict, of the same type and with the same flags
+
+        Parameters
+        ----------
+        deep : bool
+            True for a deep copy, which shares the frozen nodes of the dict,
+            False for a shallow copy
+
+        Returns
+        -------
+        copy : dict
+            the new dict
+
+        Example
+        -------
+        >>> defaults = easytree.dict({"retries": 3}, frozen=True)
+        >>> request = easytree.dict({"headers": {}, "defaults": defaults})
+        >>> copy = request.copy(deep=True)
+        >>> copy.headers is request.headers
+        False
+        >>> copy.defaults is defaults
+        True
+        """
+        if deep:
+            return _deepcopy(self)
+        return _clone(self, self.items())
+
+    def __copy__(self):
+        """
+        Shallow copy (see :code:`copy.copy`)
+        """
+        return _clone(self, self.items())
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copy (see :code:`copy.deepcopy`)
+        """
+        return _deepcopy(self, memo)
+
+
+def _ingest(node, iterable, chunk_size=1000, intern=None):
+    """
+    Cast the items of an iterable, and append them to a list node, in chunks
+
+    Returns the number of items appended.
+    """
+    if iterable is node:
+        iterable = builtins.list(iterable)  # the list would grow while iterated
+    if intern is not None:
+        intern = _interner(intern)
+    sealed, frozen = node._sealed, node._frozen
+    iterator = iter(iterable)
+    count = 0
+    while True:
+        if intern is None:
+            chunk = [
+                cast(value, sealed=sealed, frozen=frozen)
+                for value in itertools.islice(iterator, chunk_size)
+            ]
+        else:
+            chunk = [
+                cast(value, sealed=sealed, frozen=frozen, intern=intern)
+                for value in itertools.islice(iterator, chunk_size)
+            ]
+        if not chunk:
+            return count
+        if _watchers:
+            _mutated(node)
+        builtins.list.extend(node, chunk)
+        count += len(chunk)
+        if len(chunk) < chunk_size:
+            return count
+
+
+def _clone(node, children):
+    """
+    Returns a new node of the same type, and with the same flags, as node,
+    with the given children, which are not cast
+    """
+    cls = type(node)
+    clone = cls.__new__(cls)
+    # flags are copied one by one, as compiled records hold them on their class
+    # unless they differ, such that records do not allocate an instance __dict__
+    for flag in ("_sealed", "_frozen"):
+        value = getattr(node, flag, False)
+        if getattr(cls, flag, None) is not value:
+            object.__setattr__(clone, flag, value)
+    if isinstance(node, builtins.dict):
+        builtins.dict.update(clone, children)
+    else:
+        builtins.list.extend(clone, children)
+    return clone
+
+
+def _rebuild(value, children, sealed, frozen):
+    """
+    Returns a node of the type of value (or a base node, if value is a builtin
+    dict or list), with the given children, which are already cast
+
+    Base nodes are built directly, as by :code:`easytree.loadb`, whereas
+    subclasses are built with the signature of their documented
+    :code:`__init__` method, i.e. with the sealed and frozen flags only.
+    """
+    if isinstance(value, builtins.dict):
+        cls = type(value) if isinstance(value, dict) else dict
+    else:
+        cls = type(value) if isinstance(value, list) else list
+    if cls is not dict and cls is not list:
+        return cls(children, sealed=sealed, frozen=frozen)
+    node = cls.__new__(cls)
+    if cls is dict:
+        builtins.dict.update(node, children)
+    else:
+        builtins.list.extend(node, children)
+    vars(node).update({"_sealed": sealed, "_frozen": frozen})
+    return node
+
+
+# types of the values which are never copied
+_atomic = frozenset([str, int, float, bool, complex, bytes, type(None)])
+
+
+def _deepcopy(tree, memo=None):
+    """
+    Returns a deep copy of a tree, which shares its frozen nodes
+
+    The tree is walked iteratively, such that deep trees do not exceed the
+    recursion limit. Values other than nodes are copied with :code:`copy.deepcopy`.
+    """
+    if memo is None:
+        memo = {}
+
+    def child(value):
+        if type(value) in _atomic:
+            return value
+        clone = memo.get(id(value))
+        if clone is not None:
+            return clone
+        if not isinstance(value, (list, dict)):
+            return copy.deepcopy(value, memo)
+        if value._frozen:
+            memo[id(value)] = value
+            return value
+        clone = _clone(value, ())
+        memo[id(value)] = clone
+        stack.append((value, clone))
+        return clone
+
+    stack = []
+    root = child(tree)
+    while stack:
+        node, clone = stack.pop()
+        if isinstance(node, builtins.dict):
+            builtins.dict.update(clone, [(k, child(v)) for k, v in node.items()])
+        else:
+            builtins.list.extend(clone, [child(v) for v in node])
+    return root
+
+
+def _missing_attribute(tree, key):
+    """
+    Returns an :code:`undefined` node for a key missing from a dict
+    """
+    if key in _flags:
+        return False  # if subclass overrides the init (see dict.__getattr__)
+    if tree._frozen:
+        raise AttributeError(f"frozen easytree.dict has no attribute '{key}'")
+    if tree._sealed:
+        raise AttributeError(f"sealed easytree.dict has no attribute '{key}'")
+    return undefined(parent=tree, key=key)
+
+
+def _fast_getattribute(self, key):
+    """
+    Attribute lookup used by :code:`easytree.dict` in fast access mode
+
+    Class attributes (e.g. methods) take precedence over keys, as in
+    the default mode, but keys are looked up before the instance
+    :code:`__dict__` and without first failing the generic lookup.
+    """
+    cls = type(self)
+    try:
+        names = _attributes[cls]
+    except KeyError:
+        names = _attributes[cls] = frozenset(dir(cls)) | _flags
+    if key in names:
+        return _getattribute(self, key)
+    try:
+        value = _getitem(self, key)
+    except KeyError:
+        pass
+    else:
+        if type(value) is _computed:
+            return value._get(self, key)
+        return value
+    instance = _getattribute(self, "__dict__")
+    if key in instance:
+        return instance[key]
+    if cls.__getattr__ is not dict.__getattr__:
+        return cls.__getattr__(self, key)
+    return _missing_attribute(self, key)
+
+
+def fastaccess(enabled: bool = True) -> bool:
+    """
+    Enable (or disable) the fast attribute access mode of :code:`easytree.dict`
+
+    By default, reading a key with the dot notation first misses the instance
+    and its class before falling back to :code:`__getattr__`. In fast access mode,
+    keys are looked up directly, which brings dot access close to the speed of
+    item access, at the cost of slightly slower method calls and writes.
+
+    The mode applies to all :code:`easytree.dict` instances (and subclasses) in
+    the process. Class attributes, such as methods, still take precedence over keys.
+
+    Parameters
+    ----------
+    enabled : bool
+        True to enable the fast access mode, False to disable it
+
+    Returns
+    -------
+    previous : bool
+        True if the fast access mode was previously enabled, False otherwise
+
+    Example
+    -------
+    >>> easytree.fastaccess()
+    False
+    >>> tree = easytree.dict({"foo": {"bar": "baz"}})
+    >>> tree.foo.bar
+    "baz"
+    >>> easytree.fastaccess(False)
+    True
+    """
+    previous = dict.__dict__.get("__getattribute__") is _fast_getattribute
+    if enabled and not previous:
+        dict.__getattribute__ = _fast_getattribute
+    if not enabled and previous:
+        del dict.__getattribute__
+    _attributes.clear()
+    return previous
+
 
 class undefined:
     """
@@ -1,6 +1,10 @@
 import builtins
+import collections.abc
+import gc
+import sys
 
-from .types import dict, list, cast
+from .types import dict, list, cast, undefined, _clone
+from .computing import computed as _computed
 
 
 def frozen(tree):
@@ -23,19 +27,30 @@ def frozen(tree):
     return tree._frozen
 
 
-def freeze(tree):
+def freeze(tree, *, inplace: bool = False):
     """
-    Returns a new frozen copy of the tree
+    Returns a new frozen copy of the tree, or freezes the tree in place
 
     Parameters
     ----------
     tree
         list or dict
+    inplace : bool
+        True to set the flag of the nodes of the tree in place, without
+        copying them, False to return a new copy
 
     Returns
     -------
     frozen : dict | list
+        the new copy, or the tree itself if inplace is True
+
+    Raises
+    ------
+    TypeError
+        if inplace is True and the tree is not an easytree.dict or easytree.list
     """
+    if inplace:
+        return _flip(tree, "_frozen", True)
     if not isinstance(tree, (dict, list, builtins.dict, builtins.list)):
         raise TypeError(
             f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
@@ -43,19 +58,32 @@ def freeze(tree):
     return cast(tree, frozen=True)
 
 
-def unfreeze(tree):
+def unfreeze(tree, *, inplace: bool = False):
     """
-    Returns a new unfrozen copy of the tree
+    Returns a new unfrozen copy of the tree, or unfreezes the tree in place
 
     Parameters
     ----------
     tree
         list or dict
+    inplace : bool
+        True to set the flag of the nodes of the tree in place, without
+        copying them, False to return a new copy. Frozen nodes below the
+        root, which may be shared with other trees, are copied rather than
+        modified.
 
     Returns
     -------
     unfrozen : dict | list
+        the new copy, or the tree itself if inplace is True
+
+    Raises
+    ------
+    TypeError
+        if inplace is True and the tree is not an easytree.dict or easytree.list
     """
+    if inplace:
+        return _flip(tree, "_frozen", False)
     if not isinstance(tree, (dict, list, builtins.dict, builtins.list)):
         raise TypeError(
             f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
@@ -83,19 +111,32 @@ def sealed(tree):
     return tree._sealed
 
 
-def seal(tree):
+def seal(tree, *, inplace: bool = False):
     """
-    Returns a new sealed copy of the tree
+    Returns a new sealed copy of the tree, or seals the tree in place
 
     Parameters
     ----------
     tree
         list or dict
+    inplace : bool
+        True to set the flag of the nodes of the tree in place, without
+        copying them, False to return a new copy. Frozen nodes below the
+        root, which may be shared with other trees, are copied rather than
+        modified.
 
     Returns
     -------
     sealed : dict | list
+        the new copy, or the tree itself if inplace is True
+
+    Raises
+    ------
+    TypeError
+        if inplace is True and the tree is not an easytree.dict or easytree.list
     """
+    if inplace:
+        return _flip(tree, "_sealed", True)
     if not isinstance(tree, (dict, list, builtins.dict, builtins.list)):
         raise TypeError(
             f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
@@ -103,21 +144,397 @@ def seal(tree):
     return cast(tree, sealed=True)
 
 
-def unseal(tree):
+def unseal(tree, *, inplace: bool = False):
     """
-    Returns a new unsealed copy of the tree
+    Returns a new unsealed copy of the tree, or unseals the tree in place
 
     Parameters
     ----------
     tree
         list or dict
+    inplace : bool
+        True to set the flag of the nodes of the tree in place, without
+        copying them, False to return a new copy. Frozen nodes below the
+        root, which may be shared with other trees, are copied rather than
+        modified.
 
     Returns
     -------
     unsealed : dict | list
+        the new copy, or the tree itself if inplace is True
+
+    Raises
+    ------
+    TypeError
+        if inplace is True and the tree is not an easytree.dict or easytree.list
     """
+    if inplace:
+        return _flip(tree, "_sealed", False)
     if not isinstance(tree, (dict, list, builtins.dict, builtins.list)):
         raise TypeError(
             f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
         )
     return cast(tree, sealed=False)
+
+
+def _flip(tree, flag, value):
+    """
+    Set a flag on every node of a tree, in place
+
+    Unlike casting, only the given flag is set, and the other flag of each
+    node is left as is. Builtin dicts and lists found in the tree (e.g. set
+    with the item notation) are replaced by cast copies.
+
+    Frozen nodes below the root may be shared with other trees (e.g. by deep
+    copies, versioned snapshots and templates): rather than being modified,
+    they are replaced by (shallow) copies, whose flag is then set. Frozen
+    nodes are neither copied nor walked when freezing.
+    """
+    if not isinstance(tree, (dict, list)):
+        raise TypeError(
+            f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
+        )
+    freezing = flag == "_frozen" and value
+    copies = {}
+
+    def own(child):
+        """
+        Returns the child, or its copy if it is (or contains) a frozen node
+        """
+        if isinstance(child, (dict, list)):
+            if not child._frozen or freezing:
+                return child
+            copy = copies.get(id(child))
+            if copy is None:
+                copy = copies[id(child)] = _clone(
+                    child, child.items() if isinstance(child, builtins.dict) else child
+                )
+            return copy
+        if isinstance(child, tuple):
+            items = tuple(own(item) for item in child)
+            if any(a is not b for a, b in zip(items, child)):
+                return items
+        return child
+
+    visited = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        if isinstance(node, (dict, list)):
+            if freezing and node._frozen and node is not tree:
+                continue
+            vars(node)[flag] = value
+            if isinstance(node, builtins.dict):
+                items, setitem = builtins.list(node.items()), builtins.dict.__setitem__
+            else:
+                items, setitem = enumerate(node), builtins.list.__setitem__
+            for key, child in items:
+                if isinstance(child, (dict, list, tuple)):
+                    owned = own(child)
+                    if owned is not child:
+                        setitem(node, key, owned)
+                    stack.append(owned)
+                elif isinstance(child, (builtins.dict, builtins.list)):
+                    child = cast(child, sealed=node._sealed, frozen=node._frozen)
+                    setitem(node, key, child)
+        elif isinstance(node, tuple):
+            stack.extend(node)
+    return tree
+
+
+def stats(tree):
+    """
+    Returns statistics about the shape and memory footprint of a tree
+
+    The tree is walked iteratively, such that arbitrarily deep trees
+    do not hit the recursion limit.
+
+    Parameters
+    ----------
+    tree
+        list or dict
+
+    Returns
+    -------
+    stats : dict
+        - :code:`nodes`: the number of nodes (dicts, lists, tuples and sets)
+          by type name
+        - :code:`leaves`: the number of leaves (any other value) by type name
+        - :code:`depth`: the maximum depth of the tree, the root being at depth 0
+        - :code:`key_lengths`: the count, min, max and mean length of the
+          (string) keys, and the histogram of their lengths
+        - :code:`sizeof`: the estimated size of the tree in bytes, including
+          keys, leaves and the per-node :code:`__dict__` holding the
+          :code:`_sealed` and :code:`_frozen` flags; objects referenced more
+          than once are only counted once
+
+    Example
+    -------
+    >>> tree = easytree.dict({"name": "David", "friends": [{"name": "Celine"}]})
+    >>> easytree.stats(tree)
+    {
+        "nodes": {"dict": 2, "list": 1},
+        "leaves": {"str": 2},
+        "depth": 3,
+        "key_lengths": {
+            "count": 3, "min": 4, "max": 7, "mean": 5.0, "histogram": {4: 2, 7: 1}
+        },
+        "sizeof": 1670
+    }
+    """
+    if not isinstance(tree, (dict, list, builtins.dict, builtins.list)):
+        raise TypeError(
+            f"Expected tree to be instance of easytree.dict or easytree.list, received {type(tree).__name__}"
+        )
+
+    nodes = {}
+    leaves = {}
+    lengths = {}
+    depth = 0
+    seen = set()
+    sizeof = 0
+
+    def measure(obj):
+        nonlocal sizeof
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            sizeof += sys.getsizeof(obj)
+
+    stack = [(tree, 0)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        name = type(node).__name__
+
+        if isinstance(node, builtins.dict):
+            children = node.values()
+            for key in node:
+                measure(key)
+                if isinstance(key, str):
+                    lengths[len(key)] = lengths.get(len(key), 0) + 1
+        elif isinstance(node, (builtins.list, tuple, set, frozenset)):
+            children = node
+        else:
+            leaves[name] = leaves.get(name, 0) + 1
+            measure(node)
+            continue
+
+        nodes[name] = nodes.get(name, 0) + 1
+        if id(node) in seen:
+            continue  # shared node, already counted
+        measure(node)
+        if isinstance(node, (dict, list)):
+            # the instance __dict__ is looked up among the referents rather than
+            # accessed, as accessing it would allocate it if it does not exist yet
+            values = {id(child) for child in children}
+            for referent in gc.get_referents(node):
+                if type(referent) is builtins.dict and id(referent) not in values:
+                    measure(referent)
+                    for value in referent.values():
+                        measure(value)
+        stack.extend((child, level + 1) for child in children)
+
+    count = sum(lengths.values())
+    return dict(
+        {
+            "nodes": nodes,
+            "leaves": leaves,
+            "depth": depth,
+            "key_lengths": {
+                "count": count,
+                "min": min(lengths) if lengths else None,
+                "max": max(lengths) if lengths else None,
+                "mean": (
+                    sum(k * v for k, v in lengths.items()) / count if count else None
+                ),
+                "histogram": builtins.dict(sorted(lengths.items())),
+            },
+            "sizeof": sizeof,
+        }
+    )
+
+
+# types of the leaves which are returned as is by to_builtin, without further checks
+_scalars = frozenset([str, int, float, bool, type(None)])
+
+# leaves which are sequences
+_strings = (str, bytes, bytearray, memoryview, range)
+
+# placeholder of the undefined nodes dropped by to_builtin
+_dropped = object()
+
+# depth beyond which to_builtin walks trees iteratively
+_max_depth = 256
+
+_undefined = undefined
+
+
+def to_builtin(tree, *, undefined: str = "drop"):
+    """
+    Returns a copy of a tree made of plain builtin dicts and lists
+
+    Arbitrarily deep trees do not hit the recursion limit: nodes beyond
+    a fixed depth are converted iteratively. Computed values (see
+    :code:`easytree.computed`) are evaluated.
+
+    Parameters
+    ----------
+    tree
+        list or dict (or any mapping or sequence, e.g. packed trees and views)
+    undefined : str
+        :code:`"drop"` to remove the :code:`undefined` nodes stored in the
+        tree, or :code:`"null"` to replace them with None
+
+    Returns
+    -------
+    tree : dict | list
+        the builtin copy of the tree
+
+    Raises
+    ------
+    ValueError
+        if undefined is neither "drop" nor "null"
+
+    Example
+    -------
+    >>> tree = easytree.dict({"name": "David", "address": {"city": "London"}})
+    >>> tree["nickname"] = tree.nickname  # an undefined node
+    >>> easytree.to_builtin(tree)
+    {"name": "David", "address": {"city": "London"}}
+    >>> easytree.to_builtin(tree, undefined="null")
+    {"name": "David", "address": {"city": "London"}, "nickname": None}
+    """
+    if undefined not in ("drop", "null"):
+        raise ValueError(
+            f"Expected undefined to be 'drop' or 'null', received {undefined!r}"
+        )
+    tree = _to_builtin(tree, undefined == "drop", [], 0)
+    return None if tree is _dropped else tree
+
+
+def _to_builtin(value, drop, dropped, depth):
+    """
+    Returns the builtin copy of a value (see :code:`easytree.to_builtin`)
+
+    Leaves are checked inline, such that only nodes cost a function call.
+    Undefined nodes which are dropped are appended to :code:`dropped`, and
+    removed from it by the node which contains them.
+    """
+    mark = len(dropped)
+    if isinstance(value, builtins.dict):
+        if depth > _max_depth:
+            return _walk(value, drop)
+        node = {
+            key: (
+                item
+                if type(item) in _scalars
+                else _to_builtin(
+                    # computed values are resolved by their dict
+                    value[key] if type(item) is _computed else item,
+                    drop,
+                    dropped,
+                    depth + 1,
+                )
+            )
+            for key, item in value.items()
+        }
+    elif isinstance(value, builtins.list):
+        if depth > _max_depth:
+            return _walk(value, drop)
+        node = [
+            (
+                item
+                if type(item) in _scalars
+                else _to_builtin(item, drop, dropped, depth + 1)
+            )
+            for item in value
+        ]
+    elif isinstance(value, tuple):
+        if type(value) is tuple and all(map(_scalars.__contains__, map(type, value))):
+            return value
+        node = [_to_builtin(item, drop, dropped, depth + 1) for item in value]
+        if len(dropped) > mark:
+            node = [item for item in node if item is not _dropped]
+            del dropped[mark:]
+        return tuple(node)
+    elif type(value) in _scalars or isinstance(value, _strings):
+        return value
+    elif isinstance(value, _undefined):
+        if drop:
+            dropped.append(value)
+            return _dropped
+        return None
+    elif isinstance(value, (collections.abc.Mapping, collections.abc.Sequence)):
+        return _walk(value, drop)
+    else:
+        return value
+
+    if len(dropped) > mark:
+        if type(node) is builtins.dict:
+            node = {key: item for key, item in node.items() if item is not _dropped}
+        else:
+            node = [item for item in node if item is not _dropped]
+        del dropped[mark:]
+    return node
+
+
+def _walk(tree, drop):
+    """
+    Returns the builtin copy of a tree (see :code:`easytree.to_builtin`),
+    walking it iteratively
+    """
+    stack = []
+    dropped = []
+
+    def child(value):
+        if isinstance(value, (builtins.dict, collections.abc.Mapping)):
+            node = {}
+        elif isinstance(value, builtins.list) or (
+            isinstance(value, collections.abc.Sequence)
+            and not isinstance(value, (_strings, tuple))
+        ):
+            node = []
+        else:
+            # leaves and tuples (whose nesting is usually shallow)
+            return _to_builtin(value, drop, dropped, 0)
+        stack.append((value, node))
+        return node
+
+    root = child(tree)
+    while stack:
+        source, target = stack.pop()
+        if type(target) is builtins.dict:
+            for key, value in source.items():
+                if type(value) is _computed:
+                    value = source[key]
+                value = value if type(value) in _scalars else child(value)
+                if value is not _dropped:
+                    target[key] = value
+        else:
+            for value in source:
+                value = value if type(value) in _scalars else child(value)
+                if value is not _dropped:
+                    target.append(value)
+        dropped.clear()
+    return root
+
+
+def _lookup(tree, path, default=None):
+    """
+    Returns the value at a path of keys (and indices) of a tree, or default if
+    the path does not exist (see the :code:`get` method of the views of trees)
+    """
+    if len(path) == 0:
+        return default
+    current = tree
+    for key in path:
+        try:
+            current = current[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+        if isinstance(current, undefined):
+            return default
+    return current
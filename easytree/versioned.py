@@ -0,0 +1,152 @@
+import builtins
+import threading
+
+from .types import dict, cast
+from .utils import freeze, unfreeze
+
+_missing = object()
+
+
+class Versioned:
+    """
+    Versioned tree, with lock-free readers
+
+    Writers mutate a private working copy of the tree, and publish a new
+    frozen snapshot of it on completion. Readers read the current snapshot,
+    which never changes, without locking.
+
+    Snapshots share every subtree which did not change since the previous
+    snapshot, such that publishing only allocates the nodes on the paths
+    to the changes.
+
+    Parameters
+    ----------
+    tree : dict, list
+        the initial tree
+
+    Example
+    -------
+    >>> config = easytree.Versioned({"database": {"host": "localhost"}})
+
+    >>> # in a background thread
+    >>> with config.write() as draft:
+    ...     draft.database.port = 5432
+
+    >>> # in request threads
+    >>> snapshot = config.snapshot
+    >>> snapshot.database.port
+    5432
+
+    Note
+    ----
+    Read the snapshot once, and keep a reference to it, to read several values
+    from the same version of the tree.
+    """
+
+    def __init__(self, tree=None):
+        self._lock = threading.Lock()
+        self._snapshot = freeze(dict() if tree is None else tree)
+        self._working = unfreeze(self._snapshot)
+        self._version = 0
+
+    @property
+    def snapshot(self):
+        """
+        Returns the current (frozen) snapshot of the tree
+        """
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """
+        Returns the number of snapshots published since creation
+        """
+        return self._version
+
+    def write(self):
+        """
+        Returns a context manager which yields the working copy of the tree,
+        and publishes a new snapshot on exit
+
+        Writers are serialized. If an exception is raised within the context,
+        the changes are discarded and no snapshot is published.
+
+        Returns
+        -------
+        writer : context manager
+        """
+        return _writer(self)
+
+    def _publish(self):
+        snapshot = _share(self._working, self._snapshot)
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._version += 1
+
+    def _discard(self):
+        self._working = unfreeze(self._snapshot)
+
+    def __repr__(self):
+        return f"<Versioned version={self._version} {self._snapshot!r}>"
+
+
+class _writer:
+    """
+    Writer context manager
+    """
+
+    def __init__(self, versioned):
+        self._versioned = versioned
+
+    def __enter__(self):
+        self._versioned._lock.acquire()
+        return self._versioned._working
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        try:
+            if exc_type is None:
+                self._versioned._publish()
+            else:
+                self._versioned._discard()
+        finally:
+            self._versioned._lock.release()
+
+
+def _share(value, previous):
+    """
+    Returns a frozen copy of value, which shares the subtrees of the previous
+    frozen value which are unchanged, or the previous value itself if unchanged
+    """
+    if isinstance(value, builtins.dict):
+        if not isinstance(previous, builtins.dict) or type(previous) is not type(value):
+            return cast(value, frozen=True)
+        children = {
+            key: _share(child, builtins.dict.get(previous, key, _missing))
+            for key, child in value.items()
+        }
+        if len(children) == len(previous) and all(
+            a == b and children[a] is previous[b] for a, b in zip(children, previous)
+        ):
+            return previous
+        return type(value)(children, sealed=False, frozen=True)
+
+    if isinstance(value, builtins.list):
+        if not isinstance(previous, builtins.list) or type(previous) is not type(value):
+            return cast(value, frozen=True)
+        children = [
+            _share(child, previous[i] if i < len(previous) else _missing)
+            for i, child in enumerate(value)
+        ]
+        if len(children) == len(previous) and all(
+            a is b for a, b in zip(children, previous)
+        ):
+            return previous
+        return type(value)(children, sealed=False, frozen=True)
+
+    if previous is not _missing and type(previous) is type(value):
+        try:
+            if previous == value:
+                return previous
+        except Exception:
+            pass
+    return cast(value, frozen=True)
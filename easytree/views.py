@@ -0,0 +1,620 @@
+"""
+Zero-copy views over builtin dicts and lists
+
+A view wraps an existing builtin dict or list, without copying it, and
+provides the dot notation and the :code:`undefined` semantics of
+:code:`easytree.dict` and :code:`easytree.list`. Nested dicts and lists are
+wrapped on demand, when they are accessed.
+
+Views never mutate the objects they wrap: the first mutation of a node
+copies it (shallowly), along with its ancestors, such that only the nodes
+on the paths to the mutations are copied.
+
+Overlays are read-only views of several layered dicts, which resolve each
+key through the layers in order, recursively, without merging them.
+"""
+
+import builtins
+import collections.abc
+import copy
+
+from .types import cast, dict, list, undefined
+from .utils import _lookup
+
+_missing = object()
+
+
+def view(obj, *, sealed: bool = False, frozen: bool = False):
+    """
+    Wrap a builtin dict or list in a view, without copying it
+
+    Parameters
+    ----------
+    obj : dict, list
+        the object to wrap
+    sealed : bool
+        True if the view is sealed, False otherwise
+    frozen : bool
+        True if the view is frozen, False otherwise
+
+    Returns
+    -------
+    view : easytree.views.DictView, easytree.views.ListView
+        the view
+
+    Raises
+    ------
+    TypeError
+        if obj is not a dict or a list
+
+    Example
+    -------
+    >>> payload = {"user": {"name": "David"}}
+    >>> tree = easytree.view(payload)
+    >>> tree.user.name
+    "David"
+    >>> tree.user.name = "Celine"
+    >>> payload["user"]["name"]  # the payload is not mutated
+    "David"
+    """
+    if isinstance(obj, (DictView, ListView)):
+        obj = obj.unwrap()
+    if isinstance(obj, builtins.dict):
+        return DictView(obj, sealed=sealed, frozen=frozen)
+    if isinstance(obj, builtins.list):
+        return ListView(obj, sealed=sealed, frozen=frozen)
+    raise TypeError(f"Expected a dict or a list, received {type(obj).__name__}")
+
+
+class _view:
+    """
+    Base class of views, which holds the wrapped node and its copy-on-write state
+    """
+
+    __slots__ = (
+        "_data",
+        "_parent",
+        "_key",
+        "_owned",
+        "_children",
+        "_sealed",
+        "_frozen",
+    )
+
+    def __init__(self, data, *, sealed=False, frozen=False, parent=None, key=None):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_owned", False)
+        object.__setattr__(self, "_children", {})
+        object.__setattr__(self, "_sealed", sealed)
+        object.__setattr__(self, "_frozen", frozen)
+
+    def _wrap(self, key, value):
+        """
+        Returns the value at a key, wrapped in a (cached) view if it is a
+        builtin dict or list
+        """
+        if isinstance(value, (dict, list)) or not isinstance(
+            value, (builtins.dict, builtins.list)
+        ):
+            return value
+        child = self._children.get(key)
+        if child is None or child._data is not value:
+            cls = DictView if isinstance(value, builtins.dict) else ListView
+            child = cls(
+                value, sealed=self._sealed, frozen=self._frozen, parent=self, key=key
+            )
+            self._children[key] = child
+        return child
+
+    def _own(self):
+        """
+        Returns the node, after copying it (and its ancestors) on first call
+        """
+        if self._owned:
+            return self._data
+        original = self._data
+        object.__setattr__(self, "_data", original.copy())
+        object.__setattr__(self, "_owned", True)
+        parent = self._parent
+        if parent is not None:
+            data = parent._own()
+            if isinstance(data, builtins.dict):
+                if data.get(self._key, _missing) is original:
+                    data[self._key] = self._data
+            else:
+                # items may have moved since the view was created
+                for index, value in enumerate(data):
+                    if value is original:
+                        data[index] = self._data
+                        break
+        return self._data
+
+    def unwrap(self):
+        """
+        Returns the wrapped node, which is a copy of the original node
+        if the view was mutated
+        """
+        return self._data
+
+    def materialize(self):
+        """
+        Returns a copy of the node, cast as an :code:`easytree.dict`
+        or :code:`easytree.list`, with the flags of the view
+        """
+        return cast(self._data, sealed=self._sealed, frozen=self._frozen)
+
+    def __eq__(self, other):
+        if isinstance(other, _view):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self._data)
+
+    def __bool__(self):
+        return bool(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+class DictView(_view, collections.abc.MutableMapping):
+    """
+    View of a builtin dict (see :code:`easytree.view`)
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        """
+        Returns a value at a key, or :code:`undefined` if key does not exist
+
+        Raises
+        ------
+        KeyError
+            if the view is frozen or sealed, and the key does not exist
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            if self._frozen or self._sealed:
+                raise KeyError(
+                    f"{'frozen' if self._frozen else 'sealed'} easytree view "
+                    f"has no value for '{key}'"
+                ) from None
+            return undefined(parent=self, key=key)
+        return self._wrap(key, value)
+
+    def __getattr__(self, key):
+        """
+        Returns a value at a key, or :code:`undefined` if key does not exist
+
+        Raises
+        ------
+        AttributeError
+            if the view is frozen or sealed, and the key does not exist
+        """
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)  # e.g. copy and pickle protocols
+        try:
+            value = self._data[key]
+        except KeyError:
+            if self._frozen or self._sealed:
+                raise AttributeError(
+                    f"{'frozen' if self._frozen else 'sealed'} easytree view "
+                    f"has no attribute '{key}'"
+                ) from None
+            return undefined(parent=self, key=key)
+        return self._wrap(key, value)
+
+    def __setitem__(self, key, value):
+        """
+        Set a value at a key, copying the node on its first mutation
+
+        Raises
+        ------
+        KeyError
+            if the view is frozen, or if the view is sealed and the key does not exist
+        """
+        if self._frozen:
+            raise KeyError(f"cannot define value for '{key}' on frozen easytree view")
+        if self._sealed and key not in self._data:
+            raise KeyError(f"cannot define value for '{key}' on sealed easytree view")
+        if isinstance(value, _view):
+            value = value.unwrap()
+        self._own()[key] = value
+        self._children.pop(key, None)
+
+    def __setattr__(self, key, value):
+        """
+        Set a value at a key, copying the node on its first mutation
+
+        Raises
+        ------
+        AttributeError
+            if the view is frozen, or if the view is sealed and the key does not exist
+        """
+        if self._frozen:
+            raise AttributeError(f"cannot set attribute '{key}' on frozen easytree view")
+        if self._sealed and key not in self._data:
+            raise AttributeError(
+                f"cannot define attribute '{key}' on sealed easytree view"
+            )
+        self[key] = value
+
+    def __delitem__(self, key):
+        """
+        Remove a key, copying the node on its first mutation
+
+        Raises
+        ------
+        KeyError
+            if the view is frozen or sealed, or if the key does not exist
+        """
+        if self._frozen or self._sealed:
+            raise KeyError(
+                f"cannot delete '{key}' from "
+                f"{'frozen' if self._frozen else 'sealed'} easytree view"
+            )
+        if key not in self._data:
+            raise KeyError(key)
+        del self._own()[key]
+        self._children.pop(key, None)
+
+    def __delattr__(self, key):
+        try:
+            del self[key]
+        except KeyError as error:
+            raise AttributeError(*error.args) from None
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def get(self, key, default=None):
+        """
+        Get item by key, if it is exists; otherwise, return default
+
+        If key is list, recursively traverses the tree
+
+        Parameters
+        ----------
+        key : hashable, list[hashable]
+            the key (or path of keys)
+
+        Returns
+        -------
+        value : any
+        """
+        if isinstance(key, builtins.list):
+            return _lookup(self, key, default)
+        value = self._data.get(key, _missing)
+        return default if value is _missing else self._wrap(key, value)
+
+    def pop(self, key, default=_missing):
+        """
+        Remove a key and return its value, or default if the key does not exist
+        """
+        if key not in self._data:
+            if default is _missing:
+                raise KeyError(key)
+            return default
+        value = self[key]
+        del self[key]
+        return value
+
+    def setdefault(self, key, default=None):
+        """
+        Insert key with a value of default if key is not in the view,
+        and return the value for key
+        """
+        if key not in self._data:
+            self[key] = default
+        return self[key]
+
+
+class ListView(_view, collections.abc.MutableSequence):
+    """
+    View of a builtin list (see :code:`easytree.view`)
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self._data[index], sealed=self._sealed, frozen=self._frozen)
+        value = self._data[index]
+        if index < 0:
+            index += len(self._data)
+        return self._wrap(index, value)
+
+    def __setitem__(self, index, value):
+        """
+        Set a value at an index, copying the node on its first mutation
+
+        Raises
+        ------
+        TypeError
+            if the view is frozen or sealed
+        """
+        if self._frozen or self._sealed:
+            raise TypeError(
+                f"cannot set item on "
+                f"{'frozen' if self._frozen else 'sealed'} easytree view"
+            )
+        if isinstance(value, _view):
+            value = value.unwrap()
+        self._own()[index] = value
+        self._children.clear()
+
+    def __delitem__(self, index):
+        """
+        Remove the value at an index, copying the node on its first mutation
+
+        Raises
+        ------
+        TypeError
+            if the view is frozen or sealed
+        """
+        if self._frozen or self._sealed:
+            raise TypeError(
+                f"cannot delete item from "
+                f"{'frozen' if self._frozen else 'sealed'} easytree view"
+            )
+        del self._own()[index]
+        self._children.clear()
+
+    def __getattr__(self, key):
+        raise AttributeError(f"'ListView' object has no attribute '{key}'")
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"'ListView' object has no attribute '{key}'")
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self._data)))
+
+    def __contains__(self, value):
+        if isinstance(value, _view):
+            value = value.unwrap()
+        return value in self._data
+
+    def insert(self, index, value):
+        """
+        Insert a value before an index, copying the node on its first mutation
+
+        Raises
+        ------
+        TypeError
+            if the view is frozen or sealed
+        """
+        if self._frozen or self._sealed:
+            raise TypeError(
+                f"cannot insert into "
+                f"{'frozen' if self._frozen else 'sealed'} easytree view"
+            )
+        if isinstance(value, _view):
+            value = value.unwrap()
+        self._own().insert(index, value)
+        self._children.clear()
+
+    def append(self, value):
+        """
+        Append a value, copying the node on its first mutation
+
+        Raises
+        ------
+        TypeError
+            if the view is frozen or sealed
+        """
+        self.insert(len(self._data), value)
+
+
+def overlay(*layers):
+    """
+    Layer dicts into a read-only view, which resolves each key through
+    the layers in order, without merging them
+
+    Like :code:`collections.ChainMap`, the value of a key is the value of
+    the first layer which has it. When this value is a dict, the dicts at
+    the same key in the following layers are layered beneath it, down to
+    the first layer whose value is not a dict, as a deep merge would.
+
+    Parameters
+    ----------
+    *layers : dict
+        the layers, from highest to lowest priority
+
+    Returns
+    -------
+    overlay : easytree.views.OverlayView
+        the overlay
+
+    Raises
+    ------
+    TypeError
+        if a layer is not a dict (or mapping)
+
+    Example
+    -------
+    >>> settings = easytree.overlay(overrides, env_defaults, global_defaults)
+    >>> settings.database.port  # from the first layer which defines it
+    5432
+    >>> settings.database.missing
+    <undefined 'missing'>
+    """
+    return OverlayView(*layers)
+
+
+class OverlayView(collections.abc.Mapping):
+    """
+    Read-only view of layered dicts (see :code:`easytree.overlay`)
+    """
+
+    __slots__ = ("_layers", "_getters")
+
+    # read-only, e.g. for undefined nodes of the overlay
+    _frozen = True
+    _sealed = False
+
+    def __init__(self, *layers):
+        for layer in layers:
+            if not isinstance(layer, collections.abc.Mapping):
+                raise TypeError(
+                    f"Expected the layers to be dicts, received {type(layer).__name__}"
+                )
+        object.__setattr__(self, "_layers", layers)
+        object.__setattr__(
+            self,
+            "_getters",
+            tuple(
+                # easytree.dict.get is a path lookup, which is slower
+                builtins.dict.get.__get__(layer)
+                if isinstance(layer, builtins.dict)
+                else layer.get
+                for layer in layers
+            ),
+        )
+
+    @property
+    def layers(self):
+        """
+        The layers of the overlay, from highest to lowest priority
+        """
+        return self._layers
+
+    def _resolve(self, key):
+        """
+        Returns the value at a key, or _missing if no layer has the key
+        """
+        mappings = None
+        for get in self._getters:
+            value = get(key, _missing)
+            if value is _missing:
+                continue
+            if not isinstance(value, collections.abc.Mapping):
+                if mappings is None:
+                    return value
+                break
+            if mappings is None:
+                mappings = [value]
+            else:
+                mappings.append(value)
+        if mappings is None:
+            return _missing
+        return OverlayView(*mappings)
+
+    def __getitem__(self, key):
+        """
+        Returns a value at a key, or :code:`undefined` if no layer has the key
+        """
+        value = self._resolve(key)
+        if value is _missing:
+            return undefined(parent=self, key=key)
+        return value
+
+    def __getattr__(self, key):
+        """
+        Returns a value at a key, or :code:`undefined` if no layer has the key
+        """
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)  # e.g. copy and pickle protocols
+        value = self._resolve(key)
+        if value is _missing:
+            return undefined(parent=self, key=key)
+        return value
+
+    def __setitem__(self, key, value):
+        raise KeyError(f"cannot define value for '{key}' on read-only easytree overlay")
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            f"cannot set attribute '{key}' on read-only easytree overlay"
+        )
+
+    def __delitem__(self, key):
+        raise KeyError(f"cannot delete '{key}' from read-only easytree overlay")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"cannot delete '{key}' from read-only easytree overlay")
+
+    def __contains__(self, key):
+        return any(get(key, _missing) is not _missing for get in self._getters)
+
+    def __iter__(self):
+        if len(self._layers) == 1:
+            return iter(self._layers[0])
+        keys = builtins.dict.fromkeys(self._layers[0])
+        for layer in self._layers[1:]:
+            keys.update(builtins.dict.fromkeys(layer))
+        return iter(keys)
+
+    def __len__(self):
+        if len(self._layers) == 1:
+            return len(self._layers[0])
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        """
+        Get item by key, if it is exists; otherwise, return default
+
+        If key is list, recursively traverses the tree
+
+        Parameters
+        ----------
+        key : hashable, list[hashable]
+            the key (or path of keys)
+
+        Returns
+        -------
+        value : any
+        """
+        if isinstance(key, builtins.list):
+            return _lookup(self, key, default)
+        value = self._resolve(key)
+        return default if value is _missing else value
+
+    def materialize(self, *, sealed: bool = False, frozen: bool = False):
+        """
+        Returns the layers merged into a new tree
+
+        Parameters
+        ----------
+        sealed : bool
+            True if the tree is sealed, False otherwise
+        frozen : bool
+            True if the tree is frozen, False otherwise
+
+        Returns
+        -------
+        tree : easytree.dict
+            the merged tree
+        """
+        node = dict.__new__(dict)
+        items = []
+        for key in self:
+            value = self._resolve(key)
+            if isinstance(value, OverlayView):
+                value = value.materialize(sealed=sealed, frozen=frozen)
+            else:
+                if isinstance(value, _view):
+                    value = value.unwrap()
+                if isinstance(value, (builtins.dict, builtins.list)):
+                    # the merged tree does not share nodes with the layers
+                    value = copy.deepcopy(value)
+                value = cast(value, sealed=sealed, frozen=frozen)
+            items.append((key, value))
+        builtins.dict.update(node, items)
+        vars(node).update({"_sealed": sealed, "_frozen": frozen})
+        return node
+
+    def __repr__(self):
+        return f"<OverlayView layers={len(self._layers)}>"
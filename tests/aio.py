@@ -0,0 +1,105 @@
+import asyncio
+
+import easytree
+import pytest
+
+
+def run(coroutine, ticks=None):
+    """
+    Run a coroutine alongside a task which counts its turns on the event loop
+    """
+
+    async def main():
+        done = False
+
+        async def ticker():
+            while not done:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker()) if ticks is not None else None
+        try:
+            return await coroutine
+        finally:
+            done = True
+            if task is not None:
+                await task
+
+    return asyncio.run(main())
+
+
+def test_acast():
+    value = {"a": [{"b": 1}, {"c": (1, {"d": 2})}], "e": "f"}
+    tree = run(easytree.acast(value, frozen=True))
+    assert tree == value
+    assert isinstance(tree, easytree.dict)
+    assert isinstance(tree.a[0], easytree.dict)
+    assert easytree.frozen(tree.a)
+    assert easytree.frozen(tree.a[1].c[1])
+    assert tree == easytree.dict(value, frozen=True)
+
+
+def test_acast_yields():
+    value = [{"i": i} for i in range(1000)]
+    ticks = []
+    tree = run(easytree.acast(value, every=10), ticks)
+    assert len(tree) == 1000
+    assert len(ticks) >= 100
+
+
+def test_acast_yields_within_nodes():
+    value = {"a": list(range(1000)), "b": {str(i): i for i in range(1000)}}
+    ticks = []
+    tree = run(easytree.acast(value, every=10), ticks)
+    assert tree == value
+    assert list(tree.b) == list(value["b"])
+    assert len(ticks) >= 200
+
+
+@pytest.mark.parametrize("every", [0, -1, 1.5, None])
+def test_acast_every_invalid(every):
+    with pytest.raises(ValueError):
+        run(easytree.acast({"a": 1}, every=every))
+
+
+def test_acast_shares_nodes():
+    node = easytree.dict({"a": 1}, sealed=True)
+    tree = run(easytree.acast({"node": node}, sealed=True))
+    assert tree.node is node
+    assert run(easytree.acast(node, sealed=True)) is node
+    assert run(easytree.acast(1)) == 1
+
+
+def test_acast_intern():
+    interner = easytree.Interner()
+    value = [{"".join(["ke", "y"]): i} for i in range(3)]
+    tree = run(easytree.acast(value, intern=interner))
+    assert next(iter(tree[0])) is next(iter(tree[2]))
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def test_aload():
+    tree = run(easytree.aload(stream(b'{"a": [1, ', b'{"b": 2}]}'), sealed=True))
+    assert tree == {"a": [1, {"b": 2}]}
+    assert easytree.sealed(tree.a[1])
+
+    tree = run(easytree.aload(stream('{"a": ', "1}"), executor=False))
+    assert tree.a == 1
+
+
+def test_aload_reader():
+    class reader:
+        async def read(self):
+            return b'{"a": 1}'
+
+    assert run(easytree.aload(reader())) == {"a": 1}
+
+
+def test_aload_invalid():
+    with pytest.raises(ValueError):
+        run(easytree.aload(stream(b'{"a": ')))
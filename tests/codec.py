@@ -0,0 +1,105 @@
+import easytree
+import pytest
+
+
+def test_roundtrip():
+    tree = easytree.dict(
+        {
+            "name": "David",
+            "age": 31,
+            "height": 1.82,
+            "active": True,
+            "retired": False,
+            "manager": None,
+            "avatar": b"\x00\x01",
+            "balance": -(2**80),
+            "friends": [{"name": "Celine"}, {"name": "Bob"}],
+            "coordinates": (51.5, -0.1),
+            "tags": {"a", "b"},
+            1: "integer key",
+            "": "empty key",
+        }
+    )
+    copy = easytree.loadb(easytree.dumpb(tree))
+    assert copy == tree
+    assert list(copy) == list(tree)
+    assert isinstance(copy, easytree.dict)
+    assert isinstance(copy.friends, easytree.list)
+    assert isinstance(copy.friends[0], easytree.dict)
+    assert copy.coordinates == (51.5, -0.1)
+    assert copy.age is not True
+
+    assert easytree.loadb(easytree.dumpb(1)) == 1
+    assert easytree.loadb(easytree.dumpb([1, {"a": 2}])) == [1, {"a": 2}]
+    assert isinstance(easytree.loadb(easytree.dumpb({"a": 1})), easytree.dict)
+
+
+def test_flags():
+    tree = easytree.dict({"address": {"city": "London"}, "friends": [{}]}, frozen=True)
+    copy = easytree.loadb(easytree.dumpb(tree))
+    assert easytree.frozen(copy) is True
+    assert easytree.frozen(copy.address) is True
+    assert easytree.frozen(copy.friends[0]) is True
+    assert easytree.sealed(copy) is False
+
+    # flags are preserved per node
+    tree = easytree.dict()
+    tree["address"] = easytree.dict({"city": "London"}, sealed=True)
+    copy = easytree.loadb(easytree.dumpb(tree))
+    assert easytree.sealed(copy) is False
+    assert easytree.sealed(copy.address) is True
+
+
+def test_key_interning():
+    records = [{"firstname": "David", "lastname": "Smith"} for _ in range(100)]
+    data = easytree.dumpb(records)
+    assert data.count(b"firstname") == 1
+
+    copy = easytree.loadb(data)
+    assert copy == records
+    assert list(copy[0])[0] is list(copy[99])[0]
+
+    # keys equal in value but not in type are not confused
+    assert list(easytree.loadb(easytree.dumpb([{1: "a"}, {True: "b"}]))[1]) == [True]
+
+
+def test_strings():
+    text = "é" * 100  # longer than 127 bytes
+    keys = [f"key{i}" for i in range(300)]  # references of more than one byte
+    tree = [{key: text for key in keys}, {key: "short" for key in keys}, [text, text]]
+    copy = easytree.loadb(easytree.dumpb(tree))
+    assert copy == tree
+    assert list(copy[1]) == keys
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        easytree.dumpb({"a": object()})
+
+    with pytest.raises(ValueError):
+        easytree.loadb(b"not serialized")
+
+    data = easytree.dumpb({"name": "David", "friends": [1, 2, 3]})
+    for i in range(4, len(data)):
+        with pytest.raises(ValueError):
+            easytree.loadb(data[:i])
+
+    with pytest.raises(ValueError):
+        easytree.loadb(data + b"\x00")
+
+    with pytest.raises(ValueError):
+        easytree.loadb(b"ETB1\x0b\x01\x09\x00\x00")  # unhashable set item
+
+    with pytest.raises(ValueError):
+        easytree.loadb(b"ETB1" + b"\x09\x00\x01" * 100000 + b"\x00")
+
+    nested = []
+    for _ in range(100000):
+        nested = [nested]
+    with pytest.raises(ValueError):
+        easytree.dumpb(nested)
+
+    cyclic = easytree.dict()
+    cyclic.self = cyclic
+    with pytest.raises(ValueError):
+        easytree.dumpb(cyclic)
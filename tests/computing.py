@@ -0,0 +1,172 @@
+import copy
+import json
+
+import easytree
+import pytest
+
+
+def make_cart(calls):
+    cart = easytree.dict({"lines": [{"price": 2}, {"price": 3}], "tax": 0.5})
+
+    def total(tree):
+        calls.append("total")
+        return sum(line.price for line in tree.lines)
+
+    cart.total = easytree.computed(total)
+    cart.gross = easytree.computed(lambda tree: tree.total * (1 + tree.tax))
+    return cart
+
+
+def test_computed_is_cached():
+    calls = []
+    cart = make_cart(calls)
+    assert cart.total == 5
+    assert cart["total"] == 5
+    assert cart.get("total") == 5
+    assert cart.get(["total"]) == 5
+    assert calls == ["total"]
+    assert cart.__dict__ == {"_sealed": False, "_frozen": False}
+
+
+def test_computed_invalidation():
+    calls = []
+    cart = make_cart(calls)
+    assert cart.gross == 7.5
+    cart.lines.append({"price": 5})
+    assert cart.gross == 15
+    cart.lines[0].price = 10
+    assert cart.gross == 27
+    assert calls == ["total"] * 3
+    cart.tax = 0  # the total does not depend on the tax
+    assert cart.gross == 18
+    cart.lines[0].currency = "EUR"  # nor on other keys of the lines
+    cart.discount = 1
+    assert cart.total == 18
+    assert calls == ["total"] * 3
+    cart.lines.pop()
+    del cart.lines[0]
+    assert cart.gross == 3
+    cart.lines = []
+    assert cart.gross == 0
+
+
+def test_computed_deleted_key():
+    tree = easytree.dict({"a": 1, "b": 2})
+    tree.total = easytree.computed(lambda t: t.get("a", 0) + t.b)
+    assert tree.total == 3
+    del tree["a"]
+    assert tree.total == 2
+    tree.a = 5
+    del tree.a
+    assert tree.total == 2
+    with pytest.raises(KeyError):
+        del easytree.dict({"a": 1}, frozen=True)["a"]
+    with pytest.raises(KeyError):
+        del easytree.dict({"a": 1}, sealed=True)["a"]
+
+
+def test_computed_replaced():
+    cart = make_cart([])
+    assert cart.gross == 7.5
+    cart.total = 1
+    assert cart.gross == 1.5
+    cart.total = easytree.computed(lambda tree: len(tree.lines))
+    assert cart.gross == 3
+
+
+def test_computed_errors():
+    cart = make_cart([])
+    with pytest.raises(TypeError):
+        easytree.computed(1)
+    cart.loop = easytree.computed(lambda tree: tree.loop)
+    with pytest.raises(RecursionError):
+        cart.loop
+    cart.write = easytree.computed(lambda tree: setattr(tree, "total", 1))
+    with pytest.raises(AttributeError):
+        cart.write
+    cart.failing = easytree.computed(lambda tree: tree.missing + 1)
+    with pytest.raises(TypeError):
+        cart.failing
+    assert cart.total == 5
+
+
+def test_computed_copy():
+    cart = make_cart([])
+    assert cart.total == 5
+    clone = copy.deepcopy(cart)
+    clone.lines.append({"price": 1})
+    assert clone.total == 6
+    assert cart.total == 5
+
+
+def test_computed_result_is_cast():
+    cart = make_cart([])
+    cart.summary = easytree.computed(lambda tree: {"count": len(tree.lines)})
+    assert isinstance(cart.summary, easytree.dict)
+    assert cart.summary.count == 2
+    assert cart.summary is cart.summary
+
+
+def test_computed_ingest():
+    cart = make_cart([])
+    assert cart.total == 5
+    cart.lines.ingest({"price": 1} for _ in range(3))
+    assert cart.total == 8
+
+
+def test_computed_to_builtin():
+    cart = make_cart([])
+    cart.summary = easytree.computed(lambda tree: {"count": len(tree.lines)})
+    tree = easytree.to_builtin(cart)
+    assert tree["total"] == 5
+    assert tree["gross"] == 7.5
+    assert tree["summary"] == {"count": 2}
+    assert type(tree["summary"]) is dict
+    assert json.loads(json.dumps(tree))["total"] == 5
+
+    # beyond the depth at which the tree is walked iteratively
+    deep = node = easytree.dict()
+    for _ in range(300):
+        node = node.child
+    node.total = easytree.computed(lambda tree: 1)
+    node = easytree.to_builtin(deep)
+    for _ in range(300):
+        node = node["child"]
+    assert node == {"total": 1}
+
+
+def test_computed_clear_and_inplace_operators():
+    tree = easytree.dict({"options": {"a": 1}, "items": [1]})
+    tree.count = easytree.computed(lambda t: len(t.options))
+    tree.total = easytree.computed(lambda t: sum(t["items"]))
+    assert tree.count == 1 and tree.total == 1
+
+    tree.options |= {"b": 2}
+    assert tree.count == 2
+    assert isinstance(tree.options, easytree.dict)
+    tree.options.clear()
+    assert tree.count == 0
+
+    tree["items"] += [{"a": 1}, 2]
+    assert isinstance(tree["items"][1], easytree.dict)
+    with pytest.raises(TypeError):
+        tree.total
+    tree["items"].pop(1)
+    assert tree.total == 3
+
+    frozen = easytree.dict({"a": 1, "b": [1]}, frozen=True)
+    with pytest.raises(AttributeError):
+        frozen.clear()
+    with pytest.raises(AttributeError):
+        frozen |= {"c": 3}
+    with pytest.raises(TypeError):
+        frozen.b += [2]
+    assert frozen == {"a": 1, "b": [1]}
+
+
+def test_computed_serialization():
+    cart = make_cart([])
+    expected = {"lines": [{"price": 2}, {"price": 3}], "tax": 0.5, "total": 5}
+    expected["gross"] = 7.5
+    assert easytree.loadb(easytree.dumpb(cart)) == expected
+    assert easytree.packed.load(easytree.packed.encode(cart)) == expected
@@ -0,0 +1,159 @@
+import decimal
+import io
+from datetime import datetime
+
+import easytree
+import pytest
+
+
+def make_converters():
+    return easytree.Converters(
+        {
+            "*.created_at": datetime.fromisoformat,
+            "prices[*]": decimal.Decimal,
+            "**.id": str,
+        }
+    )
+
+
+def make_payload():
+    return {
+        "order": {"created_at": "2024-01-01", "id": 1},
+        "prices": [1.5, 2],
+        "lines": [{"product": {"id": 3}}],
+        "created_at": "not converted",
+    }
+
+
+def test_converters():
+    converters = make_converters()
+    payload = make_payload()
+    tree = easytree.dict(payload, convert=converters, frozen=True)
+    assert tree.order.created_at == datetime(2024, 1, 1)
+    assert tree.order.id == "1"
+    assert tree.prices == [decimal.Decimal("1.5"), decimal.Decimal("2")]
+    assert tree.lines[0].product.id == "3"
+    assert tree.created_at == "not converted"
+    assert easytree.frozen(tree.lines[0].product)
+    assert payload["order"]["id"] == 1
+
+
+def test_converters_loaders():
+    converters = make_converters()
+    payload = make_payload()
+    expected = easytree.dict(payload, convert=converters)
+    assert easytree.loadb(easytree.dumpb(payload), convert=converters) == expected
+    assert easytree.types.cast(payload, convert=converters) == expected
+
+    lines = io.StringIO('{"prices": [1]}\n{"prices": [2]}\n')
+    records = list(easytree.iter_jsonl(lines, convert=converters))
+    assert [record.prices[0] for record in records] == [1, 2]
+    assert isinstance(records[0].prices[0], decimal.Decimal)
+
+
+def test_converters_first_match():
+    converters = easytree.Converters({"a.b": lambda x: "first", "**": lambda x: "last"})
+    tree = easytree.dict({"a": {"b": 1}, "c": 2}, convert=converters)
+    assert tree == {"a": "last", "c": "last"}  # a matches ** before a.b
+
+    converters = easytree.Converters(
+        {"a.b": lambda x: "first", "*.*": lambda x: "last"}
+    )
+    tree = easytree.dict({"a": {"b": 1, "c": 2}}, convert=converters)
+    assert tree == {"a": {"b": "first", "c": "last"}}
+
+
+def test_converters_below_converted_value():
+    converters = easytree.Converters({"a": dict, "a.b": lambda x: "below"})
+    payload = {"a": {"b": 1}}
+    assert easytree.dict(payload, convert=converters) == {"a": {"b": 1}}
+    tree = easytree.loadb(easytree.dumpb(payload), convert=converters)
+    assert tree == {"a": {"b": 1}}
+    assert isinstance(tree.a, easytree.dict)
+
+
+def test_converters_errors_are_raised():
+    def fail(value):
+        raise TypeError("not convertible")
+
+    converters = easytree.Converters({"a": fail})
+    with pytest.raises(TypeError, match="not convertible"):
+        easytree.dict({"a": 1}, convert=converters)
+    with pytest.raises(TypeError, match="not convertible"):
+        easytree.loadb(easytree.dumpb({"a": 1}), convert=converters)
+
+
+def test_converters_cast_once(monkeypatch):
+    converters = make_converters()
+    payload = make_payload()
+    calls = []
+    items_of = easytree.Converters._items_of
+
+    def counting(self, *args):
+        calls.append(1)
+        return items_of(self, *args)
+
+    monkeypatch.setattr(easytree.Converters, "_items_of", counting)
+    tree = easytree.types.cast(payload, convert=converters)
+    assert len(calls) == 1
+    assert tree == easytree.dict(payload, convert=converters)
+
+
+def test_converters_subclass():
+    converters = make_converters()
+    payload = make_payload()
+
+    class Order(easytree.dict):
+        def __init__(self, *args, sealed=False, frozen=False, **kwargs):
+            super().__init__(*args, sealed=sealed, frozen=frozen, **kwargs)
+
+    tree = easytree.types.cast(Order(payload), convert=converters, frozen=True)
+    assert type(tree) is Order
+    assert tree.order.id == "1"
+    assert easytree.frozen(tree)
+
+    tree = easytree.dict({"order": Order(payload["order"])}, convert=converters)
+    assert type(tree.order) is Order
+    assert tree.order.created_at == datetime(2024, 1, 1)
+
+    Record = easytree.compile_schema({"id": None})
+    tree = easytree.types.cast(Record({"id": 1}), convert=converters)
+    assert type(tree) is Record
+    assert tree.id == "1"
+
+
+def test_converters_threadsafe():
+    converters = make_converters()
+    payload = make_payload()
+    tree = easytree.threadsafe.dict(payload, convert=converters)
+    assert "convert" not in tree
+    assert tree.order.created_at == datetime(2024, 1, 1)
+    assert isinstance(tree.order, easytree.threadsafe.dict)
+    assert isinstance(tree.lines[0].product, easytree.threadsafe.dict)
+
+    prices = easytree.threadsafe.list([1, 2], convert=easytree.Converters({"[*]": str}))
+    assert prices == ["1", "2"]
+
+
+def test_converters_schema():
+    converters = easytree.Converters({"a": str})
+    with pytest.raises(TypeError):
+        easytree.dict({"a": 1}, convert=converters, schema=easytree.Schema({"a": str}))
+    with pytest.raises(TypeError):
+        easytree.list([1], convert=converters, schema=easytree.Schema([int]))
+
+
+def test_converters_states():
+    converters = make_converters()
+    payload = make_payload()
+    for _ in range(3):
+        easytree.dict(payload, convert=converters)
+    states = len(converters._states)
+    easytree.dict(payload, convert=converters)
+    assert len(converters._states) == states  # states are cached
+
+
+@pytest.mark.parametrize("pattern", ["a..b", "a[0]", "a[*"])
+def test_converters_invalid(pattern):
+    with pytest.raises(ValueError):
+        easytree.Converters({pattern: str})
@@ -0,0 +1,66 @@
+import easytree
+import easytree.types
+import pytest
+
+
+def test_disabled():
+    assert easytree.instrumentation.enabled() is False
+    assert "__new__" not in vars(easytree.dict)
+    assert easytree.types.cast.__module__ == "easytree.types"
+
+
+def test_recording():
+    with easytree.instrumentation.recording() as report:
+        assert easytree.instrumentation.enabled() is True
+
+        tree = easytree.dict()
+        tree.address.city
+        tree.friends.append({"name": "David"})
+
+        sealed = easytree.dict({"name": "David"}, sealed=True)
+        with pytest.raises(AttributeError):
+            sealed.age = 31
+        with pytest.raises(KeyError):
+            sealed["age"]
+
+    assert easytree.instrumentation.enabled() is False
+    assert "__new__" not in vars(easytree.dict)
+
+    result = report()
+    assert result.undefined.total == 4
+    # reading through an undefined node looks up its key in its parent again
+    assert result.undefined.paths == {"address": 2, "address.city": 1, "friends": 1}
+    assert result.materialize.total == 1
+    assert result.materialize.paths == {"friends": 1}
+    assert result.rejection.total == 2
+    assert result.rejection.paths == {"age": 2}
+    assert result.node.total == 4
+    assert result.cast.total > 0
+
+    # counts are attributed to this file
+    assert all(site.startswith(__file__) for site in result.undefined.sites)
+
+
+def test_recording_ingest():
+    with easytree.instrumentation.recording() as report:
+        frozen = easytree.list([1], frozen=True)
+        with pytest.raises(TypeError):
+            frozen.ingest([2])
+        easytree.list().ingest([{"a": 1}])
+
+    assert report().rejection.total == 1
+
+
+def test_reset():
+    easytree.instrumentation.reset()
+    easytree.instrumentation.enable()
+    try:
+        easytree.dict().missing
+        assert easytree.instrumentation.report().undefined.total == 1
+        easytree.instrumentation.reset()
+        assert easytree.instrumentation.report().undefined.total == 0
+    finally:
+        easytree.instrumentation.disable()
+
+    easytree.dict().missing
+    assert easytree.instrumentation.report().undefined.total == 0
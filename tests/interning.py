@@ -0,0 +1,98 @@
+import easytree
+import pytest
+
+
+def records(n):
+    # build the keys dynamically, such that equal keys are distinct objects
+    return [
+        {"".join(["na", "me"]): "".join(["Da", "vid"]), "".join(["a", "ge"]): i}
+        for i in range(n)
+    ]
+
+
+def test_intern_keys():
+    interner = easytree.Interner()
+    trees = [easytree.dict(record, intern=interner) for record in records(10)]
+    keys = [next(iter(tree)) for tree in trees]
+    assert all(key is keys[0] for key in keys)
+    assert trees[0].name is not trees[1].name  # values are not interned
+
+    report = interner.report()
+    assert report.strings == 2
+    assert report.hits == 18
+    assert report.bytes_saved > 0
+
+
+def test_intern_values():
+    interner = easytree.Interner(values=True, max_length=5)
+    trees = easytree.list(
+        [
+            {"name": "".join(["Da", "vid"]), "bio": "".join(["long", "er text"])}
+            for _ in range(2)
+        ],
+        intern=interner,
+    )
+    assert trees[0].name is trees[1].name
+    assert trees[0].bio is not trees[1].bio
+
+
+def test_intern_nested():
+    interner = easytree.Interner()
+    tree = easytree.dict(
+        {"a": [{"".join(["ke", "y"]): 1}, {"".join(["ke", "y"]): 2}]},
+        frozen=True,
+        intern=interner,
+    )
+    first, second = (next(iter(node)) for node in tree.a)
+    assert first is second
+    assert easytree.frozen(tree.a[0])
+
+
+def test_intern_default():
+    easytree.interning.default.clear()
+    easytree.dict({"".join(["ke", "y"]): 1}, intern=True)
+    tree = easytree.dict({"".join(["ke", "y"]): 2}, intern=True)
+    assert next(iter(tree)) is easytree.interning.default._table["key"]
+    assert easytree.interning.default.report().hits == 1
+    easytree.interning.default.clear()
+
+
+def test_intern_max_size():
+    interner = easytree.Interner(max_size=1)
+    trees = [easytree.dict(record, intern=interner) for record in records(3)]
+    assert len(interner) == 1
+    names, ages = ([list(tree)[i] for tree in trees] for i in range(2))
+    assert all(name is names[0] for name in names)
+    assert ages[0] is not ages[1]  # not added to the full table
+    assert trees[2] == {"name": "David", "age": 2}
+
+    assert easytree.interning.default._max_size == 65536
+    with pytest.raises(ValueError):
+        easytree.Interner(max_size=-1)
+
+
+def test_intern_cast_nodes():
+    interner = easytree.Interner()
+    tree = easytree.dict(records(1)[0])
+    # nodes with the requested flags are returned as is, keys included
+    assert easytree.types.cast(tree, intern=interner) is tree
+    assert len(interner) == 0
+    frozen = easytree.types.cast(tree, frozen=True, intern=interner)
+    assert len(interner) == 2
+    assert easytree.frozen(frozen)
+
+
+def test_intern_loadb():
+    interner = easytree.Interner(values=True)
+    data = easytree.dumpb({"name": "David"})
+    first = easytree.loadb(data, intern=interner)
+    second = easytree.loadb(data, intern=interner)
+    assert first == second
+    assert next(iter(first)) is next(iter(second))
+    assert first.name is second.name
+
+
+def test_intern_invalid():
+    with pytest.raises(TypeError):
+        easytree.dict({"a": 1}, intern="yes")
+    assert easytree.dict({"a": 1}, intern=False) == {"a": 1}
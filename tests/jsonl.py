@@ -0,0 +1,95 @@
+import json
+
+import easytree
+import easytree.jsonl
+import pytest
+
+
+def write_records(tmp_path):
+    path = tmp_path / "records.jsonl"
+    with open(path, "w") as file:
+        for i in range(1000):
+            file.write(json.dumps({"id": i, "tags": ["a", "b"], "meta": {"i": i}}))
+            file.write("\n")
+            if i % 100 == 0:
+                file.write("\n")  # blank lines are skipped
+    return path
+
+
+def test_load_jsonl(tmp_path):
+    path = write_records(tmp_path)
+    records = easytree.load_jsonl(path, workers=1)
+    assert isinstance(records, easytree.list)
+    assert [record.id for record in records] == list(range(1000))
+    assert isinstance(records[0].meta, easytree.dict)
+    assert not easytree.frozen(records)
+
+
+def test_load_jsonl_parallel(tmp_path, monkeypatch):
+    path = write_records(tmp_path)
+    monkeypatch.setattr(easytree.jsonl, "_min_chunk_size", 1000)
+    assert len(easytree.jsonl._chunks(path, 8)) == 8
+
+    records = easytree.load_jsonl(path, workers=2, frozen=True)
+    assert [record.id for record in records] == list(range(1000))
+    assert easytree.frozen(records)
+    assert easytree.frozen(records[999].tags)
+    with pytest.raises(AttributeError):
+        records[0].id = 1
+
+
+def test_chunks(tmp_path, monkeypatch):
+    path = write_records(tmp_path)
+    monkeypatch.setattr(easytree.jsonl, "_min_chunk_size", 1)
+    chunks = easytree.jsonl._chunks(path, 37)
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == path.stat().st_size
+    data = path.read_bytes()
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert data[start - 1 : start] == b"\n"
+
+
+def test_load_jsonl_empty(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_text("")
+    assert easytree.load_jsonl(path) == []
+
+
+def test_load_jsonl_invalid(tmp_path):
+    path = tmp_path / "invalid.jsonl"
+    path.write_text('{"a": 1}\n{"a": \n')
+    with pytest.raises(ValueError):
+        easytree.load_jsonl(path, workers=1)
+
+
+def test_iter_jsonl(tmp_path):
+    path = write_records(tmp_path)
+    with open(path) as file:
+        records = easytree.iter_jsonl(file)
+        first = next(records)
+        assert isinstance(first, easytree.dict)
+        assert easytree.frozen(first.meta)
+        assert [record.id for record in records] == list(range(1, 1000))
+
+
+def test_iter_jsonl_batches(tmp_path):
+    path = write_records(tmp_path)
+    interner = easytree.Interner()
+    with open(path, "rb") as file:
+        batches = list(
+            easytree.iter_jsonl(file, batch_size=300, frozen=False, intern=interner)
+        )
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+    assert all(isinstance(batch, easytree.list) for batch in batches)
+    assert not easytree.frozen(batches[0][0])
+    first, last = batches[0][0], batches[-1][-1]
+    assert next(iter(first)) is next(iter(last))
+    assert interner.report().strings == 4
+
+
+def test_iter_jsonl_invalid():
+    with pytest.raises(ValueError):
+        next(easytree.iter_jsonl(["{}"], batch_size=0))
+    with pytest.raises(ValueError):
+        list(easytree.iter_jsonl(['{"a": 1}', "{"]))
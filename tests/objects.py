@@ -0,0 +1,84 @@
+import dataclasses
+import typing
+
+import easytree
+import pytest
+
+
+@dataclasses.dataclass
+class Database:
+    host: str
+    port: int = 5432
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: typing.List["Node"] = dataclasses.field(default_factory=list)
+    database: typing.Optional[Database] = None
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: int = 0
+
+
+@dataclasses.dataclass
+class Config:
+    databases: typing.List[Database]
+    replicas: typing.Dict[str, Database]
+    root: Node
+    points: typing.Tuple[Point, ...] = ()
+    meta: dict = None
+
+
+def make_tree():
+    return easytree.dict(
+        {
+            "databases": [{"host": "primary"}],
+            "replicas": {"eu": {"host": "eu", "port": 1}},
+            "root": {
+                "name": "a",
+                "children": [{"name": "b", "database": {"host": "c"}}],
+            },
+            "points": [{"x": 1}, {"x": 2, "y": 3}],
+            "meta": {"owner": "David"},
+            "ignored": True,
+        }
+    )
+
+
+def test_to_object():
+    tree = make_tree()
+    config = easytree.to_object(tree, Config)
+    assert config.databases == [Database("primary", 5432)]
+    assert config.replicas == {"eu": Database("eu", 1)}
+    assert config.root.children[0] == Node("b", [], Database("c"))
+    assert config.root.database is None
+    assert config.points == (Point(1, 0), Point(2, 3))
+    assert config.meta == {"owner": "David"}
+    assert easytree.to_object({"host": "h"}, Database) == Database("h")
+
+
+def test_to_object_errors():
+    with pytest.raises(TypeError, match="host"):
+        easytree.to_object({"port": 1}, Database)
+    with pytest.raises(TypeError):
+        easytree.to_object({}, dict)
+
+
+def test_from_object():
+    tree = make_tree()
+    config = easytree.to_object(tree, Config)
+    copy = easytree.from_object(config, frozen=True)
+    assert isinstance(copy, easytree.dict)
+    assert isinstance(copy.databases[0], easytree.dict)
+    assert easytree.frozen(copy.root.children[0].database)
+    assert copy.points[1] == {"x": 2, "y": 3}
+    assert copy == {
+        **dataclasses.asdict(config),
+        "points": ({"x": 1, "y": 0}, {"x": 2, "y": 3}),
+    }
+    assert easytree.to_object(copy, Config) == config
+    assert easytree.from_object([Point(1)]) == [{"x": 1, "y": 0}]
+    assert easytree.from_object(1) == 1
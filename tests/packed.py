@@ -0,0 +1,91 @@
+import easytree
+import easytree.packed
+import pytest
+
+TREE = {
+    "name": "David",
+    "age": 31,
+    "height": 1.82,
+    "active": True,
+    "manager": None,
+    "avatar": b"\x00\x01",
+    "balance": 2**80,
+    "friends": [{"name": "Celine"}, {"name": "Bob", "tags": ("a", "b")}],
+    "address": {"city": "London", "country": "United Kingdom"},
+}
+
+
+def test_roundtrip():
+    tree = easytree.packed.load(easytree.packed.encode(TREE))
+    assert isinstance(tree, easytree.packed.PackedDict)
+    assert tree == TREE
+    assert list(tree) == list(TREE)
+    assert len(tree) == len(TREE)
+    assert tree.balance == 2**80
+    assert tree.avatar == b"\x00\x01"
+    assert tree.friends[1].tags == ("a", "b")
+
+    tree = easytree.packed.load(easytree.packed.encode([1, [2, {"a": 3}]]))
+    assert isinstance(tree, easytree.packed.PackedList)
+    assert tree == [1, [2, {"a": 3}]]
+    assert tree[-1][1].a == 3
+    assert tree[:1] == [1]
+
+
+def test_access():
+    tree = easytree.packed.load(easytree.packed.encode(TREE))
+    assert tree.address.city == "London"
+    assert tree["address"]["city"] == "London"
+    assert "address" in tree
+    assert "missing" not in tree
+    assert 1 not in tree
+
+    with pytest.raises(KeyError):
+        tree["missing"]
+
+    with pytest.raises(AttributeError):
+        tree.missing
+
+    with pytest.raises(IndexError):
+        tree.friends[2]
+
+    assert tree.get("missing") is None
+    assert tree.get(["friends", 0, "name"]) == "Celine"
+    assert tree.get(["friends", 2, "name"], "N/A") == "N/A"
+    assert tree.get(["address", "city", "name"], "N/A") == "N/A"
+
+
+def test_materialize():
+    tree = easytree.packed.load(easytree.packed.encode(TREE)).materialize()
+    assert isinstance(tree, easytree.dict)
+    assert easytree.frozen(tree) is True
+    assert tree == TREE
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        easytree.packed.encode({1: "a"})
+
+    with pytest.raises(TypeError):
+        easytree.packed.encode({"a": object()})
+
+    with pytest.raises(ValueError):
+        easytree.packed.load(b"not a packed tree, at all")
+
+
+def test_mmap(tmp_path):
+    path = tmp_path / "tree.etpk"
+    easytree.mmap_dump(easytree.dict(TREE), path)
+
+    tree = easytree.mmap_open(path)
+    assert isinstance(tree, easytree.packed.PackedDict)
+    assert tree == TREE
+    assert tree.friends[0].name == "Celine"
+    assert tree.get(["address", "city"]) == "London"
+    assert [friend.name for friend in tree.friends] == ["Celine", "Bob"]
+
+    assert path.read_bytes() == easytree.packed.encode(TREE)
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        easytree.mmap_open(path)
@@ -0,0 +1,132 @@
+import copy
+import easytree
+import gc
+import pytest
+import pickle
+import json
+
+
+def test_compile_schema():
+    Person = easytree.compile_schema({"name": None, "address": {"city": None}})
+
+    person = Person({"name": "David", "address": {"city": "London"}})
+    assert isinstance(person, easytree.dict)
+    assert isinstance(person.address, easytree.dict)
+    assert easytree.sealed(person) is True
+    assert easytree.sealed(person.address) is True
+    assert easytree.frozen(person) is False
+    assert person.name == "David"
+    assert person.address.city == "London"
+    assert person["address"]["city"] == "London"
+
+    person.name = "Bob"
+    assert person.name == "Bob"
+
+    with pytest.raises(AttributeError):
+        person.age = 31
+
+    with pytest.raises(AttributeError):
+        person.age
+
+
+def test_compile_schema_computed():
+    Person = easytree.compile_schema({"name": None, "greeting": None})
+
+    person = Person(name="David")
+    person.greeting = easytree.computed(lambda p: f"Hello {p.name}")
+    assert person.greeting == "Hello David"
+    assert person["greeting"] == "Hello David"
+    person.name = "Bob"
+    assert person.greeting == "Hello Bob"
+
+
+def test_compile_schema_defaults():
+    Person = easytree.compile_schema(
+        {"name": None, "tags": [], "address": {"city": "London"}}
+    )
+
+    person = Person(name="David")
+    assert person == {"name": "David", "tags": [], "address": {"city": "London"}}
+    assert isinstance(person.tags, easytree.list)
+
+    # defaults are not shared between records
+    other = Person()
+    assert other.tags is not person.tags
+
+    with pytest.raises(KeyError):
+        Person({"name": "David", "age": 31})
+
+
+def test_compile_schema_frozen():
+    Person = easytree.compile_schema({"name": None, "address": {"city": None}}, frozen=True)
+
+    person = Person({"name": "David"})
+    assert easytree.frozen(person) is True
+    assert easytree.frozen(person.address) is True
+
+    with pytest.raises(AttributeError):
+        person.name = "Bob"
+
+
+def test_compile_schema_no_instance_dict():
+    Person = easytree.compile_schema({"name": None})
+
+    person = Person({"name": "David"})
+    # copies do not allocate an instance __dict__ either
+    for clone in (copy.copy(person), copy.deepcopy(person)):
+        assert type(clone) is Person
+        assert easytree.sealed(clone) is True
+        assert not any(type(item) is dict for item in gc.get_referents(clone))
+
+    assert "_sealed" not in vars(person)
+    assert "_frozen" not in vars(person)
+
+
+def test_compile_schema_reserved_keys():
+    Record = easytree.compile_schema({"items": 1, "first name": 2})
+
+    record = Record()
+    assert callable(record.items)
+    assert record["items"] == 1
+    assert record["first name"] == 2
+
+
+def test_compile_schema_casting():
+    Person = easytree.compile_schema({"name": None, "address": {"city": None}})
+    person = Person({"name": "David"})
+
+    frozen = easytree.freeze(person)
+    assert isinstance(frozen, Person)
+    assert easytree.frozen(frozen) is True
+    assert easytree.frozen(frozen.address) is True
+
+    unsealed = easytree.unseal(person)
+    assert easytree.sealed(unsealed) is False
+    unsealed.age = 31
+    assert unsealed.age == 31
+
+    # keys outside of the template are kept when the record is re-cast
+    frozen = easytree.freeze(unsealed)
+    assert isinstance(frozen, Person)
+    assert frozen == {"name": "David", "address": {"city": None}, "age": 31}
+    assert easytree.frozen(frozen) is True
+    sealed = easytree.seal(unsealed)
+    assert sealed.age == 31
+    assert easytree.sealed(sealed) is True
+    assert easytree.freeze(unsealed, inplace=True) is unsealed
+    assert easytree.frozen(unsealed) is True
+
+    assert Person({"name": "David", "age": 31}, sealed=False).age == 31
+
+
+def test_compile_schema_serialization():
+    Person = easytree.compile_schema({"name": None, "address": {"city": None}})
+    person = Person({"name": "David"})
+
+    assert json.loads(json.dumps(person)) == {"name": "David", "address": {"city": None}}
+
+    copy = pickle.loads(pickle.dumps(person))
+    assert copy == person
+    assert isinstance(copy, easytree.dict)
+    assert easytree.sealed(copy) is True
+    assert easytree.sealed(copy.address) is True
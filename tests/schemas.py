@@ -0,0 +1,113 @@
+import easytree
+import pytest
+
+
+def make_person():
+    return easytree.Schema(
+        {
+            "name": str,
+            "age": int,
+            "address": {"city": str},
+            "friends": [{"name": str}],
+            "nickname": (str, None),
+        },
+        optional=["nickname", "address"],
+    )
+
+
+def test_schema():
+    person = make_person()
+    tree = easytree.dict(
+        {"name": "David", "age": 31, "friends": [{"name": "Celine"}], "nickname": None},
+        schema=person,
+        frozen=True,
+    )
+    assert tree.friends[0].name == "Celine"
+    assert isinstance(tree.friends, easytree.list)
+    assert easytree.frozen(tree.friends[0])
+
+    numbers = easytree.list([1, 2], schema=easytree.Schema([int]))
+    assert numbers == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "payload, path, reason",
+    [
+        ({"name": "David", "age": "31", "friends": []}, ("age",), "expected int"),
+        ({"name": "David", "friends": []}, ("age",), "missing key"),
+        ({"name": "David", "age": 31, "friends": [], "x": 1}, ("x",), "unexpected key"),
+        (
+            {"name": "David", "age": 31, "friends": [{"name": "Celine"}, {"name": 1}]},
+            ("friends", 1, "name"),
+            "expected str",
+        ),
+        (
+            {"name": "David", "age": 31, "friends": [], "address": "London"},
+            ("address",),
+            "expected dict",
+        ),
+        ({"name": "David", "age": 31, "friends": {}}, ("friends",), "expected list"),
+    ],
+)
+def test_schema_errors(payload, path, reason):
+    person = make_person()
+    with pytest.raises(easytree.SchemaError) as error:
+        easytree.dict(payload, schema=person)
+    assert error.value.path == path
+    assert error.value.reason.startswith(reason)
+    assert isinstance(error.value, ValueError)
+
+
+def test_schema_error_message():
+    person = make_person()
+    with pytest.raises(easytree.SchemaError, match=r"at 'friends\[0\]\.name'"):
+        easytree.dict(
+            {"name": "David", "age": 31, "friends": [{"name": None}]}, schema=person
+        )
+
+
+def test_schema_extra():
+    schema = easytree.Schema({"name": str}, extra=True)
+    tree = easytree.dict({"name": "David", "meta": {"a": 1}}, schema=schema)
+    assert isinstance(tree.meta, easytree.dict)
+
+
+def test_schema_threadsafe():
+    person = make_person()
+    payload = {"name": "David", "age": 31, "friends": [{"name": "Celine"}]}
+    tree = easytree.threadsafe.dict(payload, schema=person)
+    assert "schema" not in tree
+    assert isinstance(tree.friends, easytree.threadsafe.list)
+    assert isinstance(tree.friends[0], easytree.threadsafe.dict)
+    with pytest.raises(easytree.SchemaError):
+        easytree.threadsafe.dict({"name": "David"}, schema=person)
+
+    numbers = easytree.threadsafe.list([1, 2], schema=easytree.Schema([int]))
+    assert numbers == [1, 2]
+
+
+def test_schema_node_types():
+    person = make_person()
+    Address = easytree.compile_schema({"city": None})
+    tree = easytree.dict(
+        {
+            "name": "David",
+            "age": 31,
+            "address": Address({"city": "London"}),
+            "friends": easytree.threadsafe.list([{"name": "Celine"}]),
+        },
+        schema=person,
+        frozen=True,
+    )
+    assert type(tree.address) is Address
+    assert tree.address.city == "London"
+    assert easytree.frozen(tree.address)
+    assert isinstance(tree.friends, easytree.threadsafe.list)
+    assert isinstance(tree.friends[0], easytree.threadsafe.dict)
+
+
+def test_schema_invalid():
+    with pytest.raises(TypeError):
+        easytree.Schema({"name": "str"})
+    with pytest.raises(TypeError):
+        easytree.Schema([int, str])
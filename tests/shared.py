@@ -0,0 +1,52 @@
+import concurrent.futures
+import easytree
+import itertools
+import multiprocessing
+import pickle
+import pytest
+
+
+def read(shared, key):
+    return shared.tree.prices[key]
+
+
+def test_share():
+    tree = easytree.dict({"prices": {"apple": 1.5, "pear": 2}})
+
+    with easytree.share(tree) as shared:
+        assert shared.tree == tree
+        assert shared.tree.prices.apple == 1.5
+
+        handle = pickle.loads(pickle.dumps(shared))
+        assert handle.name == shared.name
+        assert handle.tree.prices.pear == 2
+
+        with pytest.raises(RuntimeError):
+            handle.unlink()
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_share_with_workers(method, capfd):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} is not available")
+    tree = {"prices": {f"item{i}": i for i in range(100)}}
+    keys = ["item1", "item50", "item99"]
+    context = multiprocessing.get_context(method)
+
+    with easytree.share(tree) as shared:
+        with concurrent.futures.ProcessPoolExecutor(2, mp_context=context) as pool:
+            assert list(pool.map(read, itertools.repeat(shared), keys)) == [1, 50, 99]
+    # the workers release the shared memory when they exit
+    assert "BufferError" not in capfd.readouterr().err
+
+
+def test_share_close():
+    with easytree.share({"a": {"b": 1}}) as shared:
+        handle = pickle.loads(pickle.dumps(shared))
+        view = handle.tree.a
+        handle.close()
+        with pytest.raises(ValueError):
+            view.b
+        assert handle.tree.a.b == 1  # attached again
+        handle.close()
+        handle.close()
@@ -0,0 +1,111 @@
+import easytree
+import pytest
+
+
+def make_chart():
+    return easytree.template(
+        {
+            "axes": [
+                {"title": {"text": easytree.placeholder("x")}},
+                {"title": {"text": easytree.placeholder("y", default="value")}},
+            ],
+            "legend": {"position": "bottom", "items": [{"visible": True}]},
+            "series": easytree.placeholder("series", default=[]),
+        }
+    )
+
+
+def test_render():
+    chart = make_chart()
+    tree = chart.render(x="time", series=[{"name": "a"}])
+    assert tree == {
+        "axes": [{"title": {"text": "time"}}, {"title": {"text": "value"}}],
+        "legend": {"position": "bottom", "items": [{"visible": True}]},
+        "series": [{"name": "a"}],
+    }
+    assert isinstance(tree, easytree.dict)
+    assert isinstance(tree.axes, easytree.list)
+    assert isinstance(tree.series[0], easytree.dict)
+    assert chart(x="time", y="value") == chart.render(x="time")
+    assert chart.placeholders == {"x", "y", "series"}
+
+
+def test_render_shares_constant_subtrees():
+    chart = make_chart()
+    first, second = chart.render(x="a"), chart.render(x="b")
+    assert first.legend is second.legend
+    assert easytree.frozen(first.legend)
+    assert first.axes is not second.axes
+    assert not easytree.frozen(first.axes[0].title)
+    first.axes[0].title.text = "c"
+    assert second.axes[0].title.text == "b"
+    with pytest.raises(AttributeError):
+        first.legend.position = "top"
+    # defaults are cast on each render
+    first.series.append(1)
+    assert second.series == []
+
+
+def test_render_unfrozen_in_place():
+    chart = make_chart()
+    first = easytree.unfreeze(chart.render(x="a"), inplace=True)
+    first.legend.position = "top"
+    first.legend["items"][0].visible = False
+    second = chart.render(x="b")
+    assert second.legend == {"position": "bottom", "items": [{"visible": True}]}
+    assert easytree.frozen(second.legend)
+
+
+def test_render_flags():
+    template = easytree.template(
+        {"a": {"b": easytree.placeholder("b")}}, sealed=True, frozen=True
+    )
+    tree = template.render(b={"c": 1})
+    assert easytree.sealed(tree) and easytree.frozen(tree)
+    assert easytree.frozen(tree.a.b)
+
+
+def test_render_errors():
+    chart = make_chart()
+    with pytest.raises(TypeError, match="missing value for placeholder 'x'"):
+        chart.render()
+    with pytest.raises(TypeError, match="unknown placeholder 'z'"):
+        chart.render(x=1, z=2)
+    with pytest.raises(ValueError):
+        easytree.placeholder("not a name")
+    with pytest.raises(ValueError):
+        easytree.template(
+            [easytree.placeholder("a", default=1), easytree.placeholder("a")]
+        )
+
+
+def test_template_without_placeholders():
+    template = easytree.template({"a": [1, {"b": 2}]})
+    first, second = template.render(), template.render()
+    assert first == {"a": [1, {"b": 2}]}
+    assert first is not second
+    assert first.a is second.a  # constant subtrees are shared
+    assert not easytree.frozen(first)
+    first.c = 3
+    assert "c" not in template.render()
+
+    template = easytree.template([{"a": 1}], sealed=True)
+    assert easytree.sealed(template.render())
+    assert easytree.template(easytree.placeholder("a")).render(a=[1]) == [1]
+
+
+def test_render_repeated_placeholder():
+    template = easytree.template(
+        {"a": easytree.placeholder("v"), "b": {"c": easytree.placeholder("v")}}
+    )
+    tree = template.render(v={"d": 1})
+    assert tree.a == tree.b.c
+    assert tree.a is not tree.b.c
+    tree.a.d = 2
+    assert tree.b.c.d == 1
+
+    node = easytree.dict({"d": 1})
+    tree = template.render(v=node)
+    assert tree.a is node
+    assert tree.b.c is not node
+    assert tree.b.c == node
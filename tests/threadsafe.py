@@ -0,0 +1,106 @@
+import easytree
+import pickle
+import pytest
+import threading
+
+
+def test_types():
+    tree = easytree.threadsafe.dict({"friends": [{"name": "David"}], "address": {}})
+    assert isinstance(tree, easytree.dict)
+    assert isinstance(tree.friends, easytree.threadsafe.list)
+    assert isinstance(tree.friends[0], easytree.threadsafe.dict)
+    assert isinstance(tree.address, easytree.threadsafe.dict)
+    assert isinstance(tree.missing, easytree.threadsafe.undefined)
+    assert isinstance(tree["missing"], easytree.threadsafe.undefined)
+    assert isinstance(tree.missing.deeper, easytree.threadsafe.undefined)
+
+    tree.context.city = "London"
+    assert isinstance(tree.context, easytree.threadsafe.dict)
+
+    tree.numbers.append(1)
+    assert isinstance(tree.numbers, easytree.threadsafe.list)
+
+    tree.friends.append(name="Celine")
+    assert isinstance(tree.friends[1], easytree.threadsafe.dict)
+
+    tree.address = {"country": "UK"}
+    assert isinstance(tree.address, easytree.threadsafe.dict)
+
+
+def test_ingest():
+    tree = easytree.threadsafe.list()
+    assert tree.ingest(({"a": [i]} for i in range(25)), chunk_size=10) == 25
+    assert isinstance(tree[-1], easytree.threadsafe.dict)
+    assert isinstance(tree[-1].a, easytree.threadsafe.list)
+    with pytest.raises(TypeError):
+        easytree.threadsafe.list(frozen=True).ingest([1])
+    with pytest.raises(TypeError):
+        easytree.threadsafe.list(sealed=True).ingest([1])
+    with pytest.raises(ValueError):
+        tree.ingest([1], chunk_size=0)
+    assert len(tree) == 25
+
+    node = easytree.threadsafe.dict({"a": 1})
+    assert tree.ingest([node]) == 1
+    assert tree[-1] is node
+
+
+def test_flags():
+    tree = easytree.threadsafe.dict({"address": {"city": "London"}}, frozen=True)
+    assert easytree.frozen(tree.address) is True
+
+    with pytest.raises(AttributeError):
+        tree.address.city = "Paris"
+
+    with pytest.raises(AttributeError):
+        tree.missing
+
+    tree = easytree.freeze(easytree.threadsafe.list([{"a": 1}]))
+    assert isinstance(tree, easytree.threadsafe.list)
+    assert isinstance(tree[0], easytree.threadsafe.dict)
+    assert easytree.frozen(tree[0]) is True
+
+
+def test_pickling():
+    tree = easytree.threadsafe.dict({"friends": [{"name": "David"}]})
+    copy = pickle.loads(pickle.dumps(tree))
+    assert copy == tree
+    assert isinstance(copy.friends[0], easytree.threadsafe.dict)
+
+
+def test_concurrent_vivification():
+    threads = 8
+    for _ in range(50):
+        tree = easytree.threadsafe.dict()
+        barrier = threading.Barrier(threads)
+
+        def write(i):
+            barrier.wait()
+            tree.a.b[f"key{i}"] = i
+            tree.a.log.append(i)
+
+        workers = [threading.Thread(target=write, args=(i,)) for i in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert tree.a.b == {f"key{i}": i for i in range(threads)}
+        assert sorted(tree.a.log) == list(range(threads))
+
+
+def test_lock():
+    tree = easytree.threadsafe.dict({"hits": 0})
+
+    def increment():
+        for _ in range(1000):
+            with easytree.threadsafe.lock(tree):
+                tree.hits = tree.hits + 1
+
+    workers = [threading.Thread(target=increment) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert tree.hits == 4000
@@ -295,6 +295,47 @@ def test_list_extending():
     assert len(tree) == 5
     assert isinstance(tree[-1], easytree.dict)
 
+    tree = easytree.list([{}])
+    tree.extend({"i": i} for i in range(2500))  # not materialized
+    assert len(tree) == 2501
+    assert isinstance(tree[-1], easytree.dict)
+
+    tree = easytree.list([1, 2])
+    tree.extend(tree)
+    assert tree == [1, 2, 1, 2]
+
+
+def test_list_append_returns_cast_value():
+    tree = easytree.list()
+    value = tree.append({"a": 1})
+    assert value is tree[0]
+    assert isinstance(value, easytree.dict)
+    assert tree.append(1) == 1
+
+
+def test_list_ingest():
+    records = ({"id": i, "tags": [i]} for i in range(2500))
+    tree = easytree.list([0])
+    assert tree.ingest(records, chunk_size=1000) == 2500
+    assert len(tree) == 2501
+    assert tree[-1] == {"id": 2499, "tags": [2499]}
+    assert isinstance(tree[-1].tags, easytree.list)
+    assert tree.ingest([]) == 0
+    assert tree.ingest(tree) == 2501
+    assert len(tree) == 5002
+
+    interner = easytree.Interner()
+    tree = easytree.list()
+    tree.ingest(({"id": i} for i in range(10)), intern=interner)
+    assert interner.report()["strings"] == 1
+
+    with pytest.raises(ValueError):
+        tree.ingest([1], chunk_size=0)
+    with pytest.raises(TypeError):
+        easytree.list(frozen=True).ingest([1])
+    with pytest.raises(TypeError):
+        easytree.list(sealed=True).ingest([1])
+
 
 def test_truthfulness():
     tree = easytree.dict()
@@ -598,6 +639,54 @@ def test_copy_again():
     assert x.copy() == [2, 1, 3]
 
 
+def test_copy_preserves_types_and_flags():
+    import copy
+
+    tree = easytree.dict({"a": {"b": [1, {"c": 2}]}}, sealed=True)
+    shallow = tree.copy()
+    assert type(shallow) is easytree.dict
+    assert easytree.sealed(shallow)
+    assert shallow.a is tree.a
+    assert copy.copy(tree) == tree and copy.copy(tree).a is tree.a
+
+    numbers = easytree.list([1, {"a": 1}], frozen=True)
+    assert type(numbers.copy()) is easytree.list
+    assert easytree.frozen(numbers.copy())
+    assert numbers.copy()[1] is numbers[1]
+
+    class Tree(easytree.dict):
+        pass
+
+    assert type(Tree({"a": 1}).copy(deep=True)) is Tree
+
+
+def test_deepcopy():
+    import copy
+
+    defaults = easytree.dict({"retries": 3, "codes": [500, 502]}, frozen=True)
+    request = easytree.dict({"headers": {"a": [1, 2]}, "tags": {"x", "y"}})
+    request["defaults"] = defaults  # the item notation does not cast the node
+    request.headers.alias = request.headers.a
+
+    clone = copy.deepcopy(request)
+    assert clone == request
+    assert type(clone.headers) is easytree.dict
+    assert clone.headers is not request.headers
+    assert clone.headers.a is not request.headers.a
+    assert clone.headers.alias is clone.headers.a  # shared references are preserved
+    assert clone.tags is not request.tags
+    assert clone.defaults is defaults  # frozen subtrees are shared
+
+    assert request.copy(deep=True) == request
+    assert defaults.copy(deep=True) is defaults
+
+    deep = node = easytree.dict()
+    for _ in range(5000):
+        node["child"] = easytree.dict()
+        node = node["child"]
+    assert deep.copy(deep=True) is not deep
+
+
 def test_deleting():
     x = easytree.list([2, 1, 3])
     del x[0]
@@ -968,3 +1057,41 @@ def test_popping_from_undefined_node_subsequently_cast():
     # pop a value from the node
     value = x.pop("key", None)
     assert value == "value"
+
+
+def test_fastaccess():
+    assert easytree.fastaccess() is False
+    try:
+        assert easytree.fastaccess() is True
+
+        tree = easytree.dict({"foo": {"bar": "baz"}, "items": 1})
+        assert tree.foo.bar == "baz"
+        assert callable(tree.items)
+        assert isinstance(tree.missing, easytree.undefined)
+        assert easytree.frozen(tree) is False
+
+        tree.missing.value = 1
+        assert tree.missing.value == 1
+
+        tree = easytree.dict({"foo": 1}, sealed=True)
+        with pytest.raises(AttributeError):
+            tree.bar
+
+        class Person(easytree.dict):
+            def fullname(self):
+                return f"{self.firstname} {self.lastname}"
+
+        person = Person({"firstname": "David", "lastname": "Smith", "fullname": 1})
+        assert person.fullname() == "David Smith"
+    finally:
+        assert easytree.fastaccess(False) is True
+    assert easytree.fastaccess(False) is False
+
+
+def test_missing_attribute_error_is_not_chained():
+    for flags in ({"sealed": True}, {"frozen": True}):
+        tree = easytree.dict({"foo": 1}, **flags)
+        with pytest.raises(AttributeError) as error:
+            tree.bar
+        assert error.value.__context__ is None
+        assert error.value.__cause__ is None
@@ -116,3 +116,163 @@ def test_unsealing():
     tree = easytree.dict({"friends": [{"firstname": "David"}]}, sealed=True)
     assert easytree.sealed(easytree.unseal(tree).friends) is False
     assert easytree.sealed(easytree.unseal(tree).friends[0]) is False
+
+
+def test_freeze_inplace():
+    tree = easytree.dict({"a": {"b": [1, {"c": 2}]}, "raw": None}, sealed=True)
+    node = tree.a
+    tree["raw"] = {"r": [1]}  # the item notation does not cast the value
+
+    assert easytree.freeze(tree, inplace=True) is tree
+    assert tree.a is node
+    assert easytree.frozen(node) and easytree.frozen(node.b[1])
+    assert easytree.sealed(node.b)  # the sealed flag is left as is
+    assert isinstance(tree.raw, easytree.dict) and easytree.frozen(tree.raw.r)
+    with pytest.raises(AttributeError):
+        node.z = 1
+
+    assert easytree.unfreeze(tree, inplace=True) is tree
+    assert tree.a is not node  # frozen nodes may be shared, and are copied
+    assert easytree.frozen(node) and easytree.frozen(node.b[1])
+    node = tree.a
+    assert not easytree.frozen(node.b[1])
+    with pytest.raises(AttributeError):
+        node.z = 1
+    assert easytree.unseal(tree, inplace=True) is tree
+    node.z = 1
+    assert tree.a.z == 1
+
+    assert easytree.seal(tree, inplace=True) is tree
+    with pytest.raises(AttributeError):
+        node.y = 1
+
+    with pytest.raises(TypeError):
+        easytree.freeze({"a": 1}, inplace=True)
+
+
+def test_unfreeze_inplace_shared_subtrees():
+    shared = easytree.dict({"b": {"c": 1}, "l": [{"d": 2}]}, frozen=True)
+    tree = easytree.dict()
+    tree["a"], tree["t"], tree["again"] = shared, (shared,), shared
+    copy = tree.copy(deep=True)
+    assert copy.a is shared
+
+    assert easytree.unfreeze(copy, inplace=True) is copy
+    copy.a.b.c = 3
+    copy.a.l[0].d = 4
+    assert copy.again is copy.a  # shared within the tree, copied once
+    assert copy.t[0] is copy.a
+    assert shared == {"b": {"c": 1}, "l": [{"d": 2}]}
+    assert easytree.frozen(shared) and easytree.frozen(shared.b)
+
+    other = easytree.dict()
+    other["a"] = shared
+    easytree.seal(other, inplace=True)
+    assert easytree.sealed(other.a) and not easytree.sealed(shared)
+
+    chart = easytree.template(
+        {"legend": {"pos": "bottom"}, "x": easytree.placeholder("x")}
+    )
+    first = easytree.unfreeze(chart.render(x=1), inplace=True)
+    first.legend.pos = "top"
+    assert chart.render(x=2).legend.pos == "bottom"
+
+    versioned = easytree.Versioned({"a": {"b": 1}})
+    first = versioned.snapshot
+    with versioned.write() as draft:
+        draft.c = 1
+    second = versioned.snapshot
+    assert second.a is first.a
+    easytree.unfreeze(second, inplace=True).a.b = 2
+    assert first.a.b == 1
+
+
+def test_stats():
+    tree = easytree.dict({"name": "David", "friends": [{"name": "Celine"}]})
+
+    stats = easytree.stats(tree)
+    assert stats.nodes == {"dict": 2, "list": 1}
+    assert stats.leaves == {"str": 2}
+    assert stats.depth == 3
+    assert stats.key_lengths.count == 3
+    assert stats.key_lengths.min == 4
+    assert stats.key_lengths.max == 7
+    assert stats.key_lengths.mean == 5
+    assert stats.key_lengths.histogram == {4: 2, 7: 1}
+    assert stats.sizeof > 0
+
+    # the per-node __dict__ is included in the size
+    record = easytree.compile_schema({"name": None})(name="David")
+    assert easytree.stats(tree.friends[0]).sizeof > easytree.stats(record).sizeof
+
+    stats = easytree.stats(easytree.dict())
+    assert stats.depth == 0
+    assert stats.key_lengths.count == 0
+    assert stats.key_lengths.mean is None
+
+    with pytest.raises(TypeError):
+        easytree.stats(1)
+
+
+def test_stats_deep_tree():
+    tree = easytree.dict()
+    node = tree
+    for _ in range(5000):
+        node.child = {}
+        node = node.child
+    node.leaf = 1
+
+    stats = easytree.stats(tree)
+    assert stats.depth == 5001
+    assert stats.nodes == {"dict": 5001}
+
+
+def test_to_builtin():
+    tree = easytree.dict(
+        {"name": "David", "friends": [{"name": "Celine"}], "point": (1, {"x": 2})},
+        frozen=True,
+    )
+    copy = easytree.to_builtin(tree)
+    assert copy == tree
+    assert type(copy) is dict
+    assert type(copy["friends"]) is list
+    assert type(copy["friends"][0]) is dict
+    assert type(copy["point"][1]) is dict
+    assert easytree.to_builtin([1, "a"]) == [1, "a"]
+
+
+def test_to_builtin_undefined():
+    tree = easytree.dict({"name": "David"})
+    tree["nickname"] = tree.nickname
+    tree["aliases"] = easytree.list([tree.alias, "Dave"])
+    assert easytree.to_builtin(tree) == {"name": "David", "aliases": ["Dave"]}
+    assert easytree.to_builtin(tree, undefined="null") == {
+        "name": "David",
+        "nickname": None,
+        "aliases": [None, "Dave"],
+    }
+    with pytest.raises(ValueError):
+        easytree.to_builtin(tree, undefined="keep")
+
+
+def test_to_builtin_deep_tree():
+    tree = node = easytree.dict()
+    for _ in range(10000):
+        node["child"] = easytree.dict()
+        node["undefined"] = node.missing
+        node = node["child"]
+    copy = easytree.to_builtin(tree)
+    depth = 0
+    while copy:
+        assert type(copy) is dict and "undefined" not in copy
+        copy = copy["child"]
+        depth += 1
+    assert depth == 10000
+
+
+def test_to_builtin_views():
+    packed = easytree.packed.load(easytree.packed.encode({"a": [1, {"b": 2}]}))
+    assert easytree.to_builtin(packed) == {"a": [1, {"b": 2}]}
+    assert type(easytree.to_builtin(packed)["a"]) is list
+    view = easytree.view({"a": [1]})
+    assert type(easytree.to_builtin(view)) is dict
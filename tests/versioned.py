@@ -0,0 +1,87 @@
+import easytree
+import pytest
+
+
+def test_snapshot():
+    config = easytree.Versioned({"database": {"host": "localhost"}, "flags": [1, 2]})
+    snapshot = config.snapshot
+
+    assert config.version == 0
+    assert snapshot == {"database": {"host": "localhost"}, "flags": [1, 2]}
+    assert easytree.frozen(snapshot) is True
+    assert easytree.frozen(snapshot.database) is True
+    assert easytree.frozen(snapshot.flags) is True
+
+    with pytest.raises(AttributeError):
+        snapshot.database.port = 5432
+
+
+def test_write():
+    config = easytree.Versioned({"database": {"host": "localhost"}, "flags": [1, 2]})
+    before = config.snapshot
+
+    with config.write() as draft:
+        assert easytree.frozen(draft) is False
+        draft.database.port = 5432
+        assert config.snapshot is before
+
+    after = config.snapshot
+    assert config.version == 1
+    assert after.database.port == 5432
+    assert "port" not in before.database
+
+    # unchanged subtrees are shared
+    assert after is not before
+    assert after.database is not before.database
+    assert after.flags is before.flags
+
+    # subsequent writes start from the working copy
+    with config.write() as draft:
+        draft.flags.append(3)
+    assert config.version == 2
+    assert config.snapshot.flags == [1, 2, 3]
+    assert config.snapshot.database is after.database
+
+
+def test_write_without_changes():
+    config = easytree.Versioned({"database": {"host": "localhost"}})
+    before = config.snapshot
+
+    with config.write() as draft:
+        draft.database.host = "localhost"
+
+    assert config.snapshot is before
+    assert config.version == 0
+
+    # values of a different type are not unchanged
+    with config.write() as draft:
+        draft.database.host = 1
+    with config.write() as draft:
+        draft.database.host = True
+    assert config.snapshot.database.host is True
+
+
+def test_write_failure():
+    config = easytree.Versioned({"database": {"host": "localhost"}})
+    before = config.snapshot
+
+    with pytest.raises(ValueError):
+        with config.write() as draft:
+            draft.database.host = "remote"
+            raise ValueError()
+
+    assert config.snapshot is before
+
+    with config.write() as draft:
+        assert draft.database.host == "localhost"
+
+
+def test_private_working_copy():
+    tree = easytree.dict({"database": {"host": "localhost"}})
+    config = easytree.Versioned(tree)
+
+    tree.database.host = "remote"
+    assert config.snapshot.database.host == "localhost"
+    with config.write() as draft:
+        assert draft is not tree
+        assert draft.database.host == "localhost"
@@ -0,0 +1,174 @@
+import copy
+
+import easytree
+import pytest
+
+
+def make_payload():
+    return {
+        "user": {"name": "David", "friends": [{"name": "Celine"}, {"name": "Bob"}]},
+        "settings": {"theme": "dark"},
+    }
+
+
+def test_view_reads():
+    payload = make_payload()
+    tree = easytree.view(payload)
+    assert isinstance(tree, easytree.views.DictView)
+    assert tree.user.name == "David"
+    assert tree["user"]["friends"][1].name == "Bob"
+    assert tree.user.friends[-1].name == "Bob"
+    assert tree.get(["user", "friends", 0, "name"]) == "Celine"
+    assert tree.get(["user", "address", "city"], "N/A") == "N/A"
+    assert isinstance(tree.address, easytree.undefined)
+    assert tree == payload
+    assert len(tree.user.friends) == 2
+    assert tree.unwrap() is payload
+    assert tree.user.unwrap() is payload["user"]
+    assert tree.user is tree.user  # children are cached
+
+
+def test_view_copy_on_write():
+    payload = make_payload()
+    original = copy.deepcopy(payload)
+    tree = easytree.view(payload)
+    tree.user.friends[0].name = "Celine D."
+    tree.user.friends.append({"name": "Alice"})
+    tree.address.city = "London"
+    assert payload == original
+
+    data = tree.unwrap()
+    assert data["user"]["friends"][0]["name"] == "Celine D."
+    assert data["user"]["friends"][2] == {"name": "Alice"}
+    assert data["address"] == {"city": "London"}
+    # untouched subtrees are shared
+    assert data["settings"] is payload["settings"]
+    assert data["user"]["friends"][1] is payload["user"]["friends"][1]
+
+
+def test_view_detached_child():
+    payload = make_payload()
+    tree = easytree.view(payload)
+    settings = tree.settings
+    tree.settings = {"theme": "light"}
+    settings.theme = "blue"  # no longer attached to the tree
+    assert tree.settings.theme == "light"
+    assert payload["settings"]["theme"] == "dark"
+
+
+def test_view_frozen():
+    payload = make_payload()
+    tree = easytree.view(payload, frozen=True)
+    with pytest.raises(AttributeError):
+        tree.user.name = "Celine"
+    with pytest.raises(AttributeError):
+        tree.address
+    with pytest.raises(KeyError):
+        tree["user"]["address"]
+    with pytest.raises(TypeError):
+        tree.user.friends.append({})
+
+
+def test_view_sealed():
+    payload = make_payload()
+    tree = easytree.view(payload, sealed=True)
+    tree.user.name = "Celine"
+    with pytest.raises(AttributeError):
+        tree.user.age = 31
+    with pytest.raises(KeyError):
+        del tree["user"]
+    assert payload["user"]["name"] == "David"
+
+
+def test_view_materialize():
+    payload = make_payload()
+    tree = easytree.view(payload).materialize()
+    assert isinstance(tree, easytree.dict)
+    assert isinstance(tree.user.friends[0], easytree.dict)
+    assert tree == payload
+
+
+def test_view_invalid():
+    with pytest.raises(TypeError):
+        easytree.view("string")
+
+
+def make_layers():
+    return (
+        {"database": {"host": "override"}, "debug": True},
+        easytree.dict({"database": {"port": 5433, "pool": {"size": 4}}, "env": "dev"}),
+        {"database": {"port": 5432, "name": "app"}, "debug": False, "tags": ["a"]},
+    )
+
+
+def test_overlay_reads():
+    layers = make_layers()
+    settings = easytree.overlay(*layers)
+    assert isinstance(settings, easytree.views.OverlayView)
+    assert settings.database.host == "override"
+    assert settings.database.port == 5433
+    assert settings["database"]["name"] == "app"
+    assert settings.database.pool.size == 4
+    assert settings.debug is True
+    assert settings.tags == ["a"]
+    assert isinstance(settings.missing, easytree.undefined)
+    assert isinstance(settings.database.missing.key, easytree.undefined)
+    assert settings.get(["database", "pool", "size"]) == 4
+    assert settings.get(["database", "missing", "size"], "N/A") == "N/A"
+    assert settings.get("missing", 1) == 1
+    assert list(settings) == ["database", "debug", "env", "tags"]
+    assert len(settings) == 4
+    assert "env" in settings and "missing" not in settings
+    assert set(settings.database) == {"host", "port", "pool", "name"}
+
+
+def test_overlay_shadowing():
+    # a value which is not a dict hides the dicts of the following layers
+    settings = easytree.overlay({"a": {"b": 1}}, {"a": None}, {"a": {"c": 2}})
+    assert settings.a == {"b": 1}
+    assert isinstance(settings.a.c, easytree.undefined)
+    assert easytree.overlay({"a": 1}, {"a": {"c": 2}}).a == 1
+
+
+def test_overlay_read_through():
+    layers = make_layers()
+    settings = easytree.overlay(*layers)
+    layers[2]["database"]["user"] = "admin"
+    assert settings.database.user == "admin"
+
+
+def test_overlay_is_read_only():
+    layers = make_layers()
+    settings = easytree.overlay(*layers)
+    with pytest.raises(AttributeError):
+        settings.debug = False
+    with pytest.raises(KeyError):
+        settings["debug"] = False
+    with pytest.raises(KeyError):
+        del settings["debug"]
+    with pytest.raises(KeyError):
+        settings.database.missing.key = 1
+    with pytest.raises(TypeError):
+        easytree.overlay({}, [1])
+
+
+def test_overlay_materialize():
+    layers = make_layers()
+    settings = easytree.overlay(*layers)
+    tree = settings.materialize(frozen=True)
+    assert isinstance(tree, easytree.dict)
+    assert easytree.frozen(tree) and easytree.frozen(tree.database.pool)
+    assert tree == {
+        "database": {
+            "host": "override",
+            "port": 5433,
+            "pool": {"size": 4},
+            "name": "app",
+        },
+        "debug": True,
+        "env": "dev",
+        "tags": ["a"],
+    }
+    assert settings == tree
+    assert tree.tags is not layers[2]["tags"]
+    assert settings.materialize().database.pool is not layers[1].database.pool